@@ -111,7 +111,7 @@ async def refresh_schedule():
     logger.info("Cache refresh requested")
 
     # Clear Google Sheets cache
-    google_sheets_service.clear_cache()
+    await google_sheets_service.clear_cache()
 
     # Clear OneDrive cache if available
     if hasattr(onedrive_service, 'clear_cache'):
@@ -145,7 +145,7 @@ async def get_schedule(
     # Clear cache if refresh requested
     if refresh:
         logger.info("Refresh requested - clearing cache")
-        google_sheets_service.clear_cache()
+        await google_sheets_service.clear_cache()
 
     # Primary: Try Google Sheets
     if google_sheets_service.is_available():
@@ -153,7 +153,7 @@ async def get_schedule(
             logger.info("Fetching schedule from Google Sheets")
 
             # Get deliveries from all required weekly tabs for each truck
-            truck1_rows, truck2_rows = google_sheets_service.get_all_truck_deliveries()
+            truck1_rows, truck2_rows = await google_sheets_service.get_all_truck_deliveries()
 
             # Build the schedule using the schedule builder
             schedule = schedule_builder.build_schedule(
@@ -34,6 +34,15 @@ class Settings(BaseSettings):
 
     # Cache Configuration
     graph_cache_ttl_seconds: int = 300  # 5 minutes
+    graph_cache_max_entries: int = 64  # LRU bound on cached worksheets/trucks
+    graph_error_ttl_seconds: int = 5  # How long a failed Graph fetch is cached
+
+    # Redis URL for sharing the sheet cache across workers (optional)
+    redis_url: str = ""
+
+    # Keep the schedule cache warm in the background. With Redis configured
+    # only one worker per refresh interval does the warming.
+    cache_warmer_enabled: bool = True
 
     # Feature Flags
     use_mock_data_fallback: bool = True
@@ -1,9 +1,30 @@
 """FastAPI application entry point for GLC Dashboard API."""
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
 from app.api.v1.routes import health, schedule, sales, turf_manager
+from app.services.google_sheets_service import google_sheets_service
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the schedule cache in the background for the app's lifetime."""
+    warm_task = None
+    if settings.cache_warmer_enabled and google_sheets_service.is_available():
+        warm_task = asyncio.create_task(google_sheets_service.keep_cache_warm())
+
+    yield
+
+    if warm_task is not None:
+        warm_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await warm_task
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -11,7 +32,8 @@ app = FastAPI(
     description="API for The Great Lawn Co. TV Delivery Dashboard",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -1,6 +1,6 @@
 """Token manager for Microsoft Graph API authentication using MSAL."""
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
 from msal import ConfidentialClientApplication
 
@@ -12,6 +12,9 @@ logger = logging.getLogger(__name__)
 # Microsoft Graph API scope for client credentials flow
 GRAPH_SCOPE = ["https://graph.microsoft.com/.default"]
 
+# Assumed token lifetime when Azure AD does not report expires_in
+DEFAULT_TOKEN_LIFETIME_SECONDS = 3600
+
 
 class TokenManager:
     """Manages OAuth2 access tokens for Microsoft Graph API.
@@ -63,6 +66,18 @@ class TokenManager:
         Returns:
             str: The access token for Graph API calls.
 
+        Raises:
+            GraphAuthenticationError: If token acquisition fails.
+        """
+        token, _ = self.get_access_token_with_expiry()
+        return token
+
+    def get_access_token_with_expiry(self) -> Tuple[str, int]:
+        """Acquire an access token along with its remaining lifetime.
+
+        Returns:
+            Tuple of (access token, seconds until the token expires).
+
         Raises:
             GraphAuthenticationError: If token acquisition fails.
         """
@@ -77,7 +92,7 @@ class TokenManager:
 
         if result and "access_token" in result:
             logger.debug("Using cached access token")
-            return result["access_token"]
+            return result["access_token"], int(result.get("expires_in", DEFAULT_TOKEN_LIFETIME_SECONDS))
 
         # No cached token, acquire a new one
         logger.info("Acquiring new access token from Azure AD")
@@ -85,7 +100,7 @@ class TokenManager:
 
         if "access_token" in result:
             logger.info("Successfully acquired new access token")
-            return result["access_token"]
+            return result["access_token"], int(result.get("expires_in", DEFAULT_TOKEN_LIFETIME_SECONDS))
 
         # Token acquisition failed
         error = result.get("error", "unknown_error")
@@ -0,0 +1,4 @@
+"""Shared cache backends used by the data services."""
+from app.services.cache.redis_cache import RedisCache, get_redis_cache
+
+__all__ = ["RedisCache", "get_redis_cache"]
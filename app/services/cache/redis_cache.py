@@ -0,0 +1,103 @@
+"""Redis cache adapter for sharing cached sheet data across workers."""
+import logging
+from typing import Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCache:
+    """Thin adapter over a Redis client storing raw byte payloads with a TTL.
+
+    Redis errors are logged and treated as cache misses so that an unavailable
+    Redis never takes the dashboard down - callers simply fall back to their
+    local cache or the upstream API.
+    """
+
+    def __init__(self, url: str):
+        """Create the Redis client (the `redis` package is imported lazily)."""
+        import redis
+
+        self._redis_error = redis.RedisError
+        self._client = redis.Redis.from_url(
+            url,
+            socket_timeout=1.0,
+            socket_connect_timeout=1.0,
+        )
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get the payload stored under key, or None on a miss or error."""
+        try:
+            return self._client.get(key)
+        except self._redis_error as e:
+            logger.warning(f"Redis GET failed for {key}: {e}")
+            return None
+
+    def setex(self, key: str, ttl_seconds: int, value: bytes) -> None:
+        """Store a payload under key with a TTL in seconds."""
+        try:
+            self._client.setex(key, ttl_seconds, value)
+        except self._redis_error as e:
+            logger.warning(f"Redis SETEX failed for {key}: {e}")
+
+    def set_if_absent(self, key: str, ttl_seconds: int, value: bytes) -> bool:
+        """Store a payload only if key doesn't exist; True if it was stored."""
+        try:
+            return bool(self._client.set(key, value, ex=ttl_seconds, nx=True))
+        except self._redis_error as e:
+            logger.warning(f"Redis SET NX failed for {key}: {e}")
+            return False
+
+    def incr(self, key: str) -> None:
+        """Increment the integer counter stored under key."""
+        try:
+            self._client.incr(key)
+        except self._redis_error as e:
+            logger.warning(f"Redis INCR failed for {key}: {e}")
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Delete every key starting with prefix."""
+        try:
+            keys = list(self._client.scan_iter(match=f"{prefix}*"))
+            if keys:
+                self._client.delete(*keys)
+        except self._redis_error as e:
+            logger.warning(f"Redis DELETE failed for prefix {prefix}: {e}")
+
+
+_redis_cache: Optional[RedisCache] = None
+
+# Set when Redis could not be set up, so the failure is logged only once
+_redis_disabled = False
+
+
+def get_redis_cache() -> Optional[RedisCache]:
+    """Get the shared Redis cache, or None if Redis is not configured.
+
+    Returns:
+        RedisCache instance when REDIS_URL is set, valid and the `redis`
+        package is installed, otherwise None (callers use their local cache).
+    """
+    global _redis_cache, _redis_disabled
+
+    if not settings.redis_url or _redis_disabled:
+        return None
+
+    if _redis_cache is None:
+        try:
+            import redis
+        except ImportError:
+            logger.warning("REDIS_URL is set but the 'redis' package is not installed")
+            _redis_disabled = True
+            return None
+
+        try:
+            _redis_cache = RedisCache(settings.redis_url)
+            logger.info("Redis cache initialized")
+        except (ValueError, redis.RedisError) as e:
+            logger.error(f"Could not set up Redis from REDIS_URL, using the local cache only: {e}")
+            _redis_disabled = True
+            return None
+
+    return _redis_cache
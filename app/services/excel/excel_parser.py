@@ -2,7 +2,7 @@
 import logging
 from dataclasses import dataclass, field
 from datetime import date, timedelta
-from typing import Any, List, Optional
+from typing import Any, AsyncIterable, AsyncIterator, List, Optional
 
 from app.models.schedule import Delivery
 
@@ -53,9 +53,9 @@ DAY_TO_WEEKDAY = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExcelDeliveryRow:
-    """Represents a parsed delivery row from Excel."""
+    """Represents a parsed delivery row from Excel (slotted to keep per-row memory small)."""
 
     day: str                    # "Monday", "Tuesday", etc.
     slot: int                   # 1-6
@@ -188,6 +188,60 @@ class ExcelParser:
         # Check if all cells are empty or whitespace
         return all(cell is None or str(cell).strip() == "" for cell in row)
 
+    @classmethod
+    def _parse_row(cls, row: List[Any], row_index: int) -> Optional[ExcelDeliveryRow]:
+        """Parse a single worksheet row.
+
+        Returns:
+            The parsed ExcelDeliveryRow, or None if the row is not a delivery.
+        """
+        # Skip empty rows
+        if cls._is_empty_row(row):
+            return None
+
+        # Skip if it looks like a header or summary row
+        if cls._is_header_or_summary_row(row):
+            return None
+
+        try:
+            # Extract values with safe defaults
+            day = cls._safe_str(row[0] if len(row) > 0 else None)
+            slot = cls._safe_int(row[1] if len(row) > 1 else None)
+            variety = cls._safe_str(row[2] if len(row) > 2 else None)
+            suburb = cls._safe_str(row[3] if len(row) > 3 else None)
+            service_type = cls._safe_str(row[4] if len(row) > 4 else None).upper()
+            sqm_sold = cls._safe_float(row[5] if len(row) > 5 else None)
+            pallets = cls._safe_float(row[6] if len(row) > 6 else None)
+
+            # Skip rows without essential data (must have SQM > 0 to be a valid delivery)
+            if sqm_sold <= 0:
+                logger.debug(f"Skipping row {row_index}: SQM is 0 or invalid")
+                return None
+            if not variety and not suburb:
+                logger.debug(f"Skipping row {row_index}: missing variety and suburb")
+                return None
+
+            # Validate service type
+            if service_type and not cls._is_valid_service_type(service_type):
+                logger.warning(f"Row {row_index}: Invalid service type '{service_type}', defaulting to 'SD'")
+                service_type = "SD"
+            elif not service_type:
+                service_type = "SD"
+
+            return ExcelDeliveryRow(
+                day=day,
+                slot=slot,
+                variety=variety,
+                suburb=suburb,
+                service_type=service_type,
+                sqm_sold=sqm_sold,
+                pallets=pallets,
+            )
+
+        except Exception as e:
+            logger.error(f"Error parsing row {row_index}: {e}")
+            return None
+
     @classmethod
     def parse_rows(cls, values: List[List[Any]], skip_header: bool = True) -> List[ExcelDeliveryRow]:
         """Parse worksheet values into ExcelDeliveryRow objects.
@@ -207,57 +261,48 @@ class ExcelParser:
         start_index = 1 if skip_header else 0
 
         for row_index, row in enumerate(values[start_index:], start=start_index):
-            # Skip empty rows
-            if cls._is_empty_row(row):
-                continue
-
-            # Skip if it looks like a header or summary row
-            if cls._is_header_or_summary_row(row):
-                continue
-
-            try:
-                # Extract values with safe defaults
-                day = cls._safe_str(row[0] if len(row) > 0 else None)
-                slot = cls._safe_int(row[1] if len(row) > 1 else None)
-                variety = cls._safe_str(row[2] if len(row) > 2 else None)
-                suburb = cls._safe_str(row[3] if len(row) > 3 else None)
-                service_type = cls._safe_str(row[4] if len(row) > 4 else None).upper()
-                sqm_sold = cls._safe_float(row[5] if len(row) > 5 else None)
-                pallets = cls._safe_float(row[6] if len(row) > 6 else None)
-
-                # Skip rows without essential data (must have SQM > 0 to be a valid delivery)
-                if sqm_sold <= 0:
-                    logger.debug(f"Skipping row {row_index}: SQM is 0 or invalid")
-                    continue
-                if not variety and not suburb:
-                    logger.debug(f"Skipping row {row_index}: missing variety and suburb")
-                    continue
-
-                # Validate service type
-                if service_type and not cls._is_valid_service_type(service_type):
-                    logger.warning(f"Row {row_index}: Invalid service type '{service_type}', defaulting to 'SD'")
-                    service_type = "SD"
-                elif not service_type:
-                    service_type = "SD"
-
-                delivery_row = ExcelDeliveryRow(
-                    day=day,
-                    slot=slot,
-                    variety=variety,
-                    suburb=suburb,
-                    service_type=service_type,
-                    sqm_sold=sqm_sold,
-                    pallets=pallets,
-                )
+            delivery_row = cls._parse_row(row, row_index)
+            if delivery_row is not None:
                 parsed_rows.append(delivery_row)
 
-            except Exception as e:
-                logger.error(f"Error parsing row {row_index}: {e}")
-                continue
-
         logger.info(f"Parsed {len(parsed_rows)} delivery rows from {len(values)} total rows")
         return parsed_rows
 
+    @classmethod
+    async def parse_rows_stream(
+        cls,
+        row_batches: AsyncIterable[List[List[Any]]],
+        skip_header: bool = True,
+    ) -> AsyncIterator[ExcelDeliveryRow]:
+        """Parse worksheet rows as they arrive in batches.
+
+        Each batch is parsed and released before the next is pulled, so the
+        raw values for the whole sheet are never held at once.
+
+        Args:
+            row_batches: Async iterable of row batches (e.g. GraphClient.iter_worksheet_data).
+            skip_header: Whether to skip the first row of the first batch (header).
+
+        Yields:
+            Parsed ExcelDeliveryRow objects, in sheet order.
+        """
+        row_index = 0
+        parsed_count = 0
+
+        async for batch in row_batches:
+            for row in batch:
+                if skip_header and row_index == 0:
+                    row_index += 1
+                    continue
+
+                delivery_row = cls._parse_row(row, row_index)
+                row_index += 1
+                if delivery_row is not None:
+                    parsed_count += 1
+                    yield delivery_row
+
+        logger.info(f"Parsed {parsed_count} delivery rows from {row_index} total rows")
+
     @classmethod
     def group_by_day(cls, rows: List[ExcelDeliveryRow]) -> dict[str, List[ExcelDeliveryRow]]:
         """Group parsed rows by day name.
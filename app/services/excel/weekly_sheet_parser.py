@@ -1,7 +1,8 @@
 """Parser for the new weekly sheet structure with truck sections."""
 import logging
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.services.excel.excel_parser import ExcelDeliveryRow
 
@@ -202,7 +203,11 @@ class WeeklySheetParser:
         return "slot_first"
 
     @classmethod
-    def parse_weekly_sheet(cls, values: List[List[Any]]) -> Dict[str, List[ExcelDeliveryRow]]:
+    def parse_weekly_sheet(
+        cls,
+        values: List[List[Any]],
+        week_start_date: Optional[date] = None,
+    ) -> Dict[str, List[ExcelDeliveryRow]]:
         """Parse a weekly sheet into deliveries grouped by truck.
 
         Automatically detects and handles both column structures:
@@ -211,6 +216,7 @@ class WeeklySheetParser:
 
         Args:
             values: 2D array of cell values from Google Sheets API.
+            week_start_date: Monday of the sheet's week, stamped on every row.
 
         Returns:
             Dictionary with keys "Truck 1" and "Truck 2", each containing
@@ -229,12 +235,16 @@ class WeeklySheetParser:
         structure = cls._detect_structure(values)
 
         if structure == "day_first":
-            return cls._parse_day_first_structure(values)
+            return cls._parse_day_first_structure(values, week_start_date)
         else:
-            return cls._parse_slot_first_structure(values)
+            return cls._parse_slot_first_structure(values, week_start_date)
 
     @classmethod
-    def _parse_slot_first_structure(cls, values: List[List[Any]]) -> Dict[str, List[ExcelDeliveryRow]]:
+    def _parse_slot_first_structure(
+        cls,
+        values: List[List[Any]],
+        week_start_date: Optional[date] = None,
+    ) -> Dict[str, List[ExcelDeliveryRow]]:
         """Parse sheet with Slot-first column structure (original).
 
         Column mapping: A=Slot, B=Variety, C=Suburb, D=Service Type, E=SQM, F=Pallets
@@ -313,6 +323,7 @@ class WeeklySheetParser:
                         delivery_fee=delivery_fee,
                         laying_fee=laying_fee,
                         payment_status=payment_status,
+                        week_start_date=week_start_date,
                     )
                     result[current_truck].append(delivery)
 
@@ -324,7 +335,11 @@ class WeeklySheetParser:
         return result
 
     @classmethod
-    def _parse_day_first_structure(cls, values: List[List[Any]]) -> Dict[str, List[ExcelDeliveryRow]]:
+    def _parse_day_first_structure(
+        cls,
+        values: List[List[Any]],
+        week_start_date: Optional[date] = None,
+    ) -> Dict[str, List[ExcelDeliveryRow]]:
         """Parse sheet with Day-first column structure (new).
 
         Column mapping: A=Day, B=Variety, C=Suburb, D=Service Type, E=SQM, F=Pallets
@@ -403,6 +418,7 @@ class WeeklySheetParser:
                         delivery_fee=delivery_fee,
                         laying_fee=laying_fee,
                         payment_status=payment_status,
+                        week_start_date=week_start_date,
                     )
                     result[current_truck].append(delivery)
 
@@ -1,9 +1,12 @@
 """Google Sheets API client for fetching worksheet data."""
 import json
 import logging
+import threading
 from typing import Any, List, Optional
 
+import httplib2
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
@@ -30,13 +33,28 @@ class GoogleSheetsClient:
         """Initialize the client (lazy initialization)."""
         self._service = None
         self._credentials = None
+        self._local = threading.local()
 
     def reset_service(self):
         """Reset the cached service and credentials, forcing re-authentication on next use."""
         self._service = None
         self._credentials = None
+        self._local = threading.local()
         logger.info("Google Sheets service reset")
 
+    def _get_http(self) -> AuthorizedHttp:
+        """Get an authorized HTTP transport for the calling thread.
+
+        httplib2 connections are not thread-safe, so reads dispatched to
+        worker threads (e.g. via asyncio.to_thread) each use their own.
+        """
+        http = getattr(self._local, "http", None)
+        if http is None:
+            self._ensure_service()
+            http = AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
+
     def _ensure_service(self):
         """Lazy initialization of Sheets service.
 
@@ -112,7 +130,7 @@ class GoogleSheetsClient:
                 service.spreadsheets()
                 .values()
                 .get(spreadsheetId=spreadsheet_id, range=range_name)
-                .execute()
+                .execute(http=self._get_http())
             )
 
             values = result.get("values", [])
@@ -156,7 +174,11 @@ class GoogleSheetsClient:
             raise GoogleSheetsAPIError("Google Spreadsheet ID not configured")
 
         try:
-            metadata = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+            metadata = (
+                service.spreadsheets()
+                .get(spreadsheetId=spreadsheet_id)
+                .execute(http=self._get_http())
+            )
 
             sheets = metadata.get("sheets", [])
             sheet_names = [sheet["properties"]["title"] for sheet in sheets]
@@ -1,11 +1,15 @@
 """Google Sheets service for fetching delivery data from weekly sheets."""
+import asyncio
 import logging
+import pickle
 import re
-from datetime import datetime, timezone, date, timedelta
+import time
+from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional, Tuple
 
 from app.config import settings
 from app.core.constants import get_australia_today
+from app.services.cache import RedisCache, get_redis_cache
 from app.services.google.sheets_client import GoogleSheetsClient
 from app.services.google.exceptions import (
     GoogleSheetsError,
@@ -17,12 +21,29 @@ from app.services.excel.weekly_sheet_parser import WeeklySheetParser
 
 logger = logging.getLogger(__name__)
 
+# Prefix for weekly sheet cache keys (shared with Redis across workers)
+CACHE_KEY_PREFIX = "gsheets:weekly:"
 
-def parse_sheet_name_to_date(sheet_name: str) -> Optional[date]:
+# How long before the cache TTL the background warmer refreshes the sheets
+CACHE_REFRESH_MARGIN_SECONDS = 30
+
+# How long a worker keeps its own copy of a sheet when Redis holds the shared one
+LOCAL_CACHE_TTL_WITH_REDIS_SECONDS = 5
+
+# Shared counter bumped by every clear, so workers can drop fetches that raced it
+CACHE_GENERATION_KEY = "gsheets:generation"
+
+# Redis lock naming the worker that warms the cache this interval
+CACHE_WARMER_LOCK_KEY = "gsheets:warmer"
+
+
+def parse_sheet_name_to_date(sheet_name: str, today: Optional[date] = None) -> Optional[date]:
     """Parse a sheet name like 'Dec-29' into a date (the Monday of that week).
 
     Args:
         sheet_name: Sheet name in format 'Mon-DD' (e.g., 'Dec-29', 'Jan-05')
+        today: Reference date for the year boundary (defaults to today in Australia).
+            Pass it in when parsing several sheet names in a row.
 
     Returns:
         The date corresponding to the sheet name, or None if parsing fails.
@@ -32,7 +53,7 @@ def parse_sheet_name_to_date(sheet_name: str) -> Optional[date]:
         parsed = datetime.strptime(sheet_name, '%b-%d')
 
         # Determine the year - use current year, but handle year boundary
-        today = get_australia_today()
+        today = today or get_australia_today()
         year = today.year
 
         # If the parsed month is January and we're in December, it's next year
@@ -53,13 +74,12 @@ class CacheEntry:
 
     def __init__(self, data: any, ttl_seconds: int):
         self.data = data
-        self.created_at = datetime.now(timezone.utc)
+        self.created_at = time.monotonic()
         self.ttl_seconds = ttl_seconds
 
     def is_expired(self) -> bool:
-        """Check if the cache entry has expired."""
-        elapsed = (datetime.now(timezone.utc) - self.created_at).total_seconds()
-        return elapsed >= self.ttl_seconds
+        """Check if the cache entry has expired (monotonic clock, immune to wall-clock changes)."""
+        return (time.monotonic() - self.created_at) >= self.ttl_seconds
 
 
 def get_week_sheet_name(target_date: date) -> str:
@@ -147,18 +167,23 @@ def get_required_week_sheets(start_date: date, num_business_days: int = 10) -> L
     Returns:
         List of unique sheet names (e.g., ["Dec-29", "Jan-05"])
     """
-    sheets_needed = set()
-    current = start_date
-    days_counted = 0
+    if num_business_days <= 0:
+        return []
+
+    # Skip a weekend start forward to the following Monday
+    weekday = start_date.weekday()
+    if weekday >= 5:
+        start_date += timedelta(days=7 - weekday)
+        weekday = 0
 
-    while days_counted < num_business_days:
-        if current.weekday() < 5:  # Monday-Friday
-            sheet_name = get_week_sheet_name(current)
-            sheets_needed.add(sheet_name)
-            days_counted += 1
-        current += timedelta(days=1)
+    # Business days from the first Monday up to the last day needed, 5 per week
+    first_monday = start_date - timedelta(days=weekday)
+    num_weeks = (weekday + num_business_days + 4) // 5
 
-    return sorted(list(sheets_needed))
+    return sorted(
+        (first_monday + timedelta(weeks=week)).strftime('%b-%d')
+        for week in range(num_weeks)
+    )
 
 
 class GoogleSheetsService:
@@ -180,6 +205,7 @@ class GoogleSheetsService:
             cls._instance = super().__new__(cls)
             cls._instance._client = None
             cls._instance._initialized = False
+            cls._instance._generation = 0
         return cls._instance
 
     def __init__(self):
@@ -196,10 +222,10 @@ class GoogleSheetsService:
 
     def _get_cache_key(self, sheet_name: str) -> str:
         """Generate a cache key for a sheet."""
-        return f"gsheets:weekly:{sheet_name}"
+        return f"{CACHE_KEY_PREFIX}{sheet_name}:{settings.google_spreadsheet_id}"
 
-    def _get_from_cache(self, key: str) -> Optional[any]:
-        """Get data from cache if not expired."""
+    def _get_local(self, key: str) -> Optional[any]:
+        """Get data from this worker's in-process cache if not expired."""
         entry = self._cache.get(key)
         if entry and not entry.is_expired():
             logger.debug(f"Cache hit for {key}")
@@ -209,17 +235,81 @@ class GoogleSheetsService:
             del self._cache[key]
         return None
 
-    def _set_cache(self, key: str, data: any) -> None:
-        """Store data in cache with TTL."""
-        self._cache[key] = CacheEntry(
-            data=data,
-            ttl_seconds=settings.graph_cache_ttl_seconds,
-        )
-        logger.debug(f"Cached data for {key} with TTL {settings.graph_cache_ttl_seconds}s")
+    @staticmethod
+    def _read_redis(redis_cache: RedisCache, key: str) -> Optional[any]:
+        """Read and unpickle a payload from Redis (blocking - run in a thread)."""
+        payload = redis_cache.get(key)
+        return pickle.loads(payload) if payload is not None else None
+
+    @staticmethod
+    def _write_redis(redis_cache: RedisCache, key: str, data: any, ttl_seconds: int) -> None:
+        """Pickle and store a payload in Redis (blocking - run in a thread)."""
+        redis_cache.setex(key, ttl_seconds, pickle.dumps(data))
+
+    async def _get_from_cache(self, key: str) -> Optional[any]:
+        """Get data from cache if not expired.
+
+        Checks the in-process cache first, then the shared Redis cache (when
+        configured). With Redis, local copies only live for
+        LOCAL_CACHE_TTL_WITH_REDIS_SECONDS so a clear made by another worker
+        is picked up within a few seconds.
+        """
+        cached = self._get_local(key)
+        if cached is not None:
+            return cached
+
+        redis_cache = get_redis_cache()
+        if redis_cache is None:
+            return None
+
+        cached = await asyncio.to_thread(self._read_redis, redis_cache, key)
+        if cached is not None:
+            logger.debug(f"Redis cache hit for {key}")
+            self._cache[key] = CacheEntry(data=cached, ttl_seconds=LOCAL_CACHE_TTL_WITH_REDIS_SECONDS)
+        return cached
 
-    def clear_cache(self) -> None:
-        """Clear all cached data."""
+    async def _set_cache(self, key: str, data: any) -> None:
+        """Store data in cache with TTL."""
+        ttl_seconds = settings.graph_cache_ttl_seconds
+        redis_cache = get_redis_cache()
+
+        local_ttl = ttl_seconds
+        if redis_cache is not None:
+            local_ttl = min(ttl_seconds, LOCAL_CACHE_TTL_WITH_REDIS_SECONDS)
+        self._cache[key] = CacheEntry(data=data, ttl_seconds=local_ttl)
+
+        if redis_cache is not None:
+            await asyncio.to_thread(self._write_redis, redis_cache, key, data, ttl_seconds)
+
+        logger.debug(f"Cached data for {key} with TTL {ttl_seconds}s")
+
+    @staticmethod
+    def _clear_redis(redis_cache: RedisCache) -> None:
+        """Bump the shared generation and drop the weekly keys (blocking - run in a thread)."""
+        redis_cache.incr(CACHE_GENERATION_KEY)
+        redis_cache.delete_prefix(CACHE_KEY_PREFIX)
+
+    async def _cache_generation(self) -> Tuple[int, Optional[bytes]]:
+        """Get the cache generation, bumped by every clear in this or another worker."""
+        shared = None
+        redis_cache = get_redis_cache()
+        if redis_cache is not None:
+            shared = await asyncio.to_thread(redis_cache.get, CACHE_GENERATION_KEY)
+        return self._generation, shared
+
+    async def clear_cache(self) -> None:
+        """Clear all cached data (local and shared).
+
+        Also bumps the cache generation so that fetches already in flight
+        don't write their now-stale results back into the cache.
+        """
+        self._generation += 1
         self._cache.clear()
+
+        redis_cache = get_redis_cache()
+        if redis_cache is not None:
+            await asyncio.to_thread(self._clear_redis, redis_cache)
+
         logger.info("Google Sheets service cache cleared")
 
     def get_available_sheets(self) -> List[str]:
@@ -227,14 +317,26 @@ class GoogleSheetsService:
         client = self._ensure_client()
         return client.get_available_sheets()
 
-    def get_weekly_sheet_data(self, sheet_name: str) -> Dict[str, List[ExcelDeliveryRow]]:
+    async def get_weekly_sheet_data(
+        self,
+        sheet_name: str,
+        today: Optional[date] = None,
+        refresh: bool = False,
+    ) -> Dict[str, List[ExcelDeliveryRow]]:
         """Fetch and parse a weekly sheet.
 
+        The blocking Sheets API call and the parse both run in worker
+        threads so several sheets can be fetched concurrently without
+        stalling the event loop.
+
         Args:
             sheet_name: Name of the weekly sheet (e.g., "Dec-28").
+            today: Reference date used to resolve the sheet's week start.
+            refresh: Skip the cache lookup and always fetch fresh data.
 
         Returns:
-            Dictionary with "Truck 1" and "Truck 2" keys containing delivery lists.
+            Dictionary with "Truck 1" and "Truck 2" keys containing delivery lists,
+            each row stamped with the sheet's week_start_date.
 
         Raises:
             GoogleSheetsNotFoundError: If sheet doesn't exist.
@@ -243,34 +345,64 @@ class GoogleSheetsService:
         cache_key = self._get_cache_key(sheet_name)
 
         # Check cache first
-        cached = self._get_from_cache(cache_key)
-        if cached is not None:
-            return cached
+        if not refresh:
+            cached = await self._get_from_cache(cache_key)
+            if cached is not None:
+                return cached
 
         # Fetch from Google Sheets
         logger.info(f"Fetching weekly sheet data for '{sheet_name}'")
         client = self._ensure_client()
+        generation = await self._cache_generation()
 
         try:
-            values = client.get_worksheet_data(sheet_name)
+            values = await asyncio.to_thread(client.get_worksheet_data, sheet_name)
         except GoogleSheetsNotFoundError:
             logger.warning(f"Weekly sheet '{sheet_name}' not found, trying MASTER")
             # Fall back to MASTER sheet if specific week not found
-            values = client.get_worksheet_data("MASTER")
+            values = await asyncio.to_thread(client.get_worksheet_data, "MASTER")
 
-        # Parse with the weekly sheet parser
-        parsed_data = WeeklySheetParser.parse_weekly_sheet(values)
+        # Parse sheet name to get week start date
+        week_start = parse_sheet_name_to_date(sheet_name, today)
+        if week_start:
+            logger.info(f"Sheet '{sheet_name}' -> week_start_date: {week_start}")
 
-        # Cache the result
-        self._set_cache(cache_key, parsed_data)
+        # Parse with the weekly sheet parser (CPU-bound, keep it off the event loop)
+        parsed_data = await asyncio.to_thread(
+            WeeklySheetParser.parse_weekly_sheet, values, week_start
+        )
+
+        # Cache the result, unless the cache was cleared while we were fetching
+        if await self._cache_generation() == generation:
+            await self._set_cache(cache_key, parsed_data)
+        else:
+            logger.info(f"Cache cleared while fetching '{sheet_name}', not caching stale data")
 
         return parsed_data
 
-    def get_all_truck_deliveries(self) -> Tuple[List[ExcelDeliveryRow], List[ExcelDeliveryRow]]:
+    async def _read_sheet(
+        self, sheet_name: str, today: date, refresh: bool = False
+    ) -> Optional[Dict[str, List[ExcelDeliveryRow]]]:
+        """Read one weekly sheet, logging and swallowing per-sheet errors."""
+        try:
+            return await self.get_weekly_sheet_data(sheet_name, today, refresh)
+        except GoogleSheetsNotFoundError as e:
+            logger.warning(f"Sheet '{sheet_name}' not found: {e}")
+        except GoogleSheetsError as e:
+            logger.error(f"Error reading sheet '{sheet_name}': {e}")
+        return None
+
+    async def get_all_truck_deliveries(
+        self, refresh: bool = False
+    ) -> Tuple[List[ExcelDeliveryRow], List[ExcelDeliveryRow]]:
         """Get deliveries for both trucks from the current week's sheet.
 
         Determines which weekly sheet(s) to read based on today's date,
-        then parses the truck-based sections.
+        then fetches them concurrently so parsing of one sheet overlaps
+        with the network fetch of the others.
+
+        Args:
+            refresh: Bypass the cache and re-fetch every required sheet.
 
         Returns:
             Tuple of (truck1_deliveries, truck2_deliveries).
@@ -283,16 +415,13 @@ class GoogleSheetsService:
 
         # Get available sheets to find best matches
         try:
-            available_sheets = self.get_available_sheets()
+            available_sheets = await asyncio.to_thread(self.get_available_sheets)
         except GoogleSheetsError as e:
             logger.error(f"Failed to get available sheets: {e}")
             available_sheets = []
 
-        # Collect all deliveries
-        all_truck1: List[ExcelDeliveryRow] = []
-        all_truck2: List[ExcelDeliveryRow] = []
-        sheets_read: set = set()
-
+        # Resolve the sheets to read, avoiding reading the same sheet twice
+        sheets_to_read: List[str] = []
         for sheet_name in required_sheets:
             # Find the best matching sheet from available sheets
             actual_sheet = find_best_matching_sheet(sheet_name, available_sheets)
@@ -304,38 +433,67 @@ class GoogleSheetsService:
             if actual_sheet != sheet_name:
                 logger.info(f"Mapped '{sheet_name}' -> '{actual_sheet}'")
 
-            # Avoid reading the same sheet multiple times
-            if actual_sheet in sheets_read:
-                continue
-            sheets_read.add(actual_sheet)
-
-            try:
-                sheet_data = self.get_weekly_sheet_data(actual_sheet)
+            if actual_sheet not in sheets_to_read:
+                sheets_to_read.append(actual_sheet)
 
-                # Parse sheet name to get week start date
-                week_start = parse_sheet_name_to_date(actual_sheet)
-                if week_start:
-                    logger.info(f"Sheet '{actual_sheet}' -> week_start_date: {week_start}")
-
-                # Set week_start_date on each delivery
-                for delivery in sheet_data.get("Truck 1", []):
-                    delivery.week_start_date = week_start
-                    all_truck1.append(delivery)
+        results = await asyncio.gather(
+            *(self._read_sheet(sheet_name, today, refresh) for sheet_name in sheets_to_read)
+        )
 
-                for delivery in sheet_data.get("Truck 2", []):
-                    delivery.week_start_date = week_start
-                    all_truck2.append(delivery)
+        # Collect all deliveries (in sheet order)
+        all_truck1: List[ExcelDeliveryRow] = []
+        all_truck2: List[ExcelDeliveryRow] = []
 
-            except GoogleSheetsNotFoundError as e:
-                logger.warning(f"Sheet '{actual_sheet}' not found: {e}")
-                continue
-            except GoogleSheetsError as e:
-                logger.error(f"Error reading sheet '{actual_sheet}': {e}")
+        for sheet_data in results:
+            if sheet_data is None:
                 continue
+            all_truck1.extend(sheet_data.get("Truck 1", []))
+            all_truck2.extend(sheet_data.get("Truck 2", []))
 
         logger.info(f"Total: {len(all_truck1)} Truck 1 and {len(all_truck2)} Truck 2 deliveries")
         return all_truck1, all_truck2
 
+    async def prefetch_current_week(self) -> None:
+        """Fetch the sheets for the current schedule window into the cache.
+
+        Errors are logged rather than raised so a failed warm-up never
+        takes down the caller.
+        """
+        try:
+            truck1, truck2 = await self.get_all_truck_deliveries(refresh=True)
+            logger.info(f"Prefetched {len(truck1) + len(truck2)} deliveries into cache")
+        except Exception as e:
+            logger.error(f"Failed to prefetch weekly sheets: {e}")
+
+    async def _claim_warmer_turn(self, interval: int) -> bool:
+        """Check whether this worker should warm the cache this interval.
+
+        Without Redis every worker has its own cache and warms it. With
+        Redis the first worker to take the lock warms the shared cache and
+        the others skip until the lock expires.
+        """
+        redis_cache = get_redis_cache()
+        if redis_cache is None:
+            return True
+        return await asyncio.to_thread(
+            redis_cache.set_if_absent, CACHE_WARMER_LOCK_KEY, interval, b"1"
+        )
+
+    async def keep_cache_warm(self) -> None:
+        """Re-fetch the current week's sheets just before the cache expires.
+
+        Runs until cancelled; intended to be started as a background task
+        at application startup (see CACHE_WARMER_ENABLED).
+        """
+        interval = max(
+            settings.graph_cache_ttl_seconds - CACHE_REFRESH_MARGIN_SECONDS,
+            CACHE_REFRESH_MARGIN_SECONDS,
+        )
+        while True:
+            if await self._claim_warmer_turn(interval):
+                await self.prefetch_current_week()
+            await asyncio.sleep(interval)
+
     def get_worksheet_deliveries(self, worksheet_name: str) -> List[ExcelDeliveryRow]:
         """Legacy method for backwards compatibility - reads from Truck 1/Truck 2 sheets.
 
@@ -1,12 +1,19 @@
 """Microsoft Graph API client for OneDrive/Excel operations."""
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import random
+import re
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import quote
 
 import httpx
+import orjson
 
 from app.config import settings
 from app.services.auth.token_manager import TokenManager
 from app.services.graph.exceptions import (
+    GraphAPIError,
     GraphAuthenticationError,
     GraphPermissionError,
     GraphResourceNotFoundError,
@@ -18,6 +25,30 @@ logger = logging.getLogger(__name__)
 
 GRAPH_BASE_URL = "https://graph.microsoft.com/v1.0"
 
+# Retry policy for rate-limit (429) and server (5xx) errors
+MAX_RETRY_ATTEMPTS = 5
+RETRY_INITIAL_DELAY_SECONDS = 1.0
+RETRY_MAX_DELAY_SECONDS = 30.0
+# Maximum number of retries allowed in flight at once, so a burst of
+# failures does not turn into a retry storm that triggers more 429s
+MAX_CONCURRENT_RETRIES = 2
+
+# Refresh cached auth headers this many seconds before the token expires
+TOKEN_REFRESH_MARGIN_SECONDS = 60
+
+# Connection pool for the shared HTTP client; keep-alive connections let
+# repeated Graph calls skip the TCP/TLS handshake
+DEFAULT_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
+# Maximum sub-requests Graph accepts in a single $batch call
+MAX_BATCH_REQUESTS = 20
+
+# Rows fetched per request when streaming a worksheet in chunks
+WORKSHEET_CHUNK_ROWS = 1000
+
+# Matches the cell range of an address like "'Truck 1'!A1:J240" (or "Sheet!A1")
+RANGE_ADDRESS_PATTERN = re.compile(r"!\$?([A-Z]+)\$?(\d+)(?::\$?([A-Z]+)\$?(\d+))?$")
+
 
 class GraphClient:
     """Async HTTP client for Microsoft Graph API operations.
@@ -26,17 +57,34 @@ class GraphClient:
     for Graph API calls to OneDrive/Excel resources.
     """
 
-    def __init__(self):
-        """Initialize the Graph client with token manager."""
+    def __init__(self, pool_limits: Optional[httpx.Limits] = None):
+        """Initialize the Graph client with token manager.
+
+        Args:
+            pool_limits: Connection pool limits for the underlying HTTP client
+                (defaults to DEFAULT_POOL_LIMITS).
+        """
         self._token_manager = TokenManager()
+        self._pool_limits = pool_limits or DEFAULT_POOL_LIMITS
         self._http_client: Optional[httpx.AsyncClient] = None
+        self._retry_semaphore = asyncio.Semaphore(MAX_CONCURRENT_RETRIES)
+        self._cached_headers: Optional[Dict[str, str]] = None
+        self._headers_expire_at: float = 0.0
+        # Row count of each worksheet's used range as last seen, to decide
+        # whether the next read of it is worth streaming in chunks
+        self._used_range_rows: Dict[str, int] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the async HTTP client."""
+        """Get or create the async HTTP client.
+
+        One pooled client is reused for the lifetime of this GraphClient so
+        connections stay alive between calls.
+        """
         if self._http_client is None or self._http_client.is_closed:
             self._http_client = httpx.AsyncClient(
                 base_url=GRAPH_BASE_URL,
                 timeout=30.0,
+                limits=self._pool_limits,
             )
         return self._http_client
 
@@ -47,12 +95,21 @@ class GraphClient:
             self._http_client = None
 
     def _get_headers(self) -> Dict[str, str]:
-        """Get request headers with authorization token."""
-        token = self._token_manager.get_access_token()
-        return {
+        """Get request headers with authorization token.
+
+        Headers are cached until shortly before the token expires, so
+        batches of Graph calls only hit the token manager once.
+        """
+        if self._cached_headers is not None and time.monotonic() < self._headers_expire_at:
+            return self._cached_headers
+
+        token, expires_in = self._token_manager.get_access_token_with_expiry()
+        self._cached_headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
         }
+        self._headers_expire_at = time.monotonic() + expires_in - TOKEN_REFRESH_MARGIN_SECONDS
+        return self._cached_headers
 
     def _handle_error_response(self, response: httpx.Response, resource: str = None) -> None:
         """Handle error responses from Graph API.
@@ -117,6 +174,107 @@ class GraphClient:
                 details=details,
             )
 
+    @staticmethod
+    def _get_retry_delay(error: GraphAPIError, attempt: int) -> float:
+        """Get the delay before the next retry attempt.
+
+        Rate-limit errors wait exactly the Retry-After duration; other errors
+        use exponential backoff with jitter.
+        """
+        if isinstance(error, GraphRateLimitError) and error.retry_after:
+            return float(error.retry_after)
+        delay = RETRY_INITIAL_DELAY_SECONDS * (2 ** (attempt - 1))
+        delay += random.uniform(0, RETRY_INITIAL_DELAY_SECONDS)
+        return min(delay, RETRY_MAX_DELAY_SECONDS)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        resource: str,
+        json_body: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """Send a single request, raising Graph errors for failed responses."""
+        client = await self._get_client()
+
+        try:
+            response = await client.request(
+                method,
+                endpoint,
+                headers=self._get_headers(),
+                json=json_body,
+            )
+        except httpx.RequestError as e:
+            logger.error(f"HTTP request failed: {e}")
+            raise GraphServiceError(
+                message=f"Failed to connect to Microsoft Graph: {e}",
+                details={"error": str(e)},
+            )
+
+        if response.status_code != 200:
+            if response.status_code == 401:
+                # Token was rejected - force a fresh token on the next request
+                self._cached_headers = None
+            self._handle_error_response(response, resource=resource)
+
+        return response
+
+    async def _send_get(self, endpoint: str, resource: str) -> httpx.Response:
+        """Send a single GET request, raising Graph errors for failed responses."""
+        return await self._send("GET", endpoint, resource)
+
+    async def _with_retry(
+        self,
+        send: Callable[[], Awaitable[Any]],
+        resource: str,
+    ) -> Any:
+        """Run a request, retrying rate-limit and server errors.
+
+        Args:
+            send: Zero-argument coroutine factory that performs one attempt.
+            resource: Resource name for error context.
+
+        Returns:
+            The result of the first successful attempt.
+
+        Raises:
+            GraphAPIError: If the request fails or retries are exhausted.
+        """
+        # Backoff before the next attempt, set from each failure
+        delay = 0.0
+        for attempt in range(1, MAX_RETRY_ATTEMPTS + 1):
+            try:
+                if attempt == 1:
+                    return await send()
+
+                async with self._retry_semaphore:
+                    await asyncio.sleep(delay)
+                    return await send()
+
+            except (GraphRateLimitError, GraphServiceError) as e:
+                if attempt == MAX_RETRY_ATTEMPTS:
+                    raise
+                delay = self._get_retry_delay(e, attempt)
+                logger.warning(
+                    f"Graph request for {resource} failed ({e.status_code}), "
+                    f"retrying in {delay:.1f}s (attempt {attempt}/{MAX_RETRY_ATTEMPTS})"
+                )
+
+    async def _get_with_retry(self, endpoint: str, resource: str) -> httpx.Response:
+        """Send a GET request, retrying rate-limit and server errors.
+
+        Args:
+            endpoint: Graph API endpoint relative to the base URL.
+            resource: Resource name for error context.
+
+        Returns:
+            The successful HTTP response.
+
+        Raises:
+            GraphAPIError: If the request fails or retries are exhausted.
+        """
+        return await self._with_retry(lambda: self._send_get(endpoint, resource), resource)
+
     async def get_worksheet_data(self, worksheet_name: str) -> List[List[Any]]:
         """Fetch worksheet data using the usedRange endpoint.
 
@@ -140,29 +298,155 @@ class GraphClient:
 
         logger.info(f"Fetching worksheet data: {worksheet_name}")
 
-        client = await self._get_client()
+        response = await self._get_with_retry(endpoint, resource=f"worksheet:{worksheet_name}")
 
-        try:
-            response = await client.get(
-                endpoint,
-                headers=self._get_headers(),
+        data = orjson.loads(response.content)
+        values = data.get("values", [])
+        self._remember_used_range(worksheet_name, data, values)
+
+        logger.info(f"Retrieved {len(values)} rows from worksheet '{worksheet_name}'")
+
+        return values
+
+    def _remember_used_range(self, worksheet_name: str, data: Dict[str, Any], values: List[List[Any]]) -> None:
+        """Record how many rows a worksheet's used range had."""
+        row_count = data.get("rowCount")
+        self._used_range_rows[worksheet_name] = row_count if isinstance(row_count, int) else len(values)
+
+    async def iter_worksheet_data(
+        self,
+        worksheet_name: str,
+        chunk_rows: int = WORKSHEET_CHUNK_ROWS,
+    ) -> AsyncIterator[List[List[Any]]]:
+        """Stream worksheet data in row chunks.
+
+        A worksheet that fit in one chunk when last read (or has not been
+        read yet) is fetched with a single usedRange request, exactly as
+        get_worksheet_data does. Larger ones have their used range's
+        address looked up first and are then fetched chunk_rows rows at a
+        time, so callers can parse each batch without holding the whole
+        sheet's raw values in memory. Both paths read the same usedRange,
+        so the table's origin does not depend on which one ran.
+
+        Args:
+            worksheet_name: Name of the worksheet (e.g., "Truck 1", "Truck 2").
+            chunk_rows: Maximum number of rows per request.
+
+        Yields:
+            Lists of rows, where each row is a list of cell values.
+
+        Raises:
+            GraphAPIError: If an API call fails.
+        """
+        known_rows = self._used_range_rows.get(worksheet_name)
+        if known_rows is None or known_rows <= chunk_rows:
+            yield await self.get_worksheet_data(worksheet_name)
+            return
+
+        drive_id = settings.onedrive_drive_id
+        item_id = settings.onedrive_item_id
+        worksheet_endpoint = f"/drives/{drive_id}/items/{item_id}/workbook/worksheets/{worksheet_name}"
+        resource = f"worksheet:{worksheet_name}"
+
+        logger.info(f"Streaming worksheet data: {worksheet_name}")
+
+        response = await self._get_with_retry(
+            f"{worksheet_endpoint}/usedRange?$select=address",
+            resource=resource,
+        )
+        address = orjson.loads(response.content).get("address", "")
+
+        match = RANGE_ADDRESS_PATTERN.search(address)
+        if not match:
+            logger.warning(f"Could not parse used range address '{address}' for '{worksheet_name}'")
+            return
+
+        first_col, first_row, last_col, last_row = match.groups()
+        first_row = int(first_row)
+        last_col = last_col or first_col
+        last_row = int(last_row) if last_row else first_row
+        self._used_range_rows[worksheet_name] = last_row - first_row + 1
+
+        total_rows = 0
+        for start in range(first_row, last_row + 1, chunk_rows):
+            end = min(start + chunk_rows - 1, last_row)
+            response = await self._get_with_retry(
+                f"{worksheet_endpoint}/range(address='{first_col}{start}:{last_col}{end}')?$select=values",
+                resource=resource,
             )
-        except httpx.RequestError as e:
-            logger.error(f"HTTP request failed: {e}")
-            raise GraphServiceError(
-                message=f"Failed to connect to Microsoft Graph: {e}",
-                details={"error": str(e)},
+            values = orjson.loads(response.content).get("values", [])
+            total_rows += len(values)
+            yield values
+
+        logger.info(f"Streamed {total_rows} rows from worksheet '{worksheet_name}'")
+
+    async def _send_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        resource: str,
+    ) -> Dict[str, Any]:
+        """POST one $batch request and return sub-response bodies by id.
+
+        A failed sub-request raises the same error it would have raised on
+        its own, so rate-limit and server errors retry the whole batch.
+        """
+        response = await self._send("POST", "/$batch", resource, json_body={"requests": requests})
+        sub_responses = orjson.loads(response.content).get("responses", [])
+
+        bodies: Dict[str, Any] = {}
+        for sub_response in sub_responses:
+            status = sub_response.get("status", 500)
+            body = sub_response.get("body") or {}
+            if status != 200:
+                self._handle_error_response(
+                    httpx.Response(status, json=body, headers=sub_response.get("headers") or {}),
+                    resource=resource,
+                )
+            bodies[sub_response["id"]] = body
+        return bodies
+
+    async def batch_get_worksheet_data(self, worksheet_names: List[str]) -> Dict[str, List[List[Any]]]:
+        """Fetch several worksheets' used ranges in a single $batch round trip.
+
+        Args:
+            worksheet_names: Worksheet names to fetch (at most MAX_BATCH_REQUESTS).
+
+        Returns:
+            Mapping of worksheet name to its list of rows.
+
+        Raises:
+            ValueError: If more worksheets are requested than a batch allows.
+            GraphAPIError: If the batch or any sub-request fails.
+        """
+        if len(worksheet_names) > MAX_BATCH_REQUESTS:
+            raise ValueError(
+                f"Cannot batch {len(worksheet_names)} worksheets; the limit is {MAX_BATCH_REQUESTS}"
             )
 
-        if response.status_code != 200:
-            self._handle_error_response(response, resource=f"worksheet:{worksheet_name}")
+        drive_id = settings.onedrive_drive_id
+        item_id = settings.onedrive_item_id
 
-        data = response.json()
-        values = data.get("values", [])
+        requests = [
+            {
+                "id": str(index),
+                "method": "GET",
+                "url": f"/drives/{drive_id}/items/{item_id}/workbook/worksheets/{quote(name)}/usedRange",
+            }
+            for index, name in enumerate(worksheet_names)
+        ]
+        resource = f"worksheets:{','.join(worksheet_names)}"
 
-        logger.info(f"Retrieved {len(values)} rows from worksheet '{worksheet_name}'")
+        logger.info(f"Batch fetching worksheet data: {worksheet_names}")
 
-        return values
+        bodies = await self._with_retry(lambda: self._send_batch(requests, resource), resource)
+
+        result: Dict[str, List[List[Any]]] = {}
+        for index, name in enumerate(worksheet_names):
+            body = bodies.get(str(index), {})
+            values = result[name] = body.get("values", [])
+            self._remember_used_range(name, body, values)
+            logger.info(f"Retrieved {len(values)} rows from worksheet '{name}'")
+        return result
 
     async def get_workbook_info(self) -> Dict[str, Any]:
         """Get information about the workbook (for debugging/validation).
@@ -175,20 +459,6 @@ class GraphClient:
 
         endpoint = f"/drives/{drive_id}/items/{item_id}/workbook/worksheets"
 
-        client = await self._get_client()
-
-        try:
-            response = await client.get(
-                endpoint,
-                headers=self._get_headers(),
-            )
-        except httpx.RequestError as e:
-            raise GraphServiceError(
-                message=f"Failed to connect to Microsoft Graph: {e}",
-                details={"error": str(e)},
-            )
-
-        if response.status_code != 200:
-            self._handle_error_response(response, resource="workbook:worksheets")
+        response = await self._get_with_retry(endpoint, resource="workbook:worksheets")
 
-        return response.json()
+        return orjson.loads(response.content)
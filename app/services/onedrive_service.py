@@ -1,33 +1,49 @@
 """OneDrive service facade for fetching and caching Excel data."""
+import asyncio
 import logging
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 
 from app.config import settings
+from app.core.constants import TRUCK_CAPACITIES
 from app.models.schedule import Delivery, TruckData
-from app.services.graph.graph_client import GraphClient
+from app.services.graph.graph_client import DEFAULT_POOL_LIMITS, GraphClient
 from app.services.excel.excel_parser import ExcelParser, ExcelDeliveryRow
 from app.services.graph.exceptions import GraphAPIError
 
 logger = logging.getLogger(__name__)
 
-# Truck capacities in SQM
-TRUCK1_CAPACITY = 500
-TRUCK2_CAPACITY = 600
+# Sweep expired cache entries after this many cache writes
+CACHE_SWEEP_INTERVAL = 32
+
+
+class _CachedError:
+    """Marker for a cached Graph failure (negative cache entry)."""
+
+    __slots__ = ("error",)
+
+    error: GraphAPIError
+
+    def __init__(self, error: GraphAPIError) -> None:
+        self.error = error
 
 
 class CacheEntry:
     """Simple cache entry with TTL support."""
 
-    def __init__(self, data: any, ttl_seconds: int):
+    __slots__ = ("data", "expires_at")
+
+    data: Any
+    expires_at: float
+
+    def __init__(self, data: Any, ttl_seconds: int) -> None:
         self.data = data
-        self.created_at = datetime.now(timezone.utc)
-        self.ttl_seconds = ttl_seconds
+        self.expires_at = time.monotonic() + ttl_seconds
 
     def is_expired(self) -> bool:
-        """Check if the cache entry has expired."""
-        elapsed = (datetime.now(timezone.utc) - self.created_at).total_seconds()
-        return elapsed >= self.ttl_seconds
+        """Check if the cache entry has expired (monotonic clock, immune to wall-clock changes)."""
+        return time.monotonic() >= self.expires_at
 
 
 class OneDriveService:
@@ -37,27 +53,27 @@ class OneDriveService:
     into a unified interface with caching support.
     """
 
-    _instance: Optional["OneDriveService"] = None
-    _cache: Dict[str, CacheEntry] = {}
-
-    def __new__(cls) -> "OneDriveService":
-        """Singleton pattern for service reuse."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._graph_client = None
-            cls._instance._initialized = False
-        return cls._instance
+    def __init__(self) -> None:
+        """Initialize the OneDrive service (lazy - Graph client created on first use).
 
-    def __init__(self):
-        """Initialize the OneDrive service (lazy - Graph client created on first use)."""
-        pass
+        Use the module-level ``onedrive_service`` instance so the cache and
+        Graph connection pool are shared across the app.
+        """
+        self._graph_client: Optional[GraphClient] = None
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Task[List[ExcelDeliveryRow]]"] = {}
+        self._sets_since_sweep: int = 0
 
     def _ensure_client(self) -> GraphClient:
-        """Lazy initialization of Graph client."""
+        """Lazy initialization of Graph client.
+
+        The client is created once and held for the service's lifetime so
+        every Graph call shares its keep-alive connection pool.
+        """
         if self._graph_client is None:
             if not settings.has_azure_credentials:
                 raise GraphAPIError("Azure credentials not configured")
-            self._graph_client = GraphClient()
+            self._graph_client = GraphClient(pool_limits=DEFAULT_POOL_LIMITS)
         return self._graph_client
 
     async def close(self) -> None:
@@ -69,24 +85,52 @@ class OneDriveService:
         """Generate a cache key for a worksheet."""
         return f"worksheet:{worksheet}"
 
-    def _get_from_cache(self, key: str) -> Optional[any]:
-        """Get data from cache if not expired."""
+    def _get_cache_key_truck(self, truck_number: int) -> str:
+        """Generate a cache key for computed truck data."""
+        return f"truck:{truck_number}"
+
+    def _get_from_cache(self, key: str) -> Optional[Any]:
+        """Get data from cache if not expired, marking it most recently used.
+
+        Raises:
+            GraphAPIError: If a recent fetch for this key failed and the
+                failure is still cached.
+        """
         entry = self._cache.get(key)
         if entry and not entry.is_expired():
             logger.debug(f"Cache hit for {key}")
+            self._cache.move_to_end(key)
+            if isinstance(entry.data, _CachedError):
+                raise entry.data.error
             return entry.data
         if entry:
             logger.debug(f"Cache expired for {key}")
             del self._cache[key]
         return None
 
-    def _set_cache(self, key: str, data: any) -> None:
-        """Store data in cache with TTL."""
-        self._cache[key] = CacheEntry(
-            data=data,
-            ttl_seconds=settings.graph_cache_ttl_seconds,
-        )
-        logger.debug(f"Cached data for {key} with TTL {settings.graph_cache_ttl_seconds}s")
+    def _set_cache(self, key: str, data: Any, ttl_seconds: Optional[int] = None) -> None:
+        """Store data in cache with TTL, evicting least recently used entries."""
+        if ttl_seconds is None:
+            ttl_seconds = settings.graph_cache_ttl_seconds
+        self._cache[key] = CacheEntry(data=data, ttl_seconds=ttl_seconds)
+        self._cache.move_to_end(key)
+        while len(self._cache) > settings.graph_cache_max_entries:
+            evicted_key, _ = self._cache.popitem(last=False)
+            logger.debug(f"Evicted least recently used cache entry {evicted_key}")
+        logger.debug(f"Cached data for {key} with TTL {ttl_seconds}s")
+
+        self._sets_since_sweep += 1
+        if self._sets_since_sweep >= CACHE_SWEEP_INTERVAL:
+            self._sweep_expired()
+
+    def _sweep_expired(self) -> None:
+        """Drop expired entries that are never looked up again."""
+        self._sets_since_sweep = 0
+        expired: List[str] = [key for key, entry in self._cache.items() if entry.is_expired()]
+        for key in expired:
+            del self._cache[key]
+        if expired:
+            logger.debug(f"Swept {len(expired)} expired cache entries")
 
     def clear_cache(self) -> None:
         """Clear all cached data."""
@@ -96,6 +140,10 @@ class OneDriveService:
     async def get_worksheet_deliveries(self, worksheet_name: str) -> List[ExcelDeliveryRow]:
         """Fetch and parse deliveries from a worksheet.
 
+        Concurrent callers for the same worksheet share a single in-flight
+        fetch rather than each hitting the Graph API. Graph failures are
+        cached briefly so an outage isn't amplified by repeated retries.
+
         Args:
             worksheet_name: Name of the worksheet (e.g., "Truck 1").
 
@@ -112,56 +160,109 @@ class OneDriveService:
         if cached is not None:
             return cached
 
-        # Fetch from Graph API
-        logger.info(f"Fetching worksheet data for '{worksheet_name}'")
-        client = self._ensure_client()
-        values = await client.get_worksheet_data(worksheet_name)
-
-        # Parse the data
-        parsed_rows = ExcelParser.parse_rows(values)
+        # Join a fetch that is already in flight for this worksheet
+        task = self._inflight.get(cache_key)
+        if task is not None:
+            logger.debug(f"Awaiting in-flight fetch for {cache_key}")
+        else:
+            task = self._start_fetch(cache_key, self._fetch_worksheet_deliveries(worksheet_name, cache_key))
+
+        # Shielded so a caller that is cancelled stops waiting without
+        # cancelling the fetch for everyone else coalesced on it
+        return await asyncio.shield(task)
+
+    def _start_fetch(
+        self,
+        cache_key: str,
+        fetch: Awaitable[List[ExcelDeliveryRow]],
+    ) -> "asyncio.Task[List[ExcelDeliveryRow]]":
+        """Run a worksheet fetch as a task registered as in flight for cache_key."""
+        task = asyncio.ensure_future(fetch)
+        self._inflight[cache_key] = task
+
+        def done(finished: "asyncio.Task[List[ExcelDeliveryRow]]") -> None:
+            if self._inflight.get(cache_key) is finished:
+                del self._inflight[cache_key]
+            # Mark a failure retrieved in case every waiter was cancelled
+            if not finished.cancelled():
+                finished.exception()
+
+        task.add_done_callback(done)
+        return task
+
+    async def _fetch_worksheet_deliveries(self, worksheet_name: str, cache_key: str) -> List[ExcelDeliveryRow]:
+        """Stream a worksheet from Graph and cache the parsed rows (or the failure)."""
+        try:
+            # Stream from Graph API, parsing each chunk of rows as it arrives
+            logger.info(f"Fetching worksheet data for '{worksheet_name}'")
+            client = self._ensure_client()
+            parsed_rows: List[ExcelDeliveryRow] = [
+                row
+                async for row in ExcelParser.parse_rows_stream(
+                    client.iter_worksheet_data(worksheet_name)
+                )
+            ]
+        except GraphAPIError as e:
+            self._set_cache(cache_key, _CachedError(e), settings.graph_error_ttl_seconds)
+            raise
 
         # Cache the result
         self._set_cache(cache_key, parsed_rows)
-
         return parsed_rows
 
     async def get_truck_data(self, truck_number: int) -> TruckData:
         """Get truck data with deliveries and totals.
 
+        The computed TruckData is cached alongside the parsed rows so repeat
+        calls skip the conversion and summing as well as the fetch.
+
         Args:
-            truck_number: 1 or 2 for Truck 1 or Truck 2.
+            truck_number: Truck number, a key of TRUCK_CAPACITIES (1 or 2).
 
         Returns:
             TruckData with deliveries and calculated totals.
 
         Raises:
             GraphAPIError: If fetching data fails.
-            ValueError: If truck_number is not 1 or 2.
+            ValueError: If truck_number is not a known truck.
         """
-        if truck_number not in (1, 2):
-            raise ValueError(f"Invalid truck number: {truck_number}. Must be 1 or 2.")
+        try:
+            capacity = TRUCK_CAPACITIES[truck_number]
+        except KeyError:
+            valid = ", ".join(str(number) for number in TRUCK_CAPACITIES)
+            raise ValueError(f"Invalid truck number: {truck_number}. Must be one of {valid}.")
+
+        cache_key = self._get_cache_key_truck(truck_number)
+        cached = self._get_from_cache(cache_key)
+        if cached is not None:
+            return cached
 
         worksheet_name = f"Truck {truck_number}"
-        capacity = TRUCK1_CAPACITY if truck_number == 1 else TRUCK2_CAPACITY
 
         try:
             parsed_rows = await self.get_worksheet_deliveries(worksheet_name)
 
-            # Convert to Delivery models
-            deliveries = [row.to_delivery() for row in parsed_rows]
+            # Convert to Delivery models and accumulate totals in one pass
+            deliveries: List[Delivery] = []
+            sqm_total = 0.0
+            pallet_total = 0.0
+            for row in parsed_rows:
+                delivery = row.to_delivery()
+                deliveries.append(delivery)
+                sqm_total += delivery.sqm
+                pallet_total += delivery.pallets
 
-            # Calculate totals
-            sqm_total = sum(d.sqm for d in deliveries)
-            pallet_total = sum(d.pallets for d in deliveries)
             available_sqm = max(0, capacity - sqm_total)
 
-            return TruckData(
+            truck_data = TruckData(
                 deliveries=deliveries,
                 sqm_total=sqm_total,
                 pallet_total=pallet_total,
                 capacity=capacity,
                 available_sqm=available_sqm,
             )
+            self._set_cache(cache_key, truck_data)
+            return truck_data
 
         except GraphAPIError:
             raise
@@ -172,16 +273,82 @@ class OneDriveService:
     async def get_both_trucks(self) -> Tuple[TruckData, TruckData]:
         """Get data for both trucks.
 
+        When neither truck is cached, both worksheets are fetched in a
+        single Graph $batch round trip; otherwise only the missing one is
+        fetched. Cached TruckData is returned without any request.
+
         Returns:
             Tuple of (truck1_data, truck2_data).
 
         Raises:
             GraphAPIError: If fetching data fails.
         """
-        truck1 = await self.get_truck_data(1)
-        truck2 = await self.get_truck_data(2)
+        # Create the client up front so all fetches share one connection pool
+        client = self._ensure_client()
+
+        missing = [
+            f"Truck {truck_number}"
+            for truck_number in (1, 2)
+            if self._needs_fetch(truck_number)
+        ]
+        if len(missing) > 1:
+            # Register each worksheet as in flight so concurrent single-truck
+            # requests join the batch instead of fetching again
+            batch = asyncio.ensure_future(self._fetch_worksheets_batch(client, missing))
+            for worksheet_name in missing:
+                cache_key = self._get_cache_key(worksheet_name)
+                self._start_fetch(cache_key, self._take_from_batch(batch, worksheet_name, cache_key))
+
+        truck1, truck2 = await asyncio.gather(
+            self.get_truck_data(1),
+            self.get_truck_data(2),
+        )
         return truck1, truck2
 
+    def _needs_fetch(self, truck_number: int) -> bool:
+        """Check whether neither the truck nor its worksheet is cached or being fetched.
+
+        Cached failures count as cached, so they are re-raised rather than
+        retried inside a batch.
+        """
+        worksheet_key = self._get_cache_key(f"Truck {truck_number}")
+        if worksheet_key in self._inflight:
+            return False
+        for key in (self._get_cache_key_truck(truck_number), worksheet_key):
+            entry = self._cache.get(key)
+            if entry and not entry.is_expired():
+                return False
+        return True
+
+    @staticmethod
+    async def _fetch_worksheets_batch(
+        client: GraphClient,
+        worksheet_names: List[str],
+    ) -> Dict[str, List[ExcelDeliveryRow]]:
+        """Fetch several worksheets in one Graph $batch and parse each."""
+        values_by_worksheet = await client.batch_get_worksheet_data(worksheet_names)
+        return {
+            worksheet_name: ExcelParser.parse_rows(values)
+            for worksheet_name, values in values_by_worksheet.items()
+        }
+
+    async def _take_from_batch(
+        self,
+        batch: "asyncio.Future[Dict[str, List[ExcelDeliveryRow]]]",
+        worksheet_name: str,
+        cache_key: str,
+    ) -> List[ExcelDeliveryRow]:
+        """Cache one worksheet's share of a batch fetch (or the batch's failure)."""
+        try:
+            parsed_by_worksheet = await asyncio.shield(batch)
+        except GraphAPIError as e:
+            self._set_cache(cache_key, _CachedError(e), settings.graph_error_ttl_seconds)
+            raise
+
+        parsed_rows = parsed_by_worksheet.get(worksheet_name, [])
+        self._set_cache(cache_key, parsed_rows)
+        return parsed_rows
+
     def is_available(self) -> bool:
         """Check if the OneDrive service is available.
 
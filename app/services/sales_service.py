@@ -8,16 +8,167 @@ This service:
 4. Updates individual cells
 """
 
+import asyncio
+import functools
 import logging
+import os
 import re
-from datetime import date, timedelta
-from typing import Dict, List, Optional, Any
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Any, Tuple
 
+from googleapiclient.errors import HttpError
+
+from app.core.constants import get_australia_today
 from app.services.google.sheets_client import GoogleSheetsClient
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Single-cell edits arriving within this window are written in one batchUpdate
+WRITE_FLUSH_WINDOW_SECONDS = 0.05
+
+# Week tab list is re-read from the spreadsheet metadata at most this often
+AVAILABLE_WEEKS_TTL_SECONDS = 60
+
+# Week tab titles look like "Jan-05"
+_WEEK_RE = re.compile(r'^[A-Z][a-z]{2}-\d{2}$')
+
+# Aggregated weekly stats are recomputed from the sheet at most this often
+WEEKLY_STATS_TTL_SECONDS = 60
+# Weeks that have already ended rarely change, so their stats are kept longer
+PAST_WEEK_STATS_TTL_SECONDS = 3600
+
+_MONTH_ABBR_TO_NUM = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4,
+    "May": 5, "Jun": 6, "Jul": 7, "Aug": 8,
+    "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
+}
+
+_DAY_ABBRS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTH_ABBRS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# Column positions within a week tab row (0-indexed, A-R)
+COL_SLOT = 0
+COL_LEAD_NAME = 1
+COL_LEAD_SOURCE = 2
+COL_APPOINTMENT_SET = 3
+COL_APPOINTMENT_CONFIRMED = 4
+COL_APPOINTMENT_ATTENDED = 5
+COL_JOB_SOLD = 6
+COL_REASON = 7
+COL_CONVERSION = 8
+COL_SELL_PRICE = 9
+COL_APPOINTMENT_TIME = 10
+COL_PROJECT_TYPE = 11
+COL_SUBURB = 12
+COL_REGION = 13
+COL_APPOINTMENT_SET_WHO = 14
+COL_APPOINTMENT_CONFIRMED_BY = 15
+COL_GROSS_PROFIT_MARGIN_PCT = 16
+COL_PAID_UNPAID = 17
+ROW_WIDTH = 18
+# Stats only read up to the sell price column (J)
+STATS_ROW_WIDTH = COL_SELL_PRICE + 1
+
+# Count fields shared by the totals and per-rep stats, in response order
+_COUNT_KEYS = ("appointments_set", "appointments_confirmed", "in_homes_attended", "jobs_sold")
+
+# Removes currency symbols, thousands separators, spaces and tabs in one pass
+_CURRENCY_STRIP = str.maketrans("", "", "$, \t")
+
+# Canonical spellings of "Yes" and checkbox "TRUE" that skip the strip/lower fallback
+_TRUTHY = frozenset({"Yes", "yes", "YES", "TRUE", "True", "true"})
+
+# Monday of the first week tab the dashboard tracks; earlier tabs are ignored
+FIRST_WEEK_DATE = date(2026, 1, 5)
+
+# Rows 1-169 hold every Mon-Sat slot of a week tab (ILAN's last Saturday
+# slot is row 169); stats only read columns A-J
+WEEK_STATS_RANGE = "A1:J169"
+
+
+def _pad_row(row: List, width: int = ROW_WIDTH) -> List[str]:
+    """Stringify a sheet row's cells and pad or trim it to exactly width cells."""
+    cells = [str(val) if val is not None else "" for val in row[:width]]
+    cells.extend([""] * (width - len(cells)))
+    return cells
+
+
+def _week_tab_date(week_tab: str) -> Optional[date]:
+    """Get the Monday a week tab (e.g. "Jan-05") refers to, or None if it isn't one."""
+    try:
+        # Parse tab name (e.g., "Jan-05")
+        month_str, day_str = week_tab.split("-")
+        month = _MONTH_ABBR_TO_NUM.get(month_str, 1)
+        day = int(day_str)
+
+        # Determine year (2026 for Jan onwards, 2025 for Dec)
+        year = 2026 if month >= 1 else 2025
+        if month == 12:  # December tabs are from 2025
+            year = 2025
+
+        return date(year, month, day)
+    except (ValueError, KeyError):
+        # Invalid tab name
+        return None
+
+
+def _conversion_rate(sold: int, attended: int) -> float:
+    """Percentage of attended appointments that sold, to one decimal place."""
+    if attended > 0:
+        return round((sold / attended) * 100, 1)
+    return 0.0
+
+
+def _ordinal_suffix(n: int) -> str:
+    """Get ordinal suffix for a number."""
+    if 11 <= n <= 13:
+        return 'th'
+    return {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+
+
+@functools.lru_cache(maxsize=512)
+def _week_tab_for(target_date: date) -> str:
+    """Week tab name ("Mon-DD" of that week's Monday) for a date."""
+    monday_of_week = target_date - timedelta(days=target_date.weekday())
+    return monday_of_week.strftime("%b-%d")
+
+
+@functools.lru_cache(maxsize=512)
+def _display_date_for(target_date: date) -> str:
+    """Format date as 'Thu 2nd Jan'."""
+    day_num = target_date.day
+    return (
+        f"{_DAY_ABBRS[target_date.weekday()]} {day_num}{_ordinal_suffix(day_num)} "
+        f"{_MONTH_ABBRS[target_date.month - 1]}"
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _week_display_for(week_tab: str, current_year: int, current_month: int) -> str:
+    """Format week tab as 'Jan 5 - Jan 9, 2026', guessing the year from the current month."""
+    try:
+        # Parse the week tab (e.g., "Jan-05")
+        month_str, day_str = week_tab.split("-")
+        month = _MONTH_ABBR_TO_NUM.get(month_str, 1)
+        day = int(day_str)
+
+        year = current_year
+        if month < current_month - 6:
+            year += 1
+
+        monday = date(year, month, day)
+        friday = monday + timedelta(days=4)
+
+        if monday.month == friday.month:
+            return f"{month_str} {monday.day} - {friday.day}, {year}"
+        else:
+            return f"{month_str} {monday.day} - {_MONTH_ABBRS[friday.month - 1]} {friday.day}, {year}"
+    except Exception:
+        return week_tab
+
 
 class SalesService:
     """Service for sales appointment data operations."""
@@ -63,24 +214,24 @@ class SalesService:
 
     # Column mapping (0-indexed for API)
     COLUMNS = {
-        "slot": 0,           # A
-        "lead_name": 1,      # B
-        "lead_source": 2,    # C
-        "appointment_set": 3,     # D
-        "appointment_confirmed": 4,  # E
-        "appointment_attended": 5,   # F
-        "job_sold": 6,       # G
-        "reason": 7,         # H
-        "conversion": 8,     # I
-        "sell_price": 9,     # J - Sold Price ex GST
-        "appointment_time": 10,  # K - Appointment Time
-        "project_type": 11,      # L - Project Type
-        "suburb": 12,            # M - Suburb
-        "region": 13,            # N - Region
-        "appointment_set_who": 14,      # O - Appointment Set Who
-        "appointment_confirmed_by": 15,  # P - Appointment Confirmed By
-        "gross_profit_margin_pct": 16,   # Q - Gross Profit Margin %
-        "paid_unpaid": 17                # R - Paid/Unpaid
+        "slot": COL_SLOT,                                            # A
+        "lead_name": COL_LEAD_NAME,                                  # B
+        "lead_source": COL_LEAD_SOURCE,                              # C
+        "appointment_set": COL_APPOINTMENT_SET,                      # D
+        "appointment_confirmed": COL_APPOINTMENT_CONFIRMED,          # E
+        "appointment_attended": COL_APPOINTMENT_ATTENDED,            # F
+        "job_sold": COL_JOB_SOLD,                                    # G
+        "reason": COL_REASON,                                        # H
+        "conversion": COL_CONVERSION,                                # I
+        "sell_price": COL_SELL_PRICE,                                # J - Sold Price ex GST
+        "appointment_time": COL_APPOINTMENT_TIME,                    # K - Appointment Time
+        "project_type": COL_PROJECT_TYPE,                            # L - Project Type
+        "suburb": COL_SUBURB,                                        # M - Suburb
+        "region": COL_REGION,                                        # N - Region
+        "appointment_set_who": COL_APPOINTMENT_SET_WHO,              # O - Appointment Set Who
+        "appointment_confirmed_by": COL_APPOINTMENT_CONFIRMED_BY,    # P - Appointment Confirmed By
+        "gross_profit_margin_pct": COL_GROSS_PROFIT_MARGIN_PCT,      # Q - Gross Profit Margin %
+        "paid_unpaid": COL_PAID_UNPAID                               # R - Paid/Unpaid
     }
 
     # Editable columns (letter format)
@@ -89,10 +240,32 @@ class SalesService:
     # Project type options
     PROJECT_TYPES = ["Turf Project", "Synthetic Turf Project", "Turf and Landscape project", "New Build Landscape Project"]
 
+    # (day, rep, slot) -> 0-indexed row of a week tab, filled in below the class
+    ROW_INDEX: Dict[Tuple[str, str, int], int] = {}
+
+    # Positions of each rep, day and lead source in the flat stats counters
+    REP_INDEX = {rep: i for i, rep in enumerate(SALES_REPS)}
+    DAY_INDEX = {day: i for i, day in enumerate(DAYS)}
+    LEAD_INDEX = {source: i for i, source in enumerate(LEAD_SOURCES)}
+
+    # (day, rep) -> ascending 0-indexed rows of that rep's slots on that day
+    DAY_REP_ROWS: Dict[Tuple[str, str], Tuple[int, ...]] = {}
+
     def __init__(self):
         self._client: Optional[GoogleSheetsClient] = None
         self._service = None
         self._spreadsheet_id = settings.sales_spreadsheet_id if hasattr(settings, 'sales_spreadsheet_id') else None
+        if not self._spreadsheet_id:
+            # Fall back to environment variable or default
+            self._spreadsheet_id = os.getenv("SALES_SPREADSHEET_ID", settings.google_spreadsheet_id)
+        # Buffered single-cell edits per week tab, awaiting the next flush
+        self._pending_writes: Dict[str, List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+        self._flush_tasks: set = set()
+        # (monotonic timestamp, week tabs) from the last metadata read
+        self._weeks_cache: Optional[Tuple[float, List[str]]] = None
+        self._weeks_inflight: Optional[asyncio.Future] = None
+        # week_tab -> (monotonic timestamp, aggregated stats)
+        self._week_stats_cache: Dict[str, Tuple[float, Dict]] = {}
 
     def _get_service(self):
         """Lazy initialization of sheets service."""
@@ -103,13 +276,21 @@ class SalesService:
             self._service = self._client._ensure_service()
         return self._service
 
+    async def _execute(self, request: Any) -> Dict:
+        """
+        Execute a googleapiclient request in a worker thread.
+
+        Keeps the blocking HTTP call off the event loop so concurrent reads
+        overlap. Each worker thread uses its own authorized transport, as
+        httplib2 connections are not thread-safe.
+        """
+        return await asyncio.to_thread(
+            lambda: request.execute(http=self._client._get_http())
+        )
+
     def _get_spreadsheet_id(self) -> str:
-        """Get the sales spreadsheet ID."""
-        if self._spreadsheet_id:
-            return self._spreadsheet_id
-        # Fall back to environment variable or default
-        import os
-        return os.getenv("SALES_SPREADSHEET_ID", settings.google_spreadsheet_id)
+        """Get the sales spreadsheet ID (resolved once at construction)."""
+        return self._spreadsheet_id
 
     def get_week_tab_name(self, target_date: date) -> str:
         """
@@ -121,9 +302,7 @@ class SalesService:
             2026-01-05 (Mon) -> "Jan-05"
             2026-01-07 (Wed) -> "Jan-05"
         """
-        days_since_monday = target_date.weekday()  # Monday=0, Sunday=6
-        monday_of_week = target_date - timedelta(days=days_since_monday)
-        return monday_of_week.strftime("%b-%d")
+        return _week_tab_for(target_date)
 
     def get_day_name(self, target_date: date) -> str:
         """Get weekday name for the target date (Mon-Sat, excludes Sunday)."""
@@ -133,7 +312,8 @@ class SalesService:
             return self.DAYS[weekday]
         return None  # Sunday
 
-    def calculate_row_number(self, day: str, rep: str, slot: int) -> int:
+    @classmethod
+    def calculate_row_number(cls, day: str, rep: str, slot: int) -> int:
         """
         Calculate the 1-indexed row number for a specific appointment slot.
 
@@ -145,25 +325,40 @@ class SalesService:
         Returns:
             Row number (1-indexed for Google Sheets API)
         """
-        day_base = self.DAY_HEADER_ROWS.get(day, 1)
+        day_base = cls.DAY_HEADER_ROWS.get(day, 1)
         # Use different offsets for Saturday
         if day == "Saturday":
-            rep_offset = self.SATURDAY_REP_SLOT_OFFSETS.get(rep, 4)
+            rep_offset = cls.SATURDAY_REP_SLOT_OFFSETS.get(rep, 4)
         else:
-            rep_offset = self.REP_SLOT_OFFSETS.get(rep, 4)
+            rep_offset = cls.REP_SLOT_OFFSETS.get(rep, 4)
         return day_base + rep_offset + (slot - 1)
 
+    def _day_row_bounds(self, day_name: str) -> Tuple[int, int]:
+        """Get the first and last sheet rows holding a day's appointments for all reps."""
+        # We need rows from the day header to cover all 3 reps
+        day_start_row = self.DAY_HEADER_ROWS[day_name]
+        # Saturday has fewer rows (3 slots per rep × 3 reps = ~20 rows)
+        day_end_row = day_start_row + (20 if day_name == "Saturday" else 28)
+        return day_start_row, day_end_row
+
     def parse_boolean(self, value: Any) -> bool:
         """Convert 'Yes'/'True'/empty to boolean."""
-        if value is None:
+        # None, "", False and 0 - the bulk of cells - need no further checks
+        if not value:
             return False
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            cleaned = value.strip().lower()
-            # Accept both "yes" and "true" (for Google Sheets checkbox/boolean values)
-            return cleaned == "yes" or cleaned == "true"
-        return False
+        # Sheet values are always str, so test the exact type first
+        if type(value) is str:
+            if value in _TRUTHY:
+                return True
+            cleaned = value.strip()
+            # Accept both "yes" and "true" (for Google Sheets checkbox/boolean values);
+            # only 3 or 4 character strings can match, so skip lower() for the rest
+            if len(cleaned) == 3:
+                return cleaned.lower() == "yes"
+            if len(cleaned) == 4:
+                return cleaned.lower() == "true"
+            return False
+        return value is True
 
     def parse_currency(self, value: Any) -> float:
         """Parse currency string to float (e.g., '$50,000' -> 50000.0)."""
@@ -172,8 +367,9 @@ class SalesService:
         if isinstance(value, (int, float)):
             return float(value)
         if isinstance(value, str):
-            # Remove currency symbols, commas, and whitespace
-            cleaned = value.strip().replace('$', '').replace(',', '').replace(' ', '')
+            # Remove currency symbols, commas, and whitespace; float() itself
+            # ignores any other surrounding whitespace such as newlines
+            cleaned = value.translate(_CURRENCY_STRIP)
             if cleaned:
                 try:
                     return float(cleaned)
@@ -183,48 +379,40 @@ class SalesService:
 
     def format_display_date(self, target_date: date) -> str:
         """Format date as 'Thu 2nd Jan'."""
-        days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-
-        day_num = target_date.day
-        suffix = self._get_ordinal_suffix(day_num)
-
-        return f"{days[target_date.weekday()]} {day_num}{suffix} {months[target_date.month - 1]}"
+        return _display_date_for(target_date)
 
     def _get_ordinal_suffix(self, n: int) -> str:
         """Get ordinal suffix for a number."""
-        if 11 <= n <= 13:
-            return 'th'
-        return {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+        return _ordinal_suffix(n)
 
     def _parse_row_to_appointment(self, row: List, slot: int, row_number: int) -> Dict:
-        """Parse a single row into an appointment dict."""
-        def safe_get(idx: int, default: str = "") -> str:
-            if idx < len(row):
-                val = row[idx]
-                return str(val) if val is not None else default
-            return default
+        """Parse a single row, already padded by _pad_row, into an appointment dict."""
+        (
+            _slot, lead_name, lead_source, appointment_set, appointment_confirmed,
+            appointment_attended, job_sold, reason, _conversion, sell_price,
+            appointment_time, project_type, suburb, region, appointment_set_who,
+            appointment_confirmed_by, gross_profit_margin_pct, paid_unpaid
+        ) = row
 
         return {
             "slot": slot,
             "row_number": row_number,
-            "lead_name": safe_get(self.COLUMNS["lead_name"]),
-            "lead_source": safe_get(self.COLUMNS["lead_source"]),
-            "appointment_set": self.parse_boolean(safe_get(self.COLUMNS["appointment_set"])),
-            "appointment_confirmed": self.parse_boolean(safe_get(self.COLUMNS["appointment_confirmed"])),
-            "appointment_attended": self.parse_boolean(safe_get(self.COLUMNS["appointment_attended"])),
-            "job_sold": self.parse_boolean(safe_get(self.COLUMNS["job_sold"])),
-            "reason": safe_get(self.COLUMNS["reason"]),
-            "sell_price": self.parse_currency(safe_get(self.COLUMNS["sell_price"])),
-            "appointment_time": safe_get(self.COLUMNS["appointment_time"]),
-            "project_type": safe_get(self.COLUMNS["project_type"]),
-            "suburb": safe_get(self.COLUMNS["suburb"]),
-            "region": safe_get(self.COLUMNS["region"]),
-            "appointment_set_who": safe_get(self.COLUMNS["appointment_set_who"]),
-            "appointment_confirmed_by": safe_get(self.COLUMNS["appointment_confirmed_by"]),
-            "gross_profit_margin_pct": safe_get(self.COLUMNS["gross_profit_margin_pct"]),
-            "paid_unpaid": safe_get(self.COLUMNS["paid_unpaid"])
+            "lead_name": lead_name,
+            "lead_source": lead_source,
+            "appointment_set": self.parse_boolean(appointment_set),
+            "appointment_confirmed": self.parse_boolean(appointment_confirmed),
+            "appointment_attended": self.parse_boolean(appointment_attended),
+            "job_sold": self.parse_boolean(job_sold),
+            "reason": reason,
+            "sell_price": self.parse_currency(sell_price),
+            "appointment_time": appointment_time,
+            "project_type": project_type,
+            "suburb": suburb,
+            "region": region,
+            "appointment_set_who": appointment_set_who,
+            "appointment_confirmed_by": appointment_confirmed_by,
+            "gross_profit_margin_pct": gross_profit_margin_pct,
+            "paid_unpaid": paid_unpaid
         }
 
     async def get_daily_schedule(self, target_date: date) -> Dict:
@@ -249,28 +437,28 @@ class SalesService:
             service = self._get_service()
             spreadsheet_id = self._get_spreadsheet_id()
 
-            # Check if the week tab exists
-            available_weeks = await self.get_available_weeks()
-            if week_tab not in available_weeks:
-                return {
-                    "success": False,
-                    "error": f"Week '{week_tab}' not found. Available weeks: {', '.join(available_weeks[:5])}..."
-                }
+            # Weeks before the first tracked week are never available
+            if target_date - timedelta(days=target_date.weekday()) < FIRST_WEEK_DATE:
+                return await self._week_not_found(week_tab)
 
             # Read the entire day's data (all reps)
-            # We need rows from the day header to cover all 3 reps
-            day_start_row = self.DAY_HEADER_ROWS[day_name]
-            # Saturday has fewer rows (3 slots per rep × 3 reps = ~20 rows)
-            day_end_row = day_start_row + (20 if day_name == "Saturday" else 28)
+            day_start_row, day_end_row = self._day_row_bounds(day_name)
 
             range_notation = f"'{week_tab}'!A{day_start_row}:R{day_end_row}"
 
-            result = service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=range_notation
-            ).execute()
+            try:
+                result = await self._execute(service.spreadsheets().values().get(
+                    spreadsheetId=spreadsheet_id,
+                    range=range_notation
+                ))
+            except HttpError as e:
+                # A missing week tab makes the range unparseable
+                if e.resp.status == 400:
+                    return await self._week_not_found(week_tab)
+                raise
 
-            all_rows = result.get('values', [])
+            # Pad every row to the full A-R width once so parsing can index directly
+            all_rows = [_pad_row(row) for row in result.get('values', [])]
 
             # Parse appointments for each rep
             reps_data = []
@@ -281,14 +469,11 @@ class SalesService:
                 "total_sold": 0
             }
 
-            # Get number of slots for this day
-            num_slots = self.SLOTS_PER_DAY.get(day_name, 5)
-
             for rep in self.SALES_REPS:
                 rep_appointments = []
 
-                for slot in range(1, num_slots + 1):
-                    row_number = self.calculate_row_number(day_name, rep, slot)
+                for slot, row_idx in enumerate(self.DAY_REP_ROWS[(day_name, rep)], start=1):
+                    row_number = row_idx + 1
                     # Convert to 0-indexed relative to our fetched range
                     relative_row = row_number - day_start_row
 
@@ -359,6 +544,14 @@ class SalesService:
                 "error": str(e)
             }
 
+    async def _week_not_found(self, week_tab: str) -> Dict:
+        """Error response for a missing week tab, listing some weeks that do exist."""
+        available_weeks = await self.get_available_weeks()
+        return {
+            "success": False,
+            "error": f"Week '{week_tab}' not found. Available weeks: {', '.join(available_weeks[:5])}..."
+        }
+
     async def update_appointment_field(
         self,
         week_tab: str,
@@ -366,7 +559,13 @@ class SalesService:
         column: str,
         value: str
     ) -> Dict:
-        """Update a single cell in the spreadsheet."""
+        """
+        Update a single cell in the spreadsheet.
+
+        Edits to the same week tab that arrive within WRITE_FLUSH_WINDOW_SECONDS
+        of each other are coalesced into one values.batchUpdate call. If that
+        call fails, each edit is retried alone so every caller gets its own result.
+        """
         # Validate column
         if column.upper() not in self.EDITABLE_COLUMNS:
             return {
@@ -374,35 +573,110 @@ class SalesService:
                 "error": f"Column {column} is not editable. Allowed: {', '.join(self.EDITABLE_COLUMNS)}"
             }
 
+        update = {"row_number": row_number, "column": column.upper(), "value": value}
+        future = asyncio.get_running_loop().create_future()
+
+        pending = self._pending_writes.get(week_tab)
+        if pending is None:
+            pending = self._pending_writes[week_tab] = []
+            task = asyncio.create_task(self._flush_writes_after_window(week_tab))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        pending.append((update, future))
+
+        result = await future
+        if not result.get("success"):
+            return result
+
+        return {
+            "success": True,
+            "updated": {"week_tab": week_tab, **update}
+        }
+
+    async def _flush_writes_after_window(self, week_tab: str) -> None:
+        """Wait for the flush window, then write all buffered edits for a week tab."""
+        await asyncio.sleep(WRITE_FLUSH_WINDOW_SECONDS)
+        pending = self._pending_writes.pop(week_tab, [])
+        updates = [update for update, _ in pending]
+
+        async def write(batch: List[Dict[str, Any]]) -> Dict:
+            try:
+                return await self.update_appointment_fields(week_tab, batch)
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+
+        results = [await write(updates)] * len(pending)
+
+        # A single bad edit (e.g. a row outside the tab) fails the whole batch;
+        # write each edit on its own so only the faulty one reports the error
+        if len(pending) > 1 and not results[0].get("success"):
+            logger.warning(f"Batched write to '{week_tab}' failed, retrying {len(pending)} edits one by one")
+            results = await asyncio.gather(*(write([update]) for update in updates))
+
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def update_appointment_fields(
+        self,
+        week_tab: str,
+        updates: List[Dict[str, Any]]
+    ) -> Dict:
+        """
+        Update several cells of a week tab in a single batchUpdate call.
+
+        Args:
+            week_tab: Week tab name, e.g. "Jan-05"
+            updates: Dicts with "row_number", "column" and "value" keys
+
+        Returns:
+            Dict with success flag and the list of updated cells
+        """
+        for update in updates:
+            if update["column"].upper() not in self.EDITABLE_COLUMNS:
+                return {
+                    "success": False,
+                    "error": f"Column {update['column']} is not editable. Allowed: {', '.join(self.EDITABLE_COLUMNS)}"
+                }
+
+        if not updates:
+            return {"success": True, "updated": []}
+
         try:
             service = self._get_service()
             spreadsheet_id = self._get_spreadsheet_id()
 
-            # Build cell reference
-            cell_ref = f"'{week_tab}'!{column.upper()}{row_number}"
+            data = [
+                {
+                    "range": f"'{week_tab}'!{update['column'].upper()}{update['row_number']}",
+                    "values": [[update["value"]]]
+                }
+                for update in updates
+            ]
 
-            # Update the cell
-            service.spreadsheets().values().update(
+            await self._execute(service.spreadsheets().values().batchUpdate(
                 spreadsheetId=spreadsheet_id,
-                range=cell_ref,
-                valueInputOption="USER_ENTERED",
-                body={"values": [[value]]}
-            ).execute()
+                body={"valueInputOption": "USER_ENTERED", "data": data}
+            ))
 
-            logger.info(f"Updated {cell_ref} to '{value}'")
+            logger.info(f"Updated {len(data)} cell(s) in '{week_tab}'")
+            self._invalidate_week_stats(week_tab)
 
             return {
                 "success": True,
-                "updated": {
-                    "week_tab": week_tab,
-                    "row_number": row_number,
-                    "column": column.upper(),
-                    "value": value
-                }
+                "updated": [
+                    {
+                        "week_tab": week_tab,
+                        "row_number": update["row_number"],
+                        "column": update["column"].upper(),
+                        "value": update["value"]
+                    }
+                    for update in updates
+                ]
             }
 
         except Exception as e:
-            logger.error(f"Error updating appointment: {e}")
+            logger.error(f"Error updating appointments: {e}")
             return {
                 "success": False,
                 "error": str(e)
@@ -460,8 +734,7 @@ class SalesService:
             row_number = self.calculate_row_number(day, rep, slot)
 
             # Check if week tab exists
-            available_weeks = await self.get_available_weeks()
-            if week_tab not in available_weeks:
+            if not await self._week_tab_exists(week_tab):
                 return {
                     "success": False,
                     "error": f"Week tab '{week_tab}' not found",
@@ -471,10 +744,10 @@ class SalesService:
             # Optional: Check if slot is already occupied
             # Read the current row to see if there's already a client name
             check_range = f"'{week_tab}'!B{row_number}"
-            check_result = service.spreadsheets().values().get(
+            check_result = await self._execute(service.spreadsheets().values().get(
                 spreadsheetId=spreadsheet_id,
                 range=check_range
-            ).execute()
+            ))
 
             existing_values = check_result.get('values', [])
             if existing_values and len(existing_values) > 0 and len(existing_values[0]) > 0:
@@ -519,14 +792,15 @@ class SalesService:
             # Write the entire row
             range_notation = f"'{week_tab}'!A{row_number}:R{row_number}"
 
-            service.spreadsheets().values().update(
+            await self._execute(service.spreadsheets().values().update(
                 spreadsheetId=spreadsheet_id,
                 range=range_notation,
                 valueInputOption="USER_ENTERED",
                 body={"values": [row_values]}
-            ).execute()
+            ))
 
             logger.info(f"Created appointment: {week_tab} {day} {rep} Slot {slot} - {client_name}")
+            self._invalidate_week_stats(week_tab)
 
             # Return the created appointment
             appointment = {
@@ -623,8 +897,7 @@ class SalesService:
             spreadsheet_id = self._get_spreadsheet_id()
 
             # Check if week tab exists
-            available_weeks = await self.get_available_weeks()
-            if week_tab not in available_weeks:
+            if not await self._week_tab_exists(week_tab):
                 return {
                     "success": False,
                     "error": f"Week tab '{week_tab}' not found",
@@ -638,14 +911,15 @@ class SalesService:
 
             range_notation = f"'{week_tab}'!B{row_number}:R{row_number}"
 
-            service.spreadsheets().values().update(
+            await self._execute(service.spreadsheets().values().update(
                 spreadsheetId=spreadsheet_id,
                 range=range_notation,
                 valueInputOption="USER_ENTERED",
                 body={"values": [empty_row]}
-            ).execute()
+            ))
 
             logger.info(f"Deleted appointment at row {row_number} in {week_tab}")
+            self._invalidate_week_stats(week_tab)
 
             return {
                 "success": True,
@@ -661,144 +935,52 @@ class SalesService:
                 "error_code": 500
             }
 
-    async def get_weekly_stats(self, week_tab: str) -> Dict:
-        """Aggregate statistics for an entire week."""
+    async def get_weekly_stats(self, week_tab: str, *, include_available_weeks: bool = True) -> Dict:
+        """
+        Aggregate statistics for an entire week.
+
+        Args:
+            week_tab: Week tab name, e.g. "Jan-05"
+            include_available_weeks: Also list the available weeks for the week
+                picker. Callers that only need the stats can skip the lookup;
+                "available_weeks" is then empty.
+        """
         try:
             service = self._get_service()
             spreadsheet_id = self._get_spreadsheet_id()
 
-            # Read entire week's data (rows 1-180 covers Mon-Sat with buffer)
-            range_notation = f"'{week_tab}'!A1:R180"
-
-            result = service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=range_notation
-            ).execute()
+            # Read the week's slot rows (Mon-Sat, columns A-J)
+            range_notation = f"'{week_tab}'!{WEEK_STATS_RANGE}"
 
-            all_rows = result.get('values', [])
+            async def no_weeks() -> List[str]:
+                return []
 
-            # Initialize aggregates
-            totals = {
-                "appointments_set": 0,
-                "appointments_confirmed": 0,
-                "in_homes_attended": 0,
-                "jobs_sold": 0,
-                "weekly_sales_total": 0.0
-            }
+            get_weeks = self.get_available_weeks if include_available_weeks else no_weeks
 
-            by_rep = {rep: {
-                "name": rep,
-                "appointments_set": 0,
-                "appointments_confirmed": 0,
-                "in_homes_attended": 0,
-                "jobs_sold": 0,
-                "sales_total": 0.0
-            } for rep in self.SALES_REPS}
-
-            by_day = {day: {"day": day, "attended": 0, "sold": 0} for day in self.DAYS}
-
-            lead_source_counts = {source: 0 for source in self.LEAD_SOURCES}
-
-            # Parse each day and rep
-            for day in self.DAYS:
-                # Get number of slots for this day (3 for Saturday, 5 for weekdays)
-                num_slots = self.SLOTS_PER_DAY.get(day, 5)
-                for rep in self.SALES_REPS:
-                    for slot in range(1, num_slots + 1):
-                        row_number = self.calculate_row_number(day, rep, slot)
-                        row_idx = row_number - 1  # Convert to 0-indexed
-
-                        if row_idx < len(all_rows):
-                            row = all_rows[row_idx]
-
-                            def safe_get(idx: int, default: str = "") -> str:
-                                """Get value from row - consistent with _parse_row_to_appointment."""
-                                if idx < len(row):
-                                    val = row[idx]
-                                    return str(val) if val is not None else default
-                                return default
-
-                            is_set = self.parse_boolean(safe_get(self.COLUMNS["appointment_set"]))
-                            is_confirmed = self.parse_boolean(safe_get(self.COLUMNS["appointment_confirmed"]))
-                            is_attended = self.parse_boolean(safe_get(self.COLUMNS["appointment_attended"]))
-                            is_sold = self.parse_boolean(safe_get(self.COLUMNS["job_sold"]))
-                            lead_source = safe_get(self.COLUMNS["lead_source"])
-                            sell_price = self.parse_currency(safe_get(self.COLUMNS["sell_price"]))
-
-                            if is_set:
-                                totals["appointments_set"] += 1
-                                by_rep[rep]["appointments_set"] += 1
-
-                                # Count lead source
-                                if lead_source in lead_source_counts:
-                                    lead_source_counts[lead_source] += 1
-                                elif lead_source:
-                                    lead_source_counts["Other"] += 1
-
-                            if is_confirmed:
-                                totals["appointments_confirmed"] += 1
-                                by_rep[rep]["appointments_confirmed"] += 1
-
-                            if is_attended:
-                                totals["in_homes_attended"] += 1
-                                by_rep[rep]["in_homes_attended"] += 1
-                                by_day[day]["attended"] += 1
-
-                            if is_sold:
-                                totals["jobs_sold"] += 1
-                                by_rep[rep]["jobs_sold"] += 1
-                                by_day[day]["sold"] += 1
-                                totals["weekly_sales_total"] += sell_price
-                                by_rep[rep]["sales_total"] += sell_price
-
-            # Calculate conversion rates
-            if totals["in_homes_attended"] > 0:
-                totals["conversion_rate"] = round(
-                    (totals["jobs_sold"] / totals["in_homes_attended"]) * 100, 1
+            stats = self._get_cached_week_stats(week_tab)
+            if stats is None:
+                # Fetch the week's rows and the available weeks concurrently
+                result, available_weeks = await asyncio.gather(
+                    self._execute(service.spreadsheets().values().get(
+                        spreadsheetId=spreadsheet_id,
+                        range=range_notation
+                    )),
+                    get_weeks()
                 )
-            else:
-                totals["conversion_rate"] = 0.0
-
-            by_rep_list = []
-            for rep in self.SALES_REPS:
-                rep_data = by_rep[rep]
-                if rep_data["in_homes_attended"] > 0:
-                    rep_data["conversion_rate"] = round(
-                        (rep_data["jobs_sold"] / rep_data["in_homes_attended"]) * 100, 1
-                    )
-                else:
-                    rep_data["conversion_rate"] = 0.0
-                by_rep_list.append(rep_data)
-
-            # Format lead source data
-            total_set = totals["appointments_set"]
-            by_lead_source = []
-            for source in self.LEAD_SOURCES:
-                count = lead_source_counts[source]
-                percentage = round((count / total_set) * 100, 1) if total_set > 0 else 0.0
-                by_lead_source.append({
-                    "source": source,
-                    "count": count,
-                    "percentage": percentage
-                })
 
-            # Sort by count descending
-            by_lead_source.sort(key=lambda x: x["count"], reverse=True)
+                stats = self._aggregate_week(result.get('values', []))
+                self._week_stats_cache[week_tab] = (time.monotonic(), stats)
+            else:
+                available_weeks = await get_weeks()
 
             # Get week display string
             week_display = self._format_week_display(week_tab)
 
-            # Get available weeks
-            available_weeks = await self.get_available_weeks()
-
             return {
                 "success": True,
                 "week": week_tab,
                 "week_display": week_display,
-                "totals": totals,
-                "by_rep": by_rep_list,
-                "by_lead_source": by_lead_source,
-                "by_day": list(by_day.values()),
+                **stats,
                 "available_weeks": available_weeks
             }
 
@@ -809,93 +991,334 @@ class SalesService:
                 "error": str(e)
             }
 
-    def _format_week_display(self, week_tab: str) -> str:
-        """Format week tab as 'Jan 5 - Jan 9, 2026'."""
-        try:
-            # Parse the week tab (e.g., "Jan-05")
-            month_str, day_str = week_tab.split("-")
-            months = {
-                "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4,
-                "May": 5, "Jun": 6, "Jul": 7, "Aug": 8,
-                "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
+    def _merge_week_into_agg(self, totals: Dict, rep_counts: List[List[int]], week_stats: Dict) -> None:
+        """Add one week's counts and sales into running multi-week totals and per-rep counters."""
+        week_totals = week_stats["totals"]
+        for key in _COUNT_KEYS:
+            totals[key] += week_totals[key]
+        totals["weekly_sales_total"] += week_totals["weekly_sales_total"]
+
+        for rep_data in week_stats["by_rep"]:
+            rep_i = self.REP_INDEX.get(rep_data["name"])
+            if rep_i is not None:
+                counts = rep_counts[rep_i]
+                for metric_i, key in enumerate(_COUNT_KEYS):
+                    counts[metric_i] += rep_data[key]
+
+    def _combine_weeks(self, weeks_stats: List[Dict]) -> Tuple[Dict, List[Dict]]:
+        """
+        Sum several weeks' aggregated stats into totals and per-rep stats.
+
+        Counts are summed first; conversion rates are derived once from the sums.
+
+        Returns:
+            (totals, by_rep list in SALES_REPS order)
+        """
+        totals = {**dict.fromkeys(_COUNT_KEYS, 0), "weekly_sales_total": 0.0}
+        # [set, confirmed, attended, sold] per rep, indexed by REP_INDEX
+        rep_counts = [[0, 0, 0, 0] for _ in self.SALES_REPS]
+
+        for week_stats in weeks_stats:
+            self._merge_week_into_agg(totals, rep_counts, week_stats)
+
+        totals["conversion_rate"] = _conversion_rate(totals["jobs_sold"], totals["in_homes_attended"])
+
+        by_rep_list = [
+            {
+                "name": rep,
+                **dict(zip(_COUNT_KEYS, counts)),
+                "conversion_rate": _conversion_rate(counts[3], counts[2]),
             }
-            month = months.get(month_str, 1)
-            day = int(day_str)
+            for rep, counts in zip(self.SALES_REPS, rep_counts)
+        ]
 
-            # Assume current/next year
-            from datetime import datetime
-            year = datetime.now().year
-            if month < datetime.now().month - 6:
-                year += 1
+        return totals, by_rep_list
 
-            monday = date(year, month, day)
-            friday = monday + timedelta(days=4)
+    async def _batch_read_weeks(self, week_tabs: List[str]) -> Dict[str, List[List]]:
+        """
+        Read several week tabs in a single values.batchGet round-trip.
 
-            if monday.month == friday.month:
-                return f"{month_str} {monday.day} - {friday.day}, {year}"
-            else:
-                friday_month = friday.strftime("%b")
-                return f"{month_str} {monday.day} - {friday_month} {friday.day}, {year}"
-        except Exception:
-            return week_tab
+        Returns:
+            Dict mapping each week tab to its rows (as returned for WEEK_STATS_RANGE)
+        """
+        if not week_tabs:
+            return {}
 
-    async def get_available_weeks(self) -> List[str]:
-        """Get list of available week tabs."""
-        try:
-            service = self._get_service()
-            spreadsheet_id = self._get_spreadsheet_id()
+        service = self._get_service()
+        result = await self._execute(service.spreadsheets().values().batchGet(
+            spreadsheetId=self._get_spreadsheet_id(),
+            ranges=[f"'{week_tab}'!{WEEK_STATS_RANGE}" for week_tab in week_tabs]
+        ))
 
-            # Get spreadsheet metadata
-            spreadsheet = service.spreadsheets().get(
-                spreadsheetId=spreadsheet_id
-            ).execute()
-
-            sheets = spreadsheet.get('sheets', [])
-            week_pattern = re.compile(r'^[A-Z][a-z]{2}-\d{2}$')
-
-            # Parse tab names into (date, tab_name) tuples
-            week_dates = []
-            for sheet in sheets:
-                title = sheet.get('properties', {}).get('title', '')
-                if week_pattern.match(title):
-                    try:
-                        # Parse tab name (e.g., "Jan-05")
-                        month_str, day_str = title.split("-")
-                        months = {
-                            "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4,
-                            "May": 5, "Jun": 6, "Jul": 7, "Aug": 8,
-                            "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
-                        }
-                        month = months.get(month_str, 1)
-                        day = int(day_str)
+        # valueRanges come back in request order
+        value_ranges = result.get('valueRanges', [])
+        return {
+            week_tab: value_range.get('values', [])
+            for week_tab, value_range in zip(week_tabs, value_ranges)
+        }
+
+    async def _get_weeks_stats(self, week_tabs: List[str]) -> List[Dict]:
+        """
+        Get aggregated stats for several weeks, in order.
+
+        Weeks with fresh cached stats are reused; the rest are read together
+        with one batchGet, aggregated and cached.
+        """
+        stats_by_week = {week_tab: self._get_cached_week_stats(week_tab) for week_tab in week_tabs}
+        missing = [week_tab for week_tab, stats in stats_by_week.items() if stats is None]
+
+        rows_by_week = await self._batch_read_weeks(missing)
+        if rows_by_week:
+            # A cold annual read decodes every week's slot rows; do that in one
+            # worker thread call so other requests aren't stalled meanwhile
+            computed = await asyncio.to_thread(
+                lambda: {week_tab: self._aggregate_week(rows) for week_tab, rows in rows_by_week.items()}
+            )
+            computed_at = time.monotonic()
+            for week_tab, stats in computed.items():
+                self._week_stats_cache[week_tab] = (computed_at, stats)
+                stats_by_week[week_tab] = stats
+
+        return [stats_by_week[week_tab] for week_tab in week_tabs if stats_by_week[week_tab] is not None]
+
+    def _is_past_week(self, week_tab: str) -> bool:
+        """Check whether a week tab's week ended before the current week began."""
+        week_start = _week_tab_date(week_tab)
+        if week_start is None:
+            return False
+        # Week boundaries follow Australian business days, not the server's clock
+        today = get_australia_today()
+        return week_start < today - timedelta(days=today.weekday())
+
+    def _get_cached_week_stats(self, week_tab: str) -> Optional[Dict]:
+        """
+        Get a week's aggregated stats if they are still fresh.
+
+        Stats for past weeks live for PAST_WEEK_STATS_TTL_SECONDS; the current and
+        future weeks, which are still being edited, for WEEKLY_STATS_TTL_SECONDS.
+        Writes through this service invalidate either immediately.
+        """
+        cached = self._week_stats_cache.get(week_tab)
+        if cached is None:
+            return None
+        computed_at, stats = cached
+        ttl = PAST_WEEK_STATS_TTL_SECONDS if self._is_past_week(week_tab) else WEEKLY_STATS_TTL_SECONDS
+        if time.monotonic() - computed_at >= ttl:
+            del self._week_stats_cache[week_tab]
+            return None
+        return stats
+
+    def _invalidate_week_stats(self, week_tab: str) -> None:
+        """Drop a week's cached stats after its sheet has been written."""
+        self._week_stats_cache.pop(week_tab, None)
+
+    def _aggregate_week(
+        self,
+        all_rows: List[List],
+        day_filter: Optional[str] = None,
+        first_row: int = 1
+    ) -> Dict:
+        """
+        Aggregate one week tab's rows into totals, per-rep, per-day and lead source stats.
+
+        Args:
+            all_rows: Rows of the week tab (as returned for WEEK_STATS_RANGE)
+            day_filter: Only count slots on this day, e.g. "Tuesday"
+            first_row: Sheet row number of all_rows[0], for reads that don't start at row 1
 
-                        # Determine year (2026 for Jan onwards, 2025 for Dec)
-                        year = 2026 if month >= 1 else 2025
-                        if month == 12:  # December tabs are from 2025
-                            year = 2025
+        Returns:
+            Dict with "totals", "by_rep", "by_lead_source" and "by_day" keys
+        """
+        # Flat counters indexed by rep / day position; [set, confirmed, attended, sold]
+        # per rep and [attended, sold] per day. Dicts are only built at the end.
+        rep_counts = [[0, 0, 0, 0] for _ in self.SALES_REPS]
+        rep_sales = [0.0] * len(self.SALES_REPS)
+        day_counts = [[0, 0] for _ in self.DAYS]
+
+        # Unknown non-empty lead sources are counted as "Other"
+        lead_counts = [0] * len(self.LEAD_SOURCES)
+        lead_index = self.LEAD_INDEX.get
+        other_i = self.LEAD_INDEX["Other"]
+
+        truthy = _TRUTHY
+        parse_boolean = self.parse_boolean
+        parse_currency = self.parse_currency
+        num_rows = len(all_rows)
+        row_offset = first_row - 1
+
+        # Count each (day, rep) block of slots in locals, then fold it into the
+        # per-rep and per-day counters once per block
+        for (day, rep), row_idxs in self.DAY_REP_ROWS.items():
+            if day_filter is not None and day != day_filter:
+                continue
+
+            n_set = n_confirmed = n_attended = n_sold = 0
+            sales_total = 0.0
+
+            for row_idx in row_idxs:
+                row_idx -= row_offset
+                if row_idx >= num_rows:
+                    break
+
+                row = all_rows[row_idx]
+                num_cells = len(row)
+                # Unbooked slots usually hold nothing past the lead columns
+                if num_cells <= COL_APPOINTMENT_SET:
+                    continue
 
-                        tab_date = date(year, month, day)
-                        week_dates.append((tab_date, title))
-                    except (ValueError, KeyError):
-                        # Skip invalid tab names
-                        continue
+                # Decode the status cells (D-G) inline; canonical "Yes"/"TRUE"
+                # spellings hit the set, anything else non-empty falls back to
+                # parse_boolean
+                cell = row[COL_APPOINTMENT_SET]
+                is_set = cell in truthy or (parse_boolean(cell) if cell else False)
+                cell = row[COL_APPOINTMENT_CONFIRMED] if num_cells > COL_APPOINTMENT_CONFIRMED else ""
+                is_confirmed = cell in truthy or (parse_boolean(cell) if cell else False)
+                cell = row[COL_APPOINTMENT_ATTENDED] if num_cells > COL_APPOINTMENT_ATTENDED else ""
+                is_attended = cell in truthy or (parse_boolean(cell) if cell else False)
+                cell = row[COL_JOB_SOLD] if num_cells > COL_JOB_SOLD else ""
+                is_sold = cell in truthy or (parse_boolean(cell) if cell else False)
+
+                # Flags are 0/1 so the counters need no branches
+                n_set += is_set
+                n_confirmed += is_confirmed
+                n_attended += is_attended
+                n_sold += is_sold
+
+                # Count lead source
+                if is_set:
+                    lead_source = row[COL_LEAD_SOURCE]
+                    if lead_source:
+                        lead_counts[lead_index(lead_source, other_i)] += 1
+
+                if is_sold and num_cells > COL_SELL_PRICE:
+                    sales_total += parse_currency(row[COL_SELL_PRICE])
+
+            rep_i = self.REP_INDEX[rep]
+            counts = rep_counts[rep_i]
+            counts[0] += n_set
+            counts[1] += n_confirmed
+            counts[2] += n_attended
+            counts[3] += n_sold
+            rep_sales[rep_i] += sales_total
+
+            day_count = day_counts[self.DAY_INDEX[day]]
+            day_count[0] += n_attended
+            day_count[1] += n_sold
+
+        totals = dict(zip(_COUNT_KEYS, map(sum, zip(*rep_counts))))
+        totals["weekly_sales_total"] = sum(rep_sales)
+        totals["conversion_rate"] = _conversion_rate(totals["jobs_sold"], totals["in_homes_attended"])
+
+        by_rep_list = []
+        for rep, counts, sales_total in zip(self.SALES_REPS, rep_counts, rep_sales):
+            rep_data = {"name": rep, **dict(zip(_COUNT_KEYS, counts)), "sales_total": sales_total}
+            rep_data["conversion_rate"] = _conversion_rate(counts[3], counts[2])
+            by_rep_list.append(rep_data)
+
+        by_day = [
+            {"day": day, "attended": attended, "sold": sold}
+            for day, (attended, sold) in zip(self.DAYS, day_counts)
+        ]
+
+        # Format lead source data
+        total_set = totals["appointments_set"]
+        by_lead_source = []
+        for source, count in zip(self.LEAD_SOURCES, lead_counts):
+            percentage = round((count / total_set) * 100, 1) if total_set > 0 else 0.0
+            by_lead_source.append({
+                "source": source,
+                "count": count,
+                "percentage": percentage
+            })
+
+        # Sort by count descending
+        by_lead_source.sort(key=lambda x: x["count"], reverse=True)
 
-            # Filter out dates before January 5, 2026
-            cutoff_date = date(2026, 1, 5)
-            week_dates = [(d, t) for d, t in week_dates if d >= cutoff_date]
+        return {
+            "totals": totals,
+            "by_rep": by_rep_list,
+            "by_lead_source": by_lead_source,
+            "by_day": by_day
+        }
 
-            # Sort by date (oldest first for chronological order)
-            week_dates.sort(key=lambda x: x[0], reverse=False)
+    def _format_week_display(self, week_tab: str) -> str:
+        """Format week tab as 'Jan 5 - Jan 9, 2026'."""
+        # Assume current/next year
+        now = datetime.now()
+        return _week_display_for(week_tab, now.year, now.month)
 
-            # Return just the tab names
-            available = [title for _, title in week_dates]
+    async def get_available_weeks(self) -> List[str]:
+        """
+        Get list of available week tabs.
 
-            return available
+        The list is cached for AVAILABLE_WEEKS_TTL_SECONDS; failed reads are not cached.
+        """
+        if self._weeks_cache is not None:
+            fetched_at, weeks = self._weeks_cache
+            if time.monotonic() - fetched_at < AVAILABLE_WEEKS_TTL_SECONDS:
+                return list(weeks)
 
+        # Concurrent callers on a cold cache share a single metadata read
+        task = self._weeks_inflight
+        if task is None:
+            task = self._weeks_inflight = asyncio.ensure_future(self._fetch_available_weeks())
+            task.add_done_callback(self._clear_weeks_inflight)
+
+        try:
+            return list(await asyncio.shield(task))
         except Exception as e:
             logger.error(f"Error fetching available weeks: {e}")
             return []
 
+    async def _week_tab_exists(self, week_tab: str) -> bool:
+        """
+        Check whether a week tab exists.
+
+        On a miss the cached tab list is dropped and read once more, so a
+        tab created since the list was cached is not reported as missing.
+        """
+        if week_tab in await self.get_available_weeks():
+            return True
+        self._weeks_cache = None
+        return week_tab in await self.get_available_weeks()
+
+    def _clear_weeks_inflight(self, task: asyncio.Future) -> None:
+        """Forget a finished metadata read so the next cache miss starts a new one."""
+        if self._weeks_inflight is task:
+            self._weeks_inflight = None
+
+    async def _fetch_available_weeks(self) -> List[str]:
+        """Read the week tabs from the spreadsheet metadata and cache them."""
+        service = self._get_service()
+        spreadsheet_id = self._get_spreadsheet_id()
+
+        # Get spreadsheet metadata (tab titles only)
+        spreadsheet = await self._execute(service.spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            fields="sheets.properties.title"
+        ))
+
+        sheets = spreadsheet.get('sheets', [])
+
+        # Parse tab names into (date, tab_name) tuples, keeping weeks from FIRST_WEEK_DATE on
+        match = _WEEK_RE.match
+        titles = (sheet.get('properties', {}).get('title', '') for sheet in sheets)
+        week_dates = [
+            (tab_date, title)
+            for title in titles if match(title)
+            for tab_date in (_week_tab_date(title),)
+            if tab_date is not None and tab_date >= FIRST_WEEK_DATE
+        ]
+
+        # Sort by date (oldest first for chronological order)
+        week_dates.sort(key=lambda x: x[0])
+
+        # Return just the tab names
+        available = [title for _, title in week_dates]
+
+        self._weeks_cache = (time.monotonic(), available)
+        return available
+
     async def get_daily_stats(self, target_date: date) -> Dict:
         """Get statistics for a single day."""
         if target_date.weekday() == 6:  # Sunday only
@@ -908,38 +1331,38 @@ class SalesService:
         day_name = self.get_day_name(target_date)
 
         try:
-            # Get full week stats and filter to one day
-            week_result = await self.get_weekly_stats(week_tab)
+            service = self._get_service()
+            spreadsheet_id = self._get_spreadsheet_id()
 
-            if not week_result.get("success"):
-                return week_result
+            # Read only this day's rows rather than the whole week
+            day_start_row, day_end_row = self._day_row_bounds(day_name)
+            result = await self._execute(service.spreadsheets().values().get(
+                spreadsheetId=spreadsheet_id,
+                range=f"'{week_tab}'!A{day_start_row}:R{day_end_row}"
+            ))
 
-            # Filter by_day to just this day
-            by_day = week_result.get("by_day", [])
-            day_data = next((d for d in by_day if d["day"] == day_name), {"attended": 0, "sold": 0})
+            stats = self._aggregate_week(
+                result.get('values', []), day_filter=day_name, first_row=day_start_row
+            )
+            day_data = next(d for d in stats["by_day"] if d["day"] == day_name)
+            day_totals = stats["totals"]
 
-            # Calculate day totals from day_data
             totals = {
-                "appointments_set": 0,
-                "appointments_confirmed": 0,
-                "in_homes_attended": day_data.get("attended", 0),
-                "jobs_sold": day_data.get("sold", 0),
-                "conversion_rate": 0.0
+                "appointments_set": day_totals["appointments_set"],
+                "appointments_confirmed": day_totals["appointments_confirmed"],
+                "in_homes_attended": day_totals["in_homes_attended"],
+                "jobs_sold": day_totals["jobs_sold"],
+                "conversion_rate": day_totals["conversion_rate"]
             }
 
-            if totals["in_homes_attended"] > 0:
-                totals["conversion_rate"] = round(
-                    (totals["jobs_sold"] / totals["in_homes_attended"]) * 100, 1
-                )
-
             return {
                 "success": True,
                 "view": "day",
                 "week": week_tab,
                 "week_display": f"{day_name}, {self.format_display_date(target_date)}",
                 "totals": totals,
-                "by_rep": week_result.get("by_rep", []),
-                "by_lead_source": week_result.get("by_lead_source", []),
+                "by_rep": stats["by_rep"],
+                "by_lead_source": stats["by_lead_source"],
                 "by_day": [day_data]
             }
 
@@ -962,12 +1385,7 @@ class SalesService:
                 try:
                     # Parse week tab (e.g., "Jan-05")
                     month_abbr, day_str = week_tab.split("-")
-                    months = {
-                        "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4,
-                        "May": 5, "Jun": 6, "Jul": 7, "Aug": 8,
-                        "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
-                    }
-                    week_month = months.get(month_abbr, 0)
+                    week_month = _MONTH_ABBR_TO_NUM.get(month_abbr, 0)
                     week_day = int(day_str)
 
                     # Check if this week's Monday falls in the target month
@@ -976,7 +1394,6 @@ class SalesService:
                     # Also include if week spans into target month
                     elif week_month == month - 1 or (month == 1 and week_month == 12):
                         # Check if Friday of this week is in target month
-                        from datetime import datetime
                         try:
                             monday = date(year if week_month <= month else year - 1, week_month, week_day)
                             friday = monday + timedelta(days=4)
@@ -988,56 +1405,9 @@ class SalesService:
                     continue
 
             # Aggregate stats from all weeks
-            totals = {
-                "appointments_set": 0,
-                "appointments_confirmed": 0,
-                "in_homes_attended": 0,
-                "jobs_sold": 0,
-                "weekly_sales_total": 0.0,
-                "conversion_rate": 0.0
-            }
-
-            by_rep_agg = {rep: {
-                "name": rep,
-                "appointments_set": 0,
-                "appointments_confirmed": 0,
-                "in_homes_attended": 0,
-                "jobs_sold": 0,
-                "conversion_rate": 0.0
-            } for rep in self.SALES_REPS}
-
-            for week_tab in weeks_in_month:
-                week_stats = await self.get_weekly_stats(week_tab)
-                if week_stats.get("success"):
-                    week_totals = week_stats.get("totals", {})
-                    totals["appointments_set"] += week_totals.get("appointments_set", 0)
-                    totals["appointments_confirmed"] += week_totals.get("appointments_confirmed", 0)
-                    totals["in_homes_attended"] += week_totals.get("in_homes_attended", 0)
-                    totals["jobs_sold"] += week_totals.get("jobs_sold", 0)
-                    totals["weekly_sales_total"] += week_totals.get("weekly_sales_total", 0.0)
-
-                    for rep_data in week_stats.get("by_rep", []):
-                        rep_name = rep_data["name"]
-                        if rep_name in by_rep_agg:
-                            by_rep_agg[rep_name]["appointments_set"] += rep_data.get("appointments_set", 0)
-                            by_rep_agg[rep_name]["appointments_confirmed"] += rep_data.get("appointments_confirmed", 0)
-                            by_rep_agg[rep_name]["in_homes_attended"] += rep_data.get("in_homes_attended", 0)
-                            by_rep_agg[rep_name]["jobs_sold"] += rep_data.get("jobs_sold", 0)
-
-            # Calculate conversion rates
-            if totals["in_homes_attended"] > 0:
-                totals["conversion_rate"] = round(
-                    (totals["jobs_sold"] / totals["in_homes_attended"]) * 100, 1
-                )
-
-            by_rep_list = []
-            for rep in self.SALES_REPS:
-                rep_data = by_rep_agg[rep]
-                if rep_data["in_homes_attended"] > 0:
-                    rep_data["conversion_rate"] = round(
-                        (rep_data["jobs_sold"] / rep_data["in_homes_attended"]) * 100, 1
-                    )
-                by_rep_list.append(rep_data)
+            totals, by_rep_list = self._combine_weeks(
+                await self._get_weeks_stats(weeks_in_month)
+            )
 
             # Format month display
             from calendar import month_name
@@ -1067,58 +1437,9 @@ class SalesService:
             available_weeks = await self.get_available_weeks()
 
             # We'll aggregate all weeks for simplicity (assuming all are in the target year)
-            totals = {
-                "appointments_set": 0,
-                "appointments_confirmed": 0,
-                "in_homes_attended": 0,
-                "jobs_sold": 0,
-                "weekly_sales_total": 0.0,
-                "conversion_rate": 0.0
-            }
-
-            by_rep_agg = {rep: {
-                "name": rep,
-                "appointments_set": 0,
-                "appointments_confirmed": 0,
-                "in_homes_attended": 0,
-                "jobs_sold": 0,
-                "conversion_rate": 0.0
-            } for rep in self.SALES_REPS}
-
-            weeks_included = 0
-            for week_tab in available_weeks:
-                week_stats = await self.get_weekly_stats(week_tab)
-                if week_stats.get("success"):
-                    weeks_included += 1
-                    week_totals = week_stats.get("totals", {})
-                    totals["appointments_set"] += week_totals.get("appointments_set", 0)
-                    totals["appointments_confirmed"] += week_totals.get("appointments_confirmed", 0)
-                    totals["in_homes_attended"] += week_totals.get("in_homes_attended", 0)
-                    totals["jobs_sold"] += week_totals.get("jobs_sold", 0)
-                    totals["weekly_sales_total"] += week_totals.get("weekly_sales_total", 0.0)
-
-                    for rep_data in week_stats.get("by_rep", []):
-                        rep_name = rep_data["name"]
-                        if rep_name in by_rep_agg:
-                            by_rep_agg[rep_name]["appointments_set"] += rep_data.get("appointments_set", 0)
-                            by_rep_agg[rep_name]["appointments_confirmed"] += rep_data.get("appointments_confirmed", 0)
-                            by_rep_agg[rep_name]["in_homes_attended"] += rep_data.get("in_homes_attended", 0)
-                            by_rep_agg[rep_name]["jobs_sold"] += rep_data.get("jobs_sold", 0)
-
-            # Calculate conversion rates
-            if totals["in_homes_attended"] > 0:
-                totals["conversion_rate"] = round(
-                    (totals["jobs_sold"] / totals["in_homes_attended"]) * 100, 1
-                )
-
-            by_rep_list = []
-            for rep in self.SALES_REPS:
-                rep_data = by_rep_agg[rep]
-                if rep_data["in_homes_attended"] > 0:
-                    rep_data["conversion_rate"] = round(
-                        (rep_data["jobs_sold"] / rep_data["in_homes_attended"]) * 100, 1
-                    )
-                by_rep_list.append(rep_data)
+            weeks_stats = await self._get_weeks_stats(available_weeks)
+            weeks_included = len(weeks_stats)
+            totals, by_rep_list = self._combine_weeks(weeks_stats)
 
             return {
                 "success": True,
@@ -1140,7 +1461,7 @@ class SalesService:
             week_tab = self.get_week_tab_name(date.today())
 
         try:
-            stats = await self.get_weekly_stats(week_tab)
+            stats = await self.get_weekly_stats(week_tab, include_available_weeks=False)
 
             if not stats.get("success"):
                 return stats
@@ -1166,5 +1487,21 @@ class SalesService:
             }
 
 
+SalesService.ROW_INDEX = {
+    (day, rep, slot): SalesService.calculate_row_number(day, rep, slot) - 1
+    for day in SalesService.DAYS
+    for rep in SalesService.SALES_REPS
+    for slot in range(1, SalesService.SLOTS_PER_DAY[day] + 1)
+}
+
+SalesService.DAY_REP_ROWS = {
+    (day, rep): tuple(
+        SalesService.ROW_INDEX[(day, rep, slot)]
+        for slot in range(1, SalesService.SLOTS_PER_DAY[day] + 1)
+    )
+    for day in SalesService.DAYS
+    for rep in SalesService.SALES_REPS
+}
+
 # Global singleton
 sales_service = SalesService()
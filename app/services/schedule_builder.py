@@ -1,20 +1,37 @@
 """Schedule builder service for assembling schedule data from Excel."""
 import logging
+import re
 from datetime import date, datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple
 
 from app.models.schedule import Delivery, TruckData, DaySchedule, ScheduleResponse
-from app.core.constants import TRUCK1_CAPACITY, TRUCK2_CAPACITY, get_australia_today
+from app.core.constants import AUSTRALIA_TZ, TRUCK1_CAPACITY, TRUCK2_CAPACITY
 from app.services.excel.excel_parser import ExcelDeliveryRow
 
 logger = logging.getLogger(__name__)
 
+# Weekday and month names indexed by date.weekday() / date.month - 1,
+# used instead of locale-aware strftime calls
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTH_ABBRS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_WEEKDAY_SET = frozenset(_WEEKDAYS)
+_WEEKDAY_INDEX = {name: i for i, name in enumerate(_WEEKDAYS)}
+
+# Lowercase 3-letter prefix -> full day name, for normalize_day_name
+_DAY_ABBR_TO_NAME = {name[:3].lower(): name for name in _WEEKDAYS}
+
+# Week 2 markers in a lowercased day cell ("Monday W2", "Mon week 2", "Tue week2")
+_WEEK_TWO_RE = re.compile(r"week ?2|w2")
+
+# Number of start dates whose empty schedule is kept for fallback responses
+EMPTY_SCHEDULE_CACHE_SIZE = 4
+
 
 def get_week_tab_from_date(target_date: date) -> str:
     """Get the Google Sheets tab name for the week containing target_date.
     Format: 'Mon-DD' where Mon is 3-letter month and DD is the Monday's day."""
     monday = target_date - timedelta(days=target_date.weekday())
-    return monday.strftime('%b-%d')
+    return f"{_MONTH_ABBRS[monday.month - 1]}-{monday.day:02d}"
 
 
 def get_ordinal_suffix(day: int) -> str:
@@ -24,11 +41,17 @@ def get_ordinal_suffix(day: int) -> str:
     return {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
 
 
-def format_display_date(d: date) -> str:
-    """Format date as 'Mon 22nd Dec'."""
+def format_display_date(d: date, day_of_week: Optional[str] = None) -> str:
+    """Format date as 'Mon 22nd Dec'.
+
+    Args:
+        d: Date to format.
+        day_of_week: Full weekday name of d, if the caller already has it.
+    """
+    if day_of_week is None:
+        day_of_week = _WEEKDAYS[d.weekday()]
     day = d.day
-    suffix = get_ordinal_suffix(day)
-    return d.strftime(f"%a {day}{suffix} %b")
+    return f"{day_of_week[:3]} {day}{get_ordinal_suffix(day)} {_MONTH_ABBRS[d.month - 1]}"
 
 
 def get_next_business_days(start_date: date, count: int = 10) -> List[date]:
@@ -41,16 +64,19 @@ def get_next_business_days(start_date: date, count: int = 10) -> List[date]:
     Returns:
         List of business day dates.
     """
-    business_days = []
-    current = start_date
-
-    while len(business_days) < count:
-        # Monday = 0, Sunday = 6
-        if current.weekday() < 5:  # Mon-Fri
-            business_days.append(current)
-        current += timedelta(days=1)
+    # Monday = 0, Sunday = 6; a weekend start begins from the next Monday
+    weekday = start_date.weekday()
+    if weekday >= 5:
+        start_date += timedelta(days=7 - weekday)
+        weekday = 0
 
-    return business_days
+    # Business day n (counted from the Monday of start_date's week) is
+    # n // 5 whole weeks plus n % 5 days after that Monday
+    monday = start_date - timedelta(days=weekday)
+    return [
+        monday + timedelta(days=7 * (n // 5) + n % 5)
+        for n in range(weekday, weekday + count)
+    ]
 
 
 def normalize_day_name(day_name: str) -> Tuple[str, int]:
@@ -65,28 +91,21 @@ def normalize_day_name(day_name: str) -> Tuple[str, int]:
     if not day_name:
         return ("", 1)
 
-    day_map = {
-        "mon": "Monday",
-        "tue": "Tuesday",
-        "wed": "Wednesday",
-        "thu": "Thursday",
-        "fri": "Friday",
-        "sat": "Saturday",
-        "sun": "Sunday",
-    }
-
-    # Check for week 2 indicator
+    # Plain full day names need no further work
+    if day_name in _WEEKDAY_SET:
+        return (day_name, 1)
+
+    # Check for week 2 indicator, removing it in the same pass
+    day_lower, week_two_matches = _WEEK_TWO_RE.subn("", day_name.lower().strip())
     week = 1
-    day_lower = day_name.lower().strip()
-    if "w2" in day_lower or "week 2" in day_lower or "week2" in day_lower:
+    if week_two_matches:
         week = 2
-        # Remove week indicator
-        day_lower = day_lower.replace("week 2", "").replace("week2", "").replace("w2", "").strip()
+        day_lower = day_lower.strip()
 
     # Handle short forms
     short = day_lower[:3]
-    if short in day_map:
-        return (day_map[short], week)
+    if short in _DAY_ABBR_TO_NAME:
+        return (_DAY_ABBR_TO_NAME[short], week)
 
     # Handle full names
     return (day_name.split()[0].title(), week)
@@ -95,29 +114,33 @@ def normalize_day_name(day_name: str) -> Tuple[str, int]:
 class ScheduleBuilder:
     """Builds schedule response from Excel delivery data."""
 
+    __slots__ = ("truck1_capacity", "truck2_capacity", "_empty_schedules")
+
     def __init__(self):
         """Initialize the schedule builder."""
         self.truck1_capacity = TRUCK1_CAPACITY
         self.truck2_capacity = TRUCK2_CAPACITY
+        # (start date, truck capacities) -> empty schedule, oldest first
+        self._empty_schedules: Dict[Tuple[date, int, int], ScheduleResponse] = {}
 
-    def _create_date_to_day_map(self, business_days: List[date]) -> Dict[str, date]:
+    @staticmethod
+    def _create_date_to_day_map(business_days: List[date]) -> Dict[str, date]:
         """Create a mapping from day names to dates.
 
         For each business day, maps its weekday name to its date.
         If there are multiple dates with the same weekday (e.g., two Mondays),
         the first one in Week 1 takes priority.
         """
-        day_map = {}
+        day_map: Dict[str, date] = {}
 
         for d in business_days:
-            day_name = d.strftime("%A")
-            if day_name not in day_map:
-                day_map[day_name] = d
+            # Keeps the earliest date for each weekday in a single lookup
+            day_map.setdefault(_WEEKDAYS[d.weekday()], d)
 
         return day_map
 
+    @staticmethod
     def _group_deliveries_by_date(
-        self,
         deliveries: List[ExcelDeliveryRow],
         business_days: List[date],
     ) -> Dict[date, List[ExcelDeliveryRow]]:
@@ -134,17 +157,14 @@ class ScheduleBuilder:
         Returns:
             Dictionary mapping dates to lists of deliveries.
         """
-        # Initialize all dates with empty lists
-        grouped: Dict[date, List[ExcelDeliveryRow]] = {d: [] for d in business_days}
-        business_days_set = set(business_days)
+        # Bucket per business day, by position in business_days
+        by_index: List[List[ExcelDeliveryRow]] = [[] for _ in business_days]
+        date_to_index = {d: i for i, d in enumerate(business_days)}
 
-        # Create day name to date mapping for fallback (supports Week 1 and Week 2)
-        day_to_dates = {}
-        for d in business_days:
-            day_name = d.strftime("%A")
-            if day_name not in day_to_dates:
-                day_to_dates[day_name] = []
-            day_to_dates[day_name].append(d)
+        # Weekday number to business day positions for fallback (supports Week 1 and Week 2)
+        weekday_to_indices: List[List[int]] = [[] for _ in _WEEKDAYS]
+        for i, d in enumerate(business_days):
+            weekday_to_indices[d.weekday()].append(i)
 
         for delivery in deliveries:
             # Try to get actual date from week_start_date
@@ -152,35 +172,35 @@ class ScheduleBuilder:
 
             if actual_date:
                 # Week start date is set - use strict date matching only
-                if actual_date in business_days_set:
-                    grouped[actual_date].append(delivery)
-                    logger.debug(f"Mapped '{delivery.day}' to {actual_date} using week_start_date")
+                index = date_to_index.get(actual_date)
+                if index is not None:
+                    by_index[index].append(delivery)
+                    logger.debug("Mapped '%s' to %s using week_start_date", delivery.day, actual_date)
                 else:
                     # Delivery is outside the business days window - skip it
-                    logger.debug(f"Skipping delivery '{delivery.suburb}' on {actual_date} - outside 10-day window")
+                    logger.debug("Skipping delivery '%s' on %s - outside 10-day window", delivery.suburb, actual_date)
             else:
                 # No week_start_date - use fallback day name matching (legacy behavior)
                 normalized_day, week = normalize_day_name(delivery.day)
-                dates_for_day = day_to_dates.get(normalized_day, [])
+                weekday = _WEEKDAY_INDEX.get(normalized_day)
+                indices_for_day = weekday_to_indices[weekday] if weekday is not None else []
 
-                if dates_for_day:
+                if indices_for_day:
                     # Assign to Week 1 (index 0) or Week 2 (index 1)
                     week_index = week - 1  # Convert to 0-based index
-                    if week_index < len(dates_for_day):
-                        target_date = dates_for_day[week_index]
-                        grouped[target_date].append(delivery)
+                    if week_index < len(indices_for_day):
+                        by_index[indices_for_day[week_index]].append(delivery)
                     else:
                         # Week 2 requested but only one occurrence - use first
-                        target_date = dates_for_day[0]
-                        grouped[target_date].append(delivery)
-                        logger.warning(f"Week {week} requested for '{delivery.day}' but only {len(dates_for_day)} occurrence(s) available")
+                        by_index[indices_for_day[0]].append(delivery)
+                        logger.warning(f"Week {week} requested for '{delivery.day}' but only {len(indices_for_day)} occurrence(s) available")
                 else:
                     logger.warning(f"No matching date for day '{delivery.day}'")
 
-        return grouped
+        return dict(zip(business_days, by_index))
 
+    @staticmethod
     def _build_truck_data(
-        self,
         deliveries: List[ExcelDeliveryRow],
         capacity: int,
         truck_name: str,
@@ -195,14 +215,19 @@ class ScheduleBuilder:
         Returns:
             TruckData with calculated totals.
         """
-        # Convert ExcelDeliveryRow to Delivery models WITH truck context
-        delivery_models = [d.to_delivery(truck=truck_name) for d in deliveries]
-
-        sqm_total = sum(d.sqm for d in delivery_models)
-        pallet_total = sum(d.pallets for d in delivery_models)
-        laying_cost_total = sum(d.laying_cost for d in delivery_models)
-        delivery_fee_total = sum(d.delivery_fee for d in delivery_models)
-        laying_fee_total = sum(d.laying_fee for d in delivery_models)
+        # Convert ExcelDeliveryRow to Delivery models WITH truck context.
+        # Totals are summed from the parsed rows' plain numeric fields in the
+        # same pass (a truck has at most six slots a day, so a plain loop
+        # beats any vectorized reduction here)
+        delivery_models = []
+        sqm_total = pallet_total = laying_cost_total = delivery_fee_total = laying_fee_total = 0.0
+        for row in deliveries:
+            delivery_models.append(row.to_delivery(truck=truck_name))
+            sqm_total += row.sqm_sold
+            pallet_total += row.pallets
+            laying_cost_total += row.laying_cost
+            delivery_fee_total += row.delivery_fee
+            laying_fee_total += row.laying_fee
         available_sqm = capacity - sqm_total  # Can be negative for overflow
 
         return TruckData(
@@ -234,8 +259,10 @@ class ScheduleBuilder:
         Returns:
             Complete ScheduleResponse with all days populated.
         """
+        # Read the clock once for both the default start date and generated_at
+        now = datetime.now(timezone.utc)
         if start_date is None:
-            start_date = get_australia_today()
+            start_date = now.astimezone(AUSTRALIA_TZ).date()
 
         # Generate 10 business days
         business_days = get_next_business_days(start_date, 10)
@@ -248,6 +275,7 @@ class ScheduleBuilder:
         days = []
         for i, day_date in enumerate(business_days):
             is_week_two = i >= 5  # Days 6-10 are week 2
+            day_of_week = _WEEKDAYS[day_date.weekday()]
 
             t1_data = self._build_truck_data(
                 t1_by_date.get(day_date, []),
@@ -262,8 +290,8 @@ class ScheduleBuilder:
 
             day_schedule = DaySchedule(
                 date=day_date,
-                day_name=format_display_date(day_date),
-                day_of_week=day_date.strftime('%A'),
+                day_name=format_display_date(day_date, day_of_week),
+                day_of_week=day_of_week,
                 is_week_two=is_week_two,
                 week_tab=get_week_tab_from_date(day_date),
                 truck1=t1_data,
@@ -273,7 +301,7 @@ class ScheduleBuilder:
 
         return ScheduleResponse(
             success=True,
-            generated_at=datetime.now(timezone.utc).isoformat(),
+            generated_at=now.isoformat(),
             source=source,
             days=days,
         )
@@ -284,9 +312,23 @@ class ScheduleBuilder:
     ) -> ScheduleResponse:
         """Build a schedule with no deliveries (all zeros).
 
-        Useful when OneDrive data is unavailable or empty.
+        Useful when OneDrive data is unavailable or empty. The result only
+        depends on the start date, so it is built once per date and later
+        calls just stamp a fresh generated_at on a copy.
         """
-        return self.build_schedule([], [], start_date)
+        now = datetime.now(timezone.utc)
+        if start_date is None:
+            start_date = now.astimezone(AUSTRALIA_TZ).date()
+
+        key = (start_date, self.truck1_capacity, self.truck2_capacity)
+        schedule = self._empty_schedules.get(key)
+        if schedule is None:
+            schedule = self.build_schedule([], [], start_date)
+            if len(self._empty_schedules) >= EMPTY_SCHEDULE_CACHE_SIZE:
+                del self._empty_schedules[next(iter(self._empty_schedules))]
+            self._empty_schedules[key] = schedule
+
+        return schedule.model_copy(update={"generated_at": now.isoformat()})
 
 
 # Global instance
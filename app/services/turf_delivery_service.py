@@ -8,16 +8,27 @@ This service handles:
 4. Deleting deliveries
 """
 
+import asyncio
 import logging
-import re
+import time
 from datetime import date, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
+from app.services import google_sheets_service as gss_module
 from app.services.google.sheets_client import GoogleSheetsClient
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Week tab list is re-read from the spreadsheet metadata at most this often
+AVAILABLE_WEEKS_TTL_SECONDS = 60
+
+# Month prefixes of week tab names
+_WEEK_MONTHS = frozenset(("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"))
+
+# Removes currency symbols and thousands separators in one pass
+_CURRENCY_STRIP = str.maketrans("", "", "$,")
+
 
 class TurfDeliveryService:
     """Service for turf delivery data operations."""
@@ -56,6 +67,9 @@ class TurfDeliveryService:
 
     SLOTS_PER_TRUCK = 6
 
+    # (day, truck, slot) -> 1-indexed row of a week tab, filled in below the class
+    ROW_NUMBERS: Dict[Tuple[str, str, int], int] = {}
+
     # Column mapping (0-indexed for API)
     COLUMNS = {
         "slot": 0,           # A
@@ -83,6 +97,8 @@ class TurfDeliveryService:
         self._client: Optional[GoogleSheetsClient] = None
         self._service = None
         self._spreadsheet_id = settings.google_spreadsheet_id if hasattr(settings, 'google_spreadsheet_id') else None
+        # (fetched_at monotonic time, week tabs) from the last metadata read
+        self._weeks_cache: Optional[Tuple[float, List[str]]] = None
 
     def _get_service(self):
         """Lazy initialization of sheets service."""
@@ -99,6 +115,18 @@ class TurfDeliveryService:
             self._client.reset_service()
         logger.info("TurfDeliveryService: service reset for re-authentication")
 
+    async def _execute(self, request: Any) -> Dict:
+        """
+        Execute a googleapiclient request in a worker thread.
+
+        Keeps the blocking HTTP call off the event loop. Each worker thread
+        uses its own authorized transport, as httplib2 connections are not
+        thread-safe.
+        """
+        return await asyncio.to_thread(
+            lambda: request.execute(http=self._client._get_http())
+        )
+
     def _get_spreadsheet_id(self):
         """Get the turf supply spreadsheet ID."""
         if self._spreadsheet_id is None:
@@ -126,38 +154,87 @@ class TurfDeliveryService:
         Returns:
             Row number (1-indexed)
         """
-        day_base = self.DAY_HEADER_ROWS[day]
-        truck_offset = self.TRUCK_SLOT_OFFSETS[truck]
-        return day_base + truck_offset + (slot - 1)
+        return self.ROW_NUMBERS[(day, truck, slot)]
 
     async def get_available_weeks(self) -> List[str]:
-        """Get list of available week tabs."""
+        """
+        Get list of available week tabs.
+
+        The list is cached for AVAILABLE_WEEKS_TTL_SECONDS so repeated edits
+        don't each re-read the spreadsheet metadata.
+        """
+        if self._weeks_cache is not None:
+            fetched_at, weeks = self._weeks_cache
+            if time.monotonic() - fetched_at < AVAILABLE_WEEKS_TTL_SECONDS:
+                return list(weeks)
+
         service = self._get_service()
         spreadsheet_id = self._get_spreadsheet_id()
 
-        spreadsheet = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+        spreadsheet = await self._execute(service.spreadsheets().get(spreadsheetId=spreadsheet_id))
         sheets = spreadsheet.get('sheets', [])
 
-        week_pattern = re.compile(r'^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)-\d{2}$')
         week_tabs = []
-
         for sheet in sheets:
             title = sheet['properties']['title']
-            if week_pattern.match(title):
+            # "Mon-DD" tabs, e.g. "Jan-05"
+            if len(title) == 6 and title[3] == '-' and title[:3] in _WEEK_MONTHS and title[4:].isdecimal():
                 week_tabs.append(title)
 
-        return sorted(week_tabs)
+        week_tabs.sort()
+        self._weeks_cache = (time.monotonic(), week_tabs)
+        return list(week_tabs)
+
+    def _invalidate_weeks_cache(self) -> None:
+        """Forget the cached week tabs, e.g. after a write failed because a tab changed."""
+        self._weeks_cache = None
+
+    async def _week_tab_exists(self, week_tab: str) -> bool:
+        """
+        Check whether a week tab exists.
+
+        On a miss the cached tab list is dropped and read once more, so a
+        tab created since the list was cached is not reported as missing.
+        """
+        if week_tab in await self.get_available_weeks():
+            return True
+        self._invalidate_weeks_cache()
+        return week_tab in await self.get_available_weeks()
+
+    async def _is_slot_occupied(self, week_tab: str, row_number: int) -> bool:
+        """Check whether a slot row already has a variety set.
 
-    def parse_currency(self, value: str) -> float:
+        Reads column B for every slot of the week in one request. The read
+        is always fresh - another worker or staff editing the sheet may have
+        filled the slot moments ago.
+        """
+        last_row = self.calculate_row_number(self.DAYS[-1], self.TRUCKS[-1], self.SLOTS_PER_TRUCK)
+        result = await self._execute(self._get_service().spreadsheets().values().get(
+            spreadsheetId=self._get_spreadsheet_id(),
+            range=f"'{week_tab}'!B1:B{last_row}"
+        ))
+
+        rows = result.get('values', [])
+        if row_number - 1 < len(rows) and rows[row_number - 1]:
+            variety = rows[row_number - 1][0]
+            return bool(variety and str(variety).strip())
+        return False
+
+    def parse_currency(self, value: Any) -> float:
         """Parse currency string to float."""
         if not value:
             return 0.0
-        try:
-            # Remove currency symbols and commas
-            clean_value = str(value).replace('$', '').replace(',', '').strip()
-            return float(clean_value) if clean_value else 0.0
-        except (ValueError, AttributeError):
-            return 0.0
+        # Numeric cells come back from the API as numbers already
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, str):
+            # float() itself ignores surrounding whitespace
+            clean_value = value.translate(_CURRENCY_STRIP)
+            try:
+                return float(clean_value)
+            except ValueError:
+                return 0.0
+        return 0.0
 
     def _parse_row_to_delivery(self, row: List[Any], slot: int, row_number: int) -> Dict:
         """Parse a single row into a delivery dict."""
@@ -167,14 +244,17 @@ class TurfDeliveryService:
                 return str(val) if val is not None else default
             return default
 
+        def raw_get(idx: int) -> Any:
+            return row[idx] if idx < len(row) else None
+
         return {
             "slot": slot,
             "row_number": row_number,
             "variety": safe_get(self.COLUMNS["variety"]),
             "suburb": safe_get(self.COLUMNS["suburb"]),
             "service_type": safe_get(self.COLUMNS["service_type"]),
-            "sqm_sold": self.parse_currency(safe_get(self.COLUMNS["sqm_sold"])),
-            "pallets": self.parse_currency(safe_get(self.COLUMNS["pallets"])),
+            "sqm_sold": self.parse_currency(raw_get(self.COLUMNS["sqm_sold"])),
+            "pallets": self.parse_currency(raw_get(self.COLUMNS["pallets"])),
             "payment_status": safe_get(self.COLUMNS["payment_status"])
         }
 
@@ -199,8 +279,7 @@ class TurfDeliveryService:
             spreadsheet_id = self._get_spreadsheet_id()
 
             # Check if week tab exists
-            available_weeks = await self.get_available_weeks()
-            if week_tab not in available_weeks:
+            if not await self._week_tab_exists(week_tab):
                 return {
                     "success": False,
                     "error": f"Week tab '{week_tab}' not found",
@@ -210,19 +289,18 @@ class TurfDeliveryService:
             # Update the cell
             range_notation = f"'{week_tab}'!{column}{row_number}"
 
-            result = service.spreadsheets().values().update(
+            result = await self._execute(service.spreadsheets().values().update(
                 spreadsheetId=spreadsheet_id,
                 range=range_notation,
                 valueInputOption="USER_ENTERED",
                 body={"values": [[value]]}
-            ).execute()
+            ))
 
             logger.info(f"Updated {week_tab}!{column}{row_number} = {value}")
 
             # Clear cache so next read gets fresh data
             try:
-                import app.services.google_sheets_service as gss_module
-                gss_module.google_sheets_service.clear_cache()
+                await gss_module.google_sheets_service.clear_cache()
             except Exception as cache_error:
                 logger.warning(f"Error clearing cache: {cache_error}")
 
@@ -238,6 +316,7 @@ class TurfDeliveryService:
 
         except Exception as e:
             logger.error(f"Error updating delivery field: {e}")
+            self._invalidate_weeks_cache()
             if "401" in str(e) or "expired" in str(e).lower() or "credentials" in str(e).lower():
                 self._reset_service()
             return {
@@ -290,8 +369,7 @@ class TurfDeliveryService:
             row_number = self.calculate_row_number(day, truck, slot)
 
             # Check if week tab exists
-            available_weeks = await self.get_available_weeks()
-            if week_tab not in available_weeks:
+            if not await self._week_tab_exists(week_tab):
                 return {
                     "success": False,
                     "error": f"Week tab '{week_tab}' not found",
@@ -299,21 +377,12 @@ class TurfDeliveryService:
                 }
 
             # Check if slot is already occupied
-            check_range = f"'{week_tab}'!B{row_number}"
-            check_result = service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=check_range
-            ).execute()
-
-            existing_values = check_result.get('values', [])
-            if existing_values and len(existing_values) > 0 and len(existing_values[0]) > 0:
-                existing_variety = existing_values[0][0]
-                if existing_variety and existing_variety.strip():
-                    return {
-                        "success": False,
-                        "error": f"Slot is already occupied",
-                        "error_code": 409
-                    }
+            if await self._is_slot_occupied(week_tab, row_number):
+                return {
+                    "success": False,
+                    "error": f"Slot is already occupied",
+                    "error_code": 409
+                }
 
             # Prepare data to write
             # Columns: A=slot, B=variety, C=suburb, D=service_type, E=sqm_sold, F-H=formulas, I=delivery_fee, J=laying_fee, K-O=formulas, P=payment_status
@@ -326,35 +395,26 @@ class TurfDeliveryService:
                 # F-H are formulas (pallets, pricing) - don't overwrite
             ]
 
-            # Write columns A-E first
-            range_notation = f"'{week_tab}'!A{row_number}:E{row_number}"
+            # Columns A-E, plus delivery_fee and laying_fee (columns I and J) if
+            # provided - I and J hold formulas otherwise, so they're only
+            # written when set. Both ranges go in one batchUpdate request.
+            data = [{"range": f"'{week_tab}'!A{row_number}:E{row_number}", "values": [row_values]}]
+            if delivery_fee or laying_fee:
+                data.append({
+                    "range": f"'{week_tab}'!I{row_number}:J{row_number}",
+                    "values": [[delivery_fee or "", laying_fee or ""]]
+                })
 
-            service.spreadsheets().values().update(
+            await self._execute(service.spreadsheets().values().batchUpdate(
                 spreadsheetId=spreadsheet_id,
-                range=range_notation,
-                valueInputOption="USER_ENTERED",
-                body={"values": [row_values]}
-            ).execute()
-
-            # Write delivery_fee and laying_fee (columns I and J) if provided
-            if delivery_fee or laying_fee:
-                fee_range = f"'{week_tab}'!I{row_number}:J{row_number}"
-                fee_values = [[delivery_fee or "", laying_fee or ""]]
-                service.spreadsheets().values().update(
-                    spreadsheetId=spreadsheet_id,
-                    range=fee_range,
-                    valueInputOption="USER_ENTERED",
-                    body={"values": fee_values}
-                ).execute()
+                body={"valueInputOption": "USER_ENTERED", "data": data}
+            ))
 
             logger.info(f"Created delivery: {week_tab} {day} {truck} Slot {slot}")
 
             # Clear cache after successful create
             try:
-                logger.debug("DEBUG CREATE: Clearing cache after successful create")
-                import app.services.google_sheets_service as gss_module
-                gss_module.google_sheets_service.clear_cache()
-                logger.debug("DEBUG CREATE: Cache cleared successfully")
+                await gss_module.google_sheets_service.clear_cache()
             except Exception as cache_error:
                 logger.warning(f"Failed to clear cache after create: {cache_error}")
 
@@ -380,6 +440,7 @@ class TurfDeliveryService:
 
         except Exception as e:
             logger.error(f"Error creating delivery: {e}")
+            self._invalidate_weeks_cache()
             if "401" in str(e) or "expired" in str(e).lower() or "credentials" in str(e).lower():
                 self._reset_service()
             return {
@@ -435,8 +496,7 @@ class TurfDeliveryService:
             spreadsheet_id = self._get_spreadsheet_id()
 
             # Check if week tab exists
-            available_weeks = await self.get_available_weeks()
-            if week_tab not in available_weeks:
+            if not await self._week_tab_exists(week_tab):
                 return {
                     "success": False,
                     "error": f"Week tab '{week_tab}' not found",
@@ -449,25 +509,21 @@ class TurfDeliveryService:
 
             range_notation = f"'{week_tab}'!B{row_number}:P{row_number}"
 
-            logger.debug(f"DEBUG DELETE: week_tab={week_tab}, row={row_number}")
-            logger.debug(f"DEBUG DELETE: range_notation={range_notation}")
+            logger.debug("Clearing delivery row %s in %s (%s)", row_number, week_tab, range_notation)
 
-            result = service.spreadsheets().values().update(
+            result = await self._execute(service.spreadsheets().values().update(
                 spreadsheetId=spreadsheet_id,
                 range=range_notation,
                 valueInputOption="USER_ENTERED",
                 body={"values": [empty_row]}
-            ).execute()
+            ))
 
-            logger.debug(f"DEBUG DELETE: Google Sheets API response={result}")
+            logger.debug("Sheets API response for delete: %s", result)
             logger.info(f"Deleted delivery at row {row_number} in {week_tab}")
 
             # Clear cache after successful delete
             try:
-                logger.debug("DEBUG DELETE: Clearing cache after successful delete")
-                import app.services.google_sheets_service as gss_module
-                gss_module.google_sheets_service.clear_cache()
-                logger.debug("DEBUG DELETE: Cache cleared successfully")
+                await gss_module.google_sheets_service.clear_cache()
             except Exception as cache_error:
                 logger.warning(f"Failed to clear cache after delete: {cache_error}")
 
@@ -479,6 +535,7 @@ class TurfDeliveryService:
 
         except Exception as e:
             logger.error(f"Error deleting delivery: {e}")
+            self._invalidate_weeks_cache()
             if "401" in str(e) or "expired" in str(e).lower() or "credentials" in str(e).lower():
                 self._reset_service()
             return {
@@ -534,8 +591,7 @@ class TurfDeliveryService:
                 }
 
             # Check if week tab exists
-            available_weeks = await self.get_available_weeks()
-            if week_tab not in available_weeks:
+            if not await self._week_tab_exists(week_tab):
                 return {
                     "success": False,
                     "error": f"Week tab '{week_tab}' not found",
@@ -543,28 +599,19 @@ class TurfDeliveryService:
                 }
 
             # Check if destination slot is empty
-            dest_range = f"'{week_tab}'!B{to_row}"
-            dest_result = service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=dest_range
-            ).execute()
-
-            dest_values = dest_result.get('values', [])
-            if dest_values and len(dest_values) > 0 and len(dest_values[0]) > 0:
-                dest_variety = dest_values[0][0]
-                if dest_variety and dest_variety.strip():
-                    return {
-                        "success": False,
-                        "error": "Destination slot is already occupied",
-                        "error_code": 409
-                    }
+            if await self._is_slot_occupied(week_tab, to_row):
+                return {
+                    "success": False,
+                    "error": "Destination slot is already occupied",
+                    "error_code": 409
+                }
 
             # Read source data (columns B-P: variety through payment_status)
             source_range = f"'{week_tab}'!B{from_row}:P{from_row}"
-            source_result = service.spreadsheets().values().get(
+            source_result = await self._execute(service.spreadsheets().values().get(
                 spreadsheetId=spreadsheet_id,
                 range=source_range
-            ).execute()
+            ))
 
             source_values = source_result.get('values', [])
             if not source_values or len(source_values) == 0:
@@ -577,40 +624,37 @@ class TurfDeliveryService:
             # Copy source data to destination
             # Update slot number in column A first
             slot_range = f"'{week_tab}'!A{to_row}"
-            service.spreadsheets().values().update(
+            await self._execute(service.spreadsheets().values().update(
                 spreadsheetId=spreadsheet_id,
                 range=slot_range,
                 valueInputOption="USER_ENTERED",
                 body={"values": [[str(to_slot)]]}
-            ).execute()
+            ))
 
             # Copy data columns B-P
             dest_range = f"'{week_tab}'!B{to_row}:P{to_row}"
-            service.spreadsheets().values().update(
+            await self._execute(service.spreadsheets().values().update(
                 spreadsheetId=spreadsheet_id,
                 range=dest_range,
                 valueInputOption="USER_ENTERED",
                 body={"values": source_values}
-            ).execute()
+            ))
 
             # Clear source row (columns B-P)
             empty_row = [""] * 15
             source_clear_range = f"'{week_tab}'!B{from_row}:P{from_row}"
-            service.spreadsheets().values().update(
+            await self._execute(service.spreadsheets().values().update(
                 spreadsheetId=spreadsheet_id,
                 range=source_clear_range,
                 valueInputOption="USER_ENTERED",
                 body={"values": [empty_row]}
-            ).execute()
+            ))
 
             logger.info(f"Moved delivery from row {from_row} to row {to_row} ({to_day} {to_truck} Slot {to_slot})")
 
             # Clear cache after successful move
             try:
-                logger.debug("DEBUG MOVE: Clearing cache after successful move")
-                import app.services.google_sheets_service as gss_module
-                gss_module.google_sheets_service.clear_cache()
-                logger.debug("DEBUG MOVE: Cache cleared successfully")
+                await gss_module.google_sheets_service.clear_cache()
             except Exception as cache_error:
                 logger.warning(f"Failed to clear cache after move: {cache_error}")
 
@@ -626,6 +670,7 @@ class TurfDeliveryService:
 
         except Exception as e:
             logger.error(f"Error moving delivery: {e}")
+            self._invalidate_weeks_cache()
             if "401" in str(e) or "expired" in str(e).lower() or "credentials" in str(e).lower():
                 self._reset_service()
             return {
@@ -635,5 +680,12 @@ class TurfDeliveryService:
             }
 
 
+TurfDeliveryService.ROW_NUMBERS = {
+    (day, truck, slot): day_base + truck_offset + (slot - 1)
+    for day, day_base in TurfDeliveryService.DAY_HEADER_ROWS.items()
+    for truck, truck_offset in TurfDeliveryService.TRUCK_SLOT_OFFSETS.items()
+    for slot in range(1, TurfDeliveryService.SLOTS_PER_TRUCK + 1)
+}
+
 # Singleton instance
 turf_delivery_service = TurfDeliveryService()
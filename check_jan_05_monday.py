@@ -20,14 +20,15 @@ try:
 
         if data.get('success'):
             reps = data.get('reps', [])
-            total_appointments = sum(len([a for a in rep['appointments'] if a.get('lead_name')]) for rep in reps)
+            filled_by_rep = [
+                (rep['name'], sum(1 for a in rep['appointments'] if a.get('lead_name')))
+                for rep in reps
+            ]
+            total_appointments = sum(filled for _, filled in filled_by_rep)
             print(f"Total appointments across all reps: {total_appointments}")
 
-            for rep in reps:
-                rep_name = rep['name']
-                appointments = rep['appointments']
-                filled = [a for a in appointments if a.get('lead_name')]
-                print(f"  {rep_name}: {len(filled)} filled")
+            for rep_name, filled in filled_by_rep:
+                print(f"  {rep_name}: {filled} filled")
         else:
             print(f"Error: {data.get('error')}")
     else:
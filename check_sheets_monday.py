@@ -1,11 +1,14 @@
 import asyncio
-from app.services.google_sheets_service import GoogleSheetsService
+from app.services.google.sheets_client import GoogleSheetsClient
+from app.config import settings
+from sheets_cache import cached_values_get
 
 async def check_monday():
-    gs = GoogleSheetsService()
+    service = GoogleSheetsClient()._ensure_service()
 
     # Read the Jan-12 week tab
-    data = await gs.read_week_tab('Jan-12')
+    result = cached_values_get(service, settings.sales_spreadsheet_id, "'Jan-12'!A1:R200")
+    data = result.get('values', [])
 
     print(f'Total rows in Jan-12 tab: {len(data)}')
     print()
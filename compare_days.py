@@ -2,6 +2,7 @@
 import asyncio
 from app.services.google.sheets_client import GoogleSheetsClient
 from app.config import settings
+from sheets_cache import cached_values_get
 
 async def compare():
     client = GoogleSheetsClient()
@@ -9,10 +10,7 @@ async def compare():
 
     # Read Jan-12 tab
     range_name = 'Jan-12!A1:R200'
-    result = service.spreadsheets().values().get(
-        spreadsheetId=settings.sales_spreadsheet_id,
-        range=range_name
-    ).execute()
+    result = cached_values_get(service, settings.sales_spreadsheet_id, range_name)
 
     values = result.get('values', [])
 
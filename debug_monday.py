@@ -3,6 +3,7 @@ import asyncio
 from datetime import date
 from app.services.google.sheets_client import GoogleSheetsClient
 from app.config import settings
+from sheets_cache import cached_values_get
 
 async def debug_monday():
     client = GoogleSheetsClient()
@@ -31,10 +32,7 @@ async def debug_monday():
     print()
 
     # Fetch data
-    result = service.spreadsheets().values().get(
-        spreadsheetId=settings.sales_spreadsheet_id,
-        range=range_notation
-    ).execute()
+    result = cached_values_get(service, settings.sales_spreadsheet_id, range_notation)
 
     all_rows = result.get('values', [])
     print(f"Total rows fetched: {len(all_rows)}")
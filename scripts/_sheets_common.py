@@ -0,0 +1,63 @@
+"""
+Shared Google Sheets setup for the maintenance scripts.
+
+Scripts import this as `from _sheets_common import get_service, get_week_tabs`
+when run as `python scripts/<name>.py`. Within one process the service and
+the week tab list are built once, so steps chained from a single runner
+share credentials and the same keep-alive connection.
+"""
+import os
+import re
+import sys
+from functools import lru_cache
+from typing import List
+
+# Make the app package importable when run from the scripts directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httplib2
+from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build
+
+from app.config import settings
+
+SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+
+# Seconds before a Sheets request on the shared connection gives up
+HTTP_TIMEOUT_SECONDS = 30
+
+# Weekly tabs are named after their Monday, e.g. 'Jan-05'
+WEEK_PATTERN = re.compile(r'^[A-Z][a-z]{2}-\d{2}$')
+
+
+@lru_cache(maxsize=1)
+def get_service():
+    """Build the Sheets API service once per process."""
+    service_account_info = settings.google_service_account_info
+    if not service_account_info:
+        raise ValueError("GOOGLE_SERVICE_ACCOUNT_JSON is missing or not valid JSON")
+
+    credentials = service_account.Credentials.from_service_account_info(
+        service_account_info,
+        scopes=SCOPES
+    )
+    # One keep-alive transport for every request; the discovery document ships with the client
+    http = AuthorizedHttp(credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT_SECONDS))
+    return build('sheets', 'v4', http=http, static_discovery=True)
+
+
+@lru_cache(maxsize=None)
+def get_week_tabs(spreadsheet_id: str) -> List[str]:
+    """Get all week tab names in a spreadsheet, sorted."""
+    # Only the tab titles are needed, not the full spreadsheet metadata
+    spreadsheet = get_service().spreadsheets().get(
+        spreadsheetId=spreadsheet_id,
+        fields='sheets.properties.title'
+    ).execute()
+
+    return sorted(
+        title
+        for sheet in spreadsheet.get('sheets', [])
+        if WEEK_PATTERN.match(title := sheet.get('properties', {}).get('title', ''))
+    )
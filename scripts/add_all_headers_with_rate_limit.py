@@ -5,17 +5,15 @@ This script will:
 1. Find all week tabs (Mon-DD format)
 2. Locate the header row for each rep section
 3. Add missing headers for columns J-R (including Paid/Unpaid)
-4. Use rate limiting to avoid quota errors
+4. Pace requests with an AIMD limiter to avoid quota errors
 
 Usage:
     python scripts/add_all_headers_with_rate_limit.py --yes
 """
 import sys
-import json
-import re
 import time
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from _sheets_common import get_service, get_week_tabs
 from app.config import settings
 
 # Fix encoding for Windows console
@@ -37,43 +35,69 @@ HEADERS = {
 }
 
 
-def get_service():
-    """Initialize and return Google Sheets service."""
-    service_account_info = settings.google_service_account_json
-    if hasattr(service_account_info, 'get_secret_value'):
-        service_account_info = service_account_info.get_secret_value()
-    if isinstance(service_account_info, str):
-        service_account_info = json.loads(service_account_info)
-
-    credentials = service_account.Credentials.from_service_account_info(
-        service_account_info,
-        scopes=['https://www.googleapis.com/auth/spreadsheets']
-    )
-    return build('sheets', 'v4', credentials=credentials)
-
-
-def get_week_tabs(service, spreadsheet_id):
-    """Get all week tab names sorted chronologically."""
-    spreadsheet = service.spreadsheets().get(
-        spreadsheetId=spreadsheet_id
-    ).execute()
-
-    sheets = spreadsheet.get('sheets', [])
-    week_pattern = re.compile(r'^[A-Z][a-z]{2}-\d{2}$')
-
-    week_tabs = []
-    for sheet in sheets:
-        title = sheet.get('properties', {}).get('title', '')
-        if week_pattern.match(title):
-            week_tabs.append(title)
-
-    return sorted(week_tabs)
+class AIMDLimiter:
+    """Paces Sheets requests with additive-increase/multiplicative-decrease.
+
+    The request rate creeps up while calls succeed quickly and halves on a
+    429 or a slow response, so the script runs close to the real quota
+    instead of a fixed ceiling with a 60 second penalty sleep.
+    """
+
+    def __init__(self, rate=55.0, min_rate=5.0, max_rate=60.0, increase=1.0,
+                 target_latency=0.8, max_attempts=5):
+        self.rate = rate  # requests per minute
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.target_latency = target_latency
+        self.max_attempts = max_attempts
+        self._next_request = 0.0
+
+    def acquire(self):
+        """Sleep until the current rate allows another request."""
+        wait = self._next_request - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._next_request = time.monotonic() + 60 / self.rate
+
+    def on_success(self, latency):
+        """Speed up after a fast response, back off after a slow one."""
+        if latency > self.target_latency:
+            self.rate = max(self.min_rate, self.rate * 0.5)
+        else:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self, retry_after=None):
+        """Halve the rate and honour the server's Retry-After if it sent one."""
+        self.rate = max(self.min_rate, self.rate * 0.5)
+        delay = float(retry_after) if retry_after else 60 / self.rate
+        print(f"  ⏸ Rate limited, slowing to {self.rate:.0f}/min and waiting {delay:.0f}s...")
+        self._next_request = time.monotonic() + delay
+
+    def call(self, fn):
+        """Run fn under the limiter, retrying 429 responses."""
+        for attempt in range(1, self.max_attempts + 1):
+            self.acquire()
+            started = time.monotonic()
+            try:
+                result = fn()
+            except HttpError as e:
+                if e.resp.status != 429 or attempt == self.max_attempts:
+                    raise
+                self.on_throttle(e.resp.get('retry-after'))
+                continue
+            self.on_success(time.monotonic() - started)
+            return result
 
 
 def find_header_rows(service, spreadsheet_id, week_tab):
-    """Find all header rows in a week tab (one per rep per day)."""
-    # Read first 150 rows to cover all reps across all days
-    range_name = f"'{week_tab}'!A1:I150"
+    """Find all header rows in a week tab (one per rep per day).
+
+    Returns (row_number, row_values) pairs so headers J-R can be checked
+    without reading each row again.
+    """
+    # Read first 150 rows to cover all reps across all days, through column R
+    range_name = f"'{week_tab}'!A1:R150"
     result = service.spreadsheets().values().get(
         spreadsheetId=spreadsheet_id,
         range=range_name
@@ -84,29 +108,11 @@ def find_header_rows(service, spreadsheet_id, week_tab):
 
     for i, row in enumerate(values, 1):
         if len(row) > 0 and row[0] == 'Slot':
-            header_rows.append(i)
+            header_rows.append((i, row))
 
     return header_rows
 
 
-def check_missing_headers(service, spreadsheet_id, week_tab, row_number):
-    """Check which headers are missing in a specific row."""
-    range_name = f"'{week_tab}'!J{row_number}:R{row_number}"
-    result = service.spreadsheets().values().get(
-        spreadsheetId=spreadsheet_id,
-        range=range_name
-    ).execute()
-
-    existing_values = result.get('values', [[]])[0] if result.get('values') else []
-
-    missing_headers = {}
-    for i, (col_letter, header_text) in enumerate(HEADERS.items()):
-        if i >= len(existing_values) or not existing_values[i]:
-            missing_headers[col_letter] = header_text
-
-    return missing_headers
-
-
 def add_headers_to_row(service, spreadsheet_id, week_tab, row_number, headers_to_add):
     """Add specific missing headers to a row."""
     if not headers_to_add:
@@ -126,17 +132,11 @@ def add_headers_to_row(service, spreadsheet_id, week_tab, row_number, headers_to
         'data': updates
     }
 
-    try:
-        service.spreadsheets().values().batchUpdate(
-            spreadsheetId=spreadsheet_id,
-            body=body
-        ).execute()
-        return True
-    except Exception as e:
-        if '429' in str(e):
-            # Rate limit error
-            return False
-        raise
+    service.spreadsheets().values().batchUpdate(
+        spreadsheetId=spreadsheet_id,
+        body=body
+    ).execute()
+    return True
 
 
 def main():
@@ -149,7 +149,7 @@ def main():
 
     # Get all week tabs
     print("\nFetching week tabs...")
-    week_tabs = get_week_tabs(service, spreadsheet_id)
+    week_tabs = get_week_tabs(spreadsheet_id)
     print(f"Found {len(week_tabs)} week tabs")
 
     # Ask for confirmation
@@ -171,15 +171,14 @@ def main():
 
     total_headers_added = 0
     total_rows_updated = 0
-    requests_this_minute = 0
-    minute_start_time = time.time()
+    limiter = AIMDLimiter()
 
     # Process each week tab
     for tab_idx, week_tab in enumerate(week_tabs, 1):
         print(f"\n[{tab_idx}/{len(week_tabs)}] Processing {week_tab}...")
 
         # Find header rows
-        header_rows = find_header_rows(service, spreadsheet_id, week_tab)
+        header_rows = limiter.call(lambda: find_header_rows(service, spreadsheet_id, week_tab))
         print(f"  Found {len(header_rows)} header rows")
 
         if not header_rows:
@@ -187,59 +186,32 @@ def main():
             continue
 
         # Add headers to each row
-        for row_num in header_rows:
-            # Rate limiting: max 55 requests per minute (leaving buffer)
-            if requests_this_minute >= 55:
-                elapsed = time.time() - minute_start_time
-                if elapsed < 60:
-                    wait_time = 60 - elapsed + 1
-                    print(f"  ⏸ Rate limit approaching, waiting {wait_time:.0f} seconds...")
-                    time.sleep(wait_time)
-                requests_this_minute = 0
-                minute_start_time = time.time()
-
-            # Check which headers are missing
-            missing_headers = check_missing_headers(service, spreadsheet_id, week_tab, row_num)
-            requests_this_minute += 1
+        for row_num, row_values in header_rows:
+            # Check which headers are missing from the already-read J-R cells
+            existing_values = row_values[9:18]
+            missing_headers = {
+                col_letter: header_text
+                for i, (col_letter, header_text) in enumerate(HEADERS.items())
+                if i >= len(existing_values) or not existing_values[i]
+            }
 
             if not missing_headers:
                 print(f"  ✓ Row {row_num}: All headers present")
                 continue
 
-            # Rate limit check before write
-            if requests_this_minute >= 55:
-                elapsed = time.time() - minute_start_time
-                if elapsed < 60:
-                    wait_time = 60 - elapsed + 1
-                    print(f"  ⏸ Rate limit approaching, waiting {wait_time:.0f} seconds...")
-                    time.sleep(wait_time)
-                requests_this_minute = 0
-                minute_start_time = time.time()
-
             # Add missing headers
-            success = add_headers_to_row(service, spreadsheet_id, week_tab, row_num, missing_headers)
-            requests_this_minute += 1
-
-            if success:
-                missing_cols = ', '.join(missing_headers.keys())
-                print(f"  ✓ Row {row_num}: Added {len(missing_headers)} headers ({missing_cols})")
-                total_headers_added += len(missing_headers)
-                total_rows_updated += 1
-            else:
-                print(f"  ✗ Row {row_num}: Rate limit hit, waiting 60s...")
-                time.sleep(60)
-                requests_this_minute = 0
-                minute_start_time = time.time()
-                # Retry
-                success = add_headers_to_row(service, spreadsheet_id, week_tab, row_num, missing_headers)
-                requests_this_minute += 1
-                if success:
-                    missing_cols = ', '.join(missing_headers.keys())
-                    print(f"  ✓ Row {row_num}: Added {len(missing_headers)} headers ({missing_cols}) [retry]")
-                    total_headers_added += len(missing_headers)
-                    total_rows_updated += 1
-                else:
-                    print(f"  ✗ Row {row_num}: Failed even after retry")
+            try:
+                limiter.call(lambda: add_headers_to_row(
+                    service, spreadsheet_id, week_tab, row_num, missing_headers
+                ))
+            except HttpError as e:
+                print(f"  ✗ Row {row_num}: Failed ({e.resp.status}): {e}")
+                continue
+
+            missing_cols = ', '.join(missing_headers.keys())
+            print(f"  ✓ Row {row_num}: Added {len(missing_headers)} headers ({missing_cols})")
+            total_headers_added += len(missing_headers)
+            total_rows_updated += 1
 
     print("\n" + "=" * 80)
     print(f"COMPLETE")
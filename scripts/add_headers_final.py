@@ -2,11 +2,8 @@
 Add missing column headers (J-R) efficiently with batched operations.
 """
 import sys
-import json
-import re
 import time
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from _sheets_common import get_service, get_week_tabs
 from app.config import settings
 
 if sys.platform == 'win32':
@@ -24,48 +21,21 @@ HEADERS = {
     'R': 'Paid/Unpaid'
 }
 
-def get_service():
-    service_account_info = settings.google_service_account_json
-    if hasattr(service_account_info, 'get_secret_value'):
-        service_account_info = service_account_info.get_secret_value()
-    if isinstance(service_account_info, str):
-        service_account_info = json.loads(service_account_info)
 
-    credentials = service_account.Credentials.from_service_account_info(
-        service_account_info,
-        scopes=['https://www.googleapis.com/auth/spreadsheets']
-    )
-    return build('sheets', 'v4', credentials=credentials)
-
-
-def get_week_tabs(service, spreadsheet_id):
-    spreadsheet = service.spreadsheets().get(
-        spreadsheetId=spreadsheet_id
+def read_week_tabs(service, spreadsheet_id, week_tabs):
+    """Read A1:R150 of every week tab in a single batchGet."""
+    result = service.spreadsheets().values().batchGet(
+        spreadsheetId=spreadsheet_id,
+        ranges=[f"'{week_tab}'!A1:R150" for week_tab in week_tabs],
+        majorDimension='ROWS'
     ).execute()
 
-    sheets = spreadsheet.get('sheets', [])
-    week_pattern = re.compile(r'^[A-Z][a-z]{2}-\d{2}$')
-
-    week_tabs = []
-    for sheet in sheets:
-        title = sheet.get('properties', {}).get('title', '')
-        if week_pattern.match(title):
-            week_tabs.append(title)
-
-    return sorted(week_tabs)
+    # valueRanges come back in the same order as the requested ranges
+    return [value_range.get('values', []) for value_range in result.get('valueRanges', [])]
 
 
-def process_week_tab(service, spreadsheet_id, week_tab):
-    """Process one week tab - find header rows and add missing headers."""
-
-    # Read entire tab up to column R and row 150
-    range_name = f"'{week_tab}'!A1:R150"
-    result = service.spreadsheets().values().get(
-        spreadsheetId=spreadsheet_id,
-        range=range_name
-    ).execute()
-
-    values = result.get('values', [])
+def find_missing_headers(week_tab, values):
+    """Find header rows in one tab's values and build updates for missing headers."""
 
     # Find header rows (rows where column A = "Slot")
     header_rows = []
@@ -73,9 +43,6 @@ def process_week_tab(service, spreadsheet_id, week_tab):
         if len(row) > 0 and row[0] == 'Slot':
             header_rows.append((i, row))
 
-    if not header_rows:
-        return 0, 0
-
     # Check which headers are missing and build updates
     updates = []
     rows_to_update = 0
@@ -97,18 +64,19 @@ def process_week_tab(service, spreadsheet_id, week_tab):
         if missing:
             rows_to_update += 1
 
-    # Perform batch update if there are missing headers
-    if updates:
-        body = {
-            'valueInputOption': 'RAW',
-            'data': updates
-        }
-        service.spreadsheets().values().batchUpdate(
-            spreadsheetId=spreadsheet_id,
-            body=body
-        ).execute()
+    return rows_to_update, updates
+
 
-    return rows_to_update, len(updates)
+def write_updates(service, spreadsheet_id, updates):
+    """Write every missing header in a single batchUpdate."""
+    body = {
+        'valueInputOption': 'RAW',
+        'data': updates
+    }
+    service.spreadsheets().values().batchUpdate(
+        spreadsheetId=spreadsheet_id,
+        body=body
+    ).execute()
 
 
 def main():
@@ -120,61 +88,45 @@ def main():
     spreadsheet_id = settings.sales_spreadsheet_id
 
     print("\nFetching week tabs...")
-    week_tabs = get_week_tabs(service, spreadsheet_id)
+    week_tabs = get_week_tabs(spreadsheet_id)
     print(f"Found {len(week_tabs)} week tabs\n")
 
+    if not week_tabs:
+        return
+
+    print("Reading all week tabs...")
+    tab_values = read_week_tabs(service, spreadsheet_id, week_tabs)
+
     total_rows_updated = 0
-    total_headers_added = 0
-    writes_this_minute = 0
-    minute_start = time.time()
+    all_updates = []
 
-    for idx, week_tab in enumerate(week_tabs, 1):
-        print(f"[{idx}/{len(week_tabs)}] {week_tab}...", end=' ', flush=True)
+    for idx, (week_tab, values) in enumerate(zip(week_tabs, tab_values), 1):
+        rows_updated, updates = find_missing_headers(week_tab, values)
+        all_updates.extend(updates)
 
-        try:
-            # Check rate limit (55 writes per minute with buffer)
-            if writes_this_minute >= 50:
-                elapsed = time.time() - minute_start
-                if elapsed < 60:
-                    wait = 61 - elapsed
-                    print(f"⏸ waiting {wait:.0f}s...", end=' ', flush=True)
-                    time.sleep(wait)
-                writes_this_minute = 0
-                minute_start = time.time()
-
-            rows_updated, headers_added = process_week_tab(service, spreadsheet_id, week_tab)
-            writes_this_minute += 1  # One write per tab (or zero if no updates)
-
-            if rows_updated > 0:
-                print(f"✓ Updated {rows_updated} rows, added {headers_added} headers")
-                total_rows_updated += rows_updated
-                total_headers_added += headers_added
-            else:
-                print("✓ Already complete")
+        if rows_updated > 0:
+            print(f"[{idx}/{len(week_tabs)}] {week_tab}... {rows_updated} rows, {len(updates)} headers missing")
+            total_rows_updated += rows_updated
+        else:
+            print(f"[{idx}/{len(week_tabs)}] {week_tab}... ✓ Already complete")
 
+    if all_updates:
+        print(f"\nWriting {len(all_updates)} headers...", end=' ', flush=True)
+        try:
+            write_updates(service, spreadsheet_id, all_updates)
+            print("✓")
         except Exception as e:
-            if '429' in str(e):
-                print("✗ Rate limit, waiting 60s...")
-                time.sleep(60)
-                writes_this_minute = 0
-                minute_start = time.time()
-                # Retry
-                try:
-                    rows_updated, headers_added = process_week_tab(service, spreadsheet_id, week_tab)
-                    writes_this_minute += 1
-                    if rows_updated > 0:
-                        print(f"  ✓ [Retry] Updated {rows_updated} rows, added {headers_added} headers")
-                        total_rows_updated += rows_updated
-                        total_headers_added += headers_added
-                except Exception as e2:
-                    print(f"  ✗ [Retry failed] {e2}")
-            else:
-                print(f"✗ Error: {e}")
+            if '429' not in str(e):
+                raise
+            print("✗ Rate limit, waiting 60s...")
+            time.sleep(60)
+            write_updates(service, spreadsheet_id, all_updates)
+            print("  ✓ [Retry] Written")
 
     print("\n" + "=" * 80)
     print("COMPLETE")
     print(f"  Rows updated: {total_rows_updated}")
-    print(f"  Headers added: {total_headers_added}")
+    print(f"  Headers added: {len(all_updates)}")
     print(f"  Tabs processed: {len(week_tabs)}")
     print("=" * 80)
 
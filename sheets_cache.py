@@ -0,0 +1,46 @@
+"""
+Short-lived on-disk cache of Sheets range reads for the debug/check scripts.
+
+Running several of these scripts back to back while debugging reads the
+same week tab over and over; cached reads skip the API round trip.
+"""
+import hashlib
+import json
+import os
+import time
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sheets")
+
+# Cached ranges older than this are read from the API again
+DEFAULT_TTL_SECONDS = 30
+
+
+def cached_values_get(service, spreadsheet_id, range_name, ttl=DEFAULT_TTL_SECONDS):
+    """values().get() through a per-(spreadsheet, range) JSON file cache.
+
+    The Sheets values API doesn't return ETags, so freshness is purely
+    the file's age. Pass ttl=0 to force a fresh read.
+    """
+    key = hashlib.sha1(f"{spreadsheet_id}\n{range_name}".encode()).hexdigest()
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    result = service.spreadsheets().values().get(
+        spreadsheetId=spreadsheet_id,
+        range=range_name
+    ).execute()
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # Write then rename so a concurrent script never reads a partial file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(result, f)
+    os.replace(tmp_path, path)
+
+    return result
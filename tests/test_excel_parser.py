@@ -0,0 +1,56 @@
+"""
+Tests for ExcelParser row parsing.
+
+Tests cover:
+1. Streaming parse matches the list-based parse
+2. Compact row layout
+"""
+import asyncio
+
+from app.services.excel.excel_parser import ExcelParser
+
+
+VALUES = [
+    ["Day", "Slot", "Variety", "Suburb", "Service", "SQM", "Pallets"],
+    ["Monday", 1, "Sir Walter", "Pimpama", "SL", 100, 2],
+    ["", "", "", "", "", "", ""],
+    ["Monday", 2, "Empire Zoysia", "Coomera", "xx", 50, 1],
+    ["Daily Total", "", "", "", "", 150, 3],
+    ["Tuesday", 1, "Sir Walter", "Ormeau", "SD", 0, 0],
+]
+
+
+async def batches(values, size):
+    """Yield values in fixed-size batches."""
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class TestParseRowsStream:
+    """Tests for parsing rows from streamed batches."""
+
+    def test_matches_parse_rows(self):
+        """Streaming in batches should produce the same rows as parse_rows."""
+        async def collect():
+            return [row async for row in ExcelParser.parse_rows_stream(batches(VALUES, 2))]
+
+        assert asyncio.run(collect()) == ExcelParser.parse_rows(VALUES)
+
+    def test_header_skipped_only_once(self):
+        """Only the very first row of the stream should be treated as a header."""
+        async def collect():
+            return [row async for row in ExcelParser.parse_rows_stream(batches(VALUES[1:], 1))]
+
+        rows = asyncio.run(collect())
+        assert [row.variety for row in rows] == ["Empire Zoysia"]
+        assert rows[0].service_type == "SD"
+
+
+class TestExcelDeliveryRow:
+    """Tests for the parsed row type."""
+
+    def test_rows_are_slotted(self):
+        """Rows should not carry a per-instance __dict__."""
+        row = ExcelParser.parse_rows(VALUES)[0]
+        assert not hasattr(row, "__dict__")
+        assert row.laying_cost == 220.0
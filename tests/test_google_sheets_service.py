@@ -0,0 +1,420 @@
+"""
+Tests for GoogleSheetsService caching and sheet-name helpers.
+
+Tests cover:
+1. Local TTL cache behaviour
+2. Shared Redis cache hit/miss/invalidation across workers, and its setup
+3. Cache entry expiry
+4. Concurrent weekly sheet reads
+5. Required weekly sheet calculation
+6. Sheet name to date parsing
+7. Background cache warming
+8. Dropping fetches that race a cache clear
+"""
+import asyncio
+import pickle
+import sys
+import threading
+import types
+from datetime import date
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.main import app, lifespan
+from app.services.cache import get_redis_cache
+from app.services.cache import redis_cache as redis_cache_module
+
+from app.services.google.exceptions import GoogleSheetsAPIError
+from app.services.google_sheets_service import (
+    CACHE_GENERATION_KEY,
+    CACHE_KEY_PREFIX,
+    CACHE_WARMER_LOCK_KEY,
+    LOCAL_CACHE_TTL_WITH_REDIS_SECONDS,
+    CacheEntry,
+    GoogleSheetsService,
+    get_required_week_sheets,
+    parse_sheet_name_to_date,
+)
+
+
+@pytest.fixture
+def service():
+    """Google Sheets service with an empty cache."""
+    svc = GoogleSheetsService()
+    svc._cache.clear()
+    yield svc
+    svc._cache.clear()
+
+
+class FakeRedisCache:
+    """In-memory stand-in for RedisCache that records which thread called it."""
+
+    def __init__(self):
+        self.store = {}
+        self.get_calls = 0
+        self.threads = set()
+
+    def get(self, key):
+        self.get_calls += 1
+        self.threads.add(threading.current_thread())
+        return self.store.get(key)
+
+    def setex(self, key, ttl_seconds, value):
+        self.threads.add(threading.current_thread())
+        self.store[key] = value
+
+    def set_if_absent(self, key, ttl_seconds, value):
+        if key in self.store:
+            return False
+        self.store[key] = value
+        return True
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1).encode()
+
+    def delete_prefix(self, prefix):
+        self.threads.add(threading.current_thread())
+        for key in [k for k in self.store if k.startswith(prefix)]:
+            del self.store[key]
+
+
+@pytest.fixture
+def fake_redis():
+    """Fake shared Redis cache patched into the service."""
+    redis_cache = FakeRedisCache()
+    with patch("app.services.google_sheets_service.get_redis_cache", return_value=redis_cache):
+        yield redis_cache
+
+
+class TestLocalCache:
+    """Tests for the in-process cache."""
+
+    def test_set_then_get(self, service):
+        """Cached data should be returned until it expires."""
+        with patch("app.services.google_sheets_service.get_redis_cache", return_value=None):
+            asyncio.run(service._set_cache("key", {"Truck 1": []}))
+            assert asyncio.run(service._get_from_cache("key")) == {"Truck 1": []}
+
+    def test_miss_returns_none(self, service):
+        """Unknown keys should return None."""
+        with patch("app.services.google_sheets_service.get_redis_cache", return_value=None):
+            assert asyncio.run(service._get_from_cache("missing")) is None
+
+    def test_cache_key_is_prefixed(self, service):
+        """Cache keys should share the weekly prefix used for clearing."""
+        assert service._get_cache_key("Jan-05").startswith(f"{CACHE_KEY_PREFIX}Jan-05")
+
+
+class TestRedisCache:
+    """Tests for the shared Redis cache layer."""
+
+    def test_hit_from_another_worker(self, service, fake_redis):
+        """Data cached by one worker should be read back by another."""
+        fake_redis.store["key"] = pickle.dumps({"Truck 1": ["row"]})
+        assert asyncio.run(service._get_from_cache("key")) == {"Truck 1": ["row"]}
+
+    def test_miss_returns_none(self, service, fake_redis):
+        """A key missing locally and in Redis should return None."""
+        assert asyncio.run(service._get_from_cache("missing")) is None
+        assert fake_redis.get_calls == 1
+
+    def test_set_writes_to_redis(self, service, fake_redis):
+        """Storing data should also write it to Redis."""
+        asyncio.run(service._set_cache("key", {"Truck 2": []}))
+        assert pickle.loads(fake_redis.store["key"]) == {"Truck 2": []}
+
+    def test_local_copy_is_checked_first(self, service, fake_redis):
+        """A fresh local copy should be served without a Redis round trip."""
+        fake_redis.store["key"] = pickle.dumps({"Truck 1": []})
+        asyncio.run(service._get_from_cache("key"))
+        asyncio.run(service._get_from_cache("key"))
+        assert fake_redis.get_calls == 1
+
+    def test_clear_from_another_worker_is_seen(self, service, fake_redis):
+        """Another worker's clear should be picked up once the short local TTL lapses."""
+        asyncio.run(service._set_cache("key", {"Truck 1": []}))
+        # What another worker's clear_cache() does to the shared cache
+        fake_redis.delete_prefix("")
+
+        entry = service._cache["key"]
+        with patch("app.services.google_sheets_service.time.monotonic",
+                   return_value=entry.created_at + LOCAL_CACHE_TTL_WITH_REDIS_SECONDS + 1):
+            assert asyncio.run(service._get_from_cache("key")) is None
+
+    def test_clear_cache_clears_local_and_redis(self, service, fake_redis):
+        """Clearing should drop local copies and shared weekly keys, and bump the generation."""
+        key = service._get_cache_key("Jan-05")
+        asyncio.run(service._set_cache(key, {"Truck 1": []}))
+        fake_redis.store["other"] = b"kept"
+
+        asyncio.run(service.clear_cache())
+
+        assert service._cache == {}
+        assert fake_redis.store == {"other": b"kept", CACHE_GENERATION_KEY: b"1"}
+
+    def test_redis_calls_run_off_the_event_loop(self, service, fake_redis):
+        """Blocking Redis calls should run in worker threads, not on the loop."""
+        asyncio.run(service._set_cache("key", {}))
+        service._cache.clear()
+        asyncio.run(service._get_from_cache("key"))
+        asyncio.run(service.clear_cache())
+        assert threading.main_thread() not in fake_redis.threads
+
+
+class TestGetRedisCache:
+    """Tests for setting up the shared Redis cache from REDIS_URL."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_module_state(self, monkeypatch):
+        """Start each test with no Redis client and REDIS_URL set."""
+        monkeypatch.setattr(redis_cache_module, "_redis_cache", None)
+        monkeypatch.setattr(redis_cache_module, "_redis_disabled", False)
+        monkeypatch.setattr(redis_cache_module.settings, "redis_url", "not a url")
+
+    @staticmethod
+    def fake_redis_module(from_url):
+        """Stand-in for the `redis` package with the given Redis.from_url."""
+        module = types.ModuleType("redis")
+        module.RedisError = type("RedisError", (Exception,), {})
+        module.Redis = MagicMock()
+        module.Redis.from_url.side_effect = from_url
+        return module
+
+    def test_malformed_url_falls_back_to_local_cache(self, monkeypatch):
+        """A bad REDIS_URL should disable Redis once instead of raising on every lookup."""
+        module = self.fake_redis_module(ValueError("Redis URL must specify a scheme"))
+        monkeypatch.setitem(sys.modules, "redis", module)
+
+        assert get_redis_cache() is None
+        assert get_redis_cache() is None
+        module.Redis.from_url.assert_called_once()
+
+    def test_redis_error_falls_back_to_local_cache(self, monkeypatch):
+        """A Redis error while creating the client should disable Redis."""
+        module = self.fake_redis_module(None)
+        module.Redis.from_url.side_effect = module.RedisError("bad option")
+        monkeypatch.setitem(sys.modules, "redis", module)
+
+        assert get_redis_cache() is None
+        assert redis_cache_module._redis_disabled
+
+    def test_valid_url_builds_client_once(self, monkeypatch):
+        """A working REDIS_URL should give the same shared cache each time."""
+        module = self.fake_redis_module(None)
+        monkeypatch.setitem(sys.modules, "redis", module)
+
+        cache = get_redis_cache()
+        assert cache is not None
+        assert get_redis_cache() is cache
+        module.Redis.from_url.assert_called_once()
+
+
+class TestCacheEntry:
+    """Tests for cache entry expiry."""
+
+    def test_fresh_entry_not_expired(self):
+        """A new entry should not be expired."""
+        assert not CacheEntry(data=1, ttl_seconds=60).is_expired()
+
+    def test_entry_expires_after_ttl(self):
+        """An entry should expire once its TTL has elapsed on the monotonic clock."""
+        entry = CacheEntry(data=1, ttl_seconds=60)
+        with patch("app.services.google_sheets_service.time.monotonic", return_value=entry.created_at + 61):
+            assert entry.is_expired()
+
+
+class TestGetAllTruckDeliveries:
+    """Tests for reading the required weekly sheets."""
+
+    def test_reads_each_sheet_once_and_skips_failures(self, service):
+        """Each resolved sheet is read once; a failing sheet doesn't sink the rest."""
+        row = MagicMock()
+
+        async def fake_read(sheet_name, today, refresh):
+            if sheet_name == "Jan-12":
+                raise GoogleSheetsAPIError("boom")
+            return {"Truck 1": [row], "Truck 2": []}
+
+        with patch.object(service, "get_available_sheets", return_value=["Jan-05", "Jan-12"]), \
+             patch("app.services.google_sheets_service.get_required_week_sheets",
+                   return_value=["Jan-05", "Jan-12"]), \
+             patch.object(service, "get_weekly_sheet_data", AsyncMock(side_effect=fake_read)) as read:
+            truck1, truck2 = asyncio.run(service.get_all_truck_deliveries())
+
+        assert [call.args[0] for call in read.call_args_list] == ["Jan-05", "Jan-12"]
+        assert truck1 == [row]
+        assert truck2 == []
+
+
+class TestGetWeeklySheetData:
+    """Tests for fetching and parsing a single weekly sheet."""
+
+    def test_rows_are_stamped_with_week_start(self, service):
+        """Parsed rows should carry the Monday of the sheet's week."""
+        values = [
+            ["Monday - Daily Turf Deliveries"],
+            ["TRUCK 1"],
+            ["Slot", "Variety", "Suburb", "Service Type", "SQM Sold", "Pallets"],
+            ["1", "Sir Walter", "Perth", "SD", "50", "1"],
+        ]
+        client = MagicMock()
+        client.get_worksheet_data.return_value = values
+
+        with patch("app.services.google_sheets_service.get_redis_cache", return_value=None), \
+             patch.object(service, "_ensure_client", return_value=client):
+            data = asyncio.run(service.get_weekly_sheet_data("Jan-05", today=date(2026, 1, 7)))
+
+        assert [row.week_start_date for row in data["Truck 1"]] == [date(2026, 1, 5)]
+
+    def test_refresh_bypasses_cache(self, service):
+        """A refresh should fetch from the API even when the sheet is cached."""
+        client = MagicMock()
+        client.get_worksheet_data.return_value = []
+
+        with patch("app.services.google_sheets_service.get_redis_cache", return_value=None), \
+             patch.object(service, "_ensure_client", return_value=client):
+            asyncio.run(service._set_cache(service._get_cache_key("Jan-05"), {"Truck 1": [], "Truck 2": []}))
+            asyncio.run(service.get_weekly_sheet_data("Jan-05", refresh=True))
+
+        client.get_worksheet_data.assert_called_once_with("Jan-05")
+
+
+class TestGetRequiredWeekSheets:
+    """Tests for the weekly sheets needed to cover N business days."""
+
+    def test_midweek_start_spans_three_weeks(self):
+        """Ten business days from a Wednesday touch three weekly sheets."""
+        assert get_required_week_sheets(date(2026, 1, 7), 10) == ["Jan-05", "Jan-12", "Jan-19"]
+
+    def test_monday_start_spans_two_weeks(self):
+        """Ten business days from a Monday fit in exactly two weekly sheets."""
+        assert get_required_week_sheets(date(2026, 1, 5), 10) == ["Jan-05", "Jan-12"]
+
+    def test_weekend_start_begins_next_week(self):
+        """A weekend start date should begin from the following Monday."""
+        assert get_required_week_sheets(date(2026, 1, 3), 5) == ["Jan-05"]
+
+    def test_zero_days_returns_empty(self):
+        """No business days needs no sheets."""
+        assert get_required_week_sheets(date(2026, 1, 5), 0) == []
+
+
+class TestParseSheetNameToDate:
+    """Tests for converting sheet names to week start dates."""
+
+    def test_uses_given_today(self):
+        """The supplied reference date should set the year."""
+        assert parse_sheet_name_to_date("Mar-02", today=date(2026, 3, 4)) == date(2026, 3, 2)
+
+    def test_january_sheet_in_december_is_next_year(self):
+        """A January sheet read in December belongs to the following year."""
+        assert parse_sheet_name_to_date("Jan-05", today=date(2025, 12, 30)) == date(2026, 1, 5)
+
+    def test_december_sheet_in_january_is_last_year(self):
+        """A December sheet read in January belongs to the previous year."""
+        assert parse_sheet_name_to_date("Dec-29", today=date(2026, 1, 2)) == date(2025, 12, 29)
+
+    def test_defaults_to_australia_today(self):
+        """Without a reference date, today in Australia is used."""
+        with patch("app.services.google_sheets_service.get_australia_today",
+                   return_value=date(2026, 6, 1)) as today:
+            assert parse_sheet_name_to_date("Jun-01") == date(2026, 6, 1)
+        today.assert_called_once()
+
+    def test_invalid_name_returns_none(self):
+        """Non-weekly sheet names should not parse."""
+        assert parse_sheet_name_to_date("MASTER", today=date(2026, 1, 5)) is None
+
+
+class TestPrefetch:
+    """Tests for background cache warming."""
+
+    def test_prefetch_refreshes_all_sheets(self, service):
+        """Prefetching should force a refresh of the schedule window."""
+        with patch.object(service, "get_all_truck_deliveries",
+                          AsyncMock(return_value=([], []))) as get_all:
+            asyncio.run(service.prefetch_current_week())
+        get_all.assert_awaited_once_with(refresh=True)
+
+    def test_prefetch_swallows_errors(self, service):
+        """A failed warm-up should be logged, not raised."""
+        with patch.object(service, "get_all_truck_deliveries",
+                          AsyncMock(side_effect=RuntimeError("offline"))):
+            asyncio.run(service.prefetch_current_week())
+
+    def test_warmer_skips_interval_claimed_by_another_worker(self, service, fake_redis):
+        """With Redis, only the worker holding the warmer lock should prefetch."""
+        fake_redis.store[CACHE_WARMER_LOCK_KEY] = b"1"
+        with patch.object(service, "prefetch_current_week", AsyncMock()) as prefetch, \
+             patch("app.services.google_sheets_service.asyncio.sleep",
+                   AsyncMock(side_effect=asyncio.CancelledError)):
+            with pytest.raises(asyncio.CancelledError):
+                asyncio.run(service.keep_cache_warm())
+        prefetch.assert_not_awaited()
+
+    def test_warmer_claims_free_interval(self, service, fake_redis):
+        """The first worker to claim the interval should prefetch."""
+        with patch.object(service, "prefetch_current_week", AsyncMock()) as prefetch, \
+             patch("app.services.google_sheets_service.asyncio.sleep",
+                   AsyncMock(side_effect=asyncio.CancelledError)):
+            with pytest.raises(asyncio.CancelledError):
+                asyncio.run(service.keep_cache_warm())
+        prefetch.assert_awaited_once_with()
+        assert CACHE_WARMER_LOCK_KEY in fake_redis.store
+
+    def test_lifespan_respects_warmer_setting(self):
+        """The warmer should not be started when CACHE_WARMER_ENABLED is off."""
+        async def run():
+            async with lifespan(app):
+                pass
+
+        with patch("app.main.settings.cache_warmer_enabled", False), \
+             patch("app.main.google_sheets_service") as gss:
+            gss.is_available.return_value = True
+            asyncio.run(run())
+        gss.keep_cache_warm.assert_not_called()
+
+
+class TestCacheGeneration:
+    """Tests for dropping fetches that race a cache clear."""
+
+    @staticmethod
+    def _client(on_fetch=None):
+        """Sheets client returning an empty sheet, running on_fetch mid-fetch."""
+        def get_worksheet_data(sheet_name):
+            if on_fetch:
+                on_fetch()
+            return []
+
+        client = MagicMock()
+        client.get_worksheet_data.side_effect = get_worksheet_data
+        return client
+
+    def test_fetch_is_cached(self, service, fake_redis):
+        """A fetch with no clear in between should be cached."""
+        with patch.object(service, "_ensure_client", return_value=self._client()):
+            asyncio.run(service.get_weekly_sheet_data("Jan-05", today=date(2026, 1, 7)))
+        assert service._get_cache_key("Jan-05") in fake_redis.store
+
+    def test_local_clear_during_fetch_is_not_overwritten(self, service):
+        """A clear in this worker during a fetch should drop the fetched result."""
+        def clear():
+            asyncio.run(service.clear_cache())
+
+        with patch("app.services.google_sheets_service.get_redis_cache", return_value=None), \
+             patch.object(service, "_ensure_client", return_value=self._client(clear)):
+            data = asyncio.run(service.get_weekly_sheet_data("Jan-05", today=date(2026, 1, 7)))
+
+        assert data == {"Truck 1": [], "Truck 2": []}
+        assert service._cache == {}
+
+    def test_other_worker_clear_during_fetch_is_not_overwritten(self, service, fake_redis):
+        """A clear in another worker during a fetch should keep the result out of Redis."""
+        def clear_elsewhere():
+            fake_redis.incr(CACHE_GENERATION_KEY)
+
+        with patch.object(service, "_ensure_client", return_value=self._client(clear_elsewhere)):
+            asyncio.run(service.get_weekly_sheet_data("Jan-05", today=date(2026, 1, 7)))
+
+        assert service._get_cache_key("Jan-05") not in fake_redis.store
+        assert service._cache == {}
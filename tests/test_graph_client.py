@@ -0,0 +1,234 @@
+"""
+Tests for GraphClient request handling.
+
+Tests cover:
+1. Retry with backoff on rate-limit and server errors
+2. Cached authorization headers
+3. Worksheet response decoding
+4. Pooled HTTP client
+5. Chunked worksheet streaming
+6. Batched worksheet fetches
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from app.services.graph.graph_client import GraphClient, MAX_RETRY_ATTEMPTS
+from app.services.graph.exceptions import (
+    GraphRateLimitError,
+    GraphResourceNotFoundError,
+    GraphServiceError,
+)
+
+
+@pytest.fixture
+def client():
+    """Graph client without real credentials."""
+    return GraphClient()
+
+
+class TestRetry:
+    """Tests for automatic retry of transient errors."""
+
+    def test_retries_rate_limit_then_succeeds(self, client):
+        """A 429 should be retried after the Retry-After delay."""
+        response = httpx.Response(200, json={"values": []})
+        send = AsyncMock(side_effect=[GraphRateLimitError(retry_after=3), response])
+
+        with patch.object(client, "_send_get", send), \
+                patch("app.services.graph.graph_client.asyncio.sleep", new=AsyncMock()) as sleep:
+            result = asyncio.run(client._get_with_retry("/endpoint", "test"))
+
+        assert result is response
+        sleep.assert_awaited_once_with(3.0)
+
+    def test_gives_up_after_max_attempts(self, client):
+        """Persistent server errors should be raised once retries are exhausted."""
+        send = AsyncMock(side_effect=GraphServiceError())
+
+        with patch.object(client, "_send_get", send), \
+                patch("app.services.graph.graph_client.asyncio.sleep", new=AsyncMock()):
+            with pytest.raises(GraphServiceError):
+                asyncio.run(client._get_with_retry("/endpoint", "test"))
+
+        assert send.await_count == MAX_RETRY_ATTEMPTS
+
+    def test_does_not_retry_not_found(self, client):
+        """Non-transient errors should be raised immediately."""
+        send = AsyncMock(side_effect=GraphResourceNotFoundError(resource="test"))
+
+        with patch.object(client, "_send_get", send):
+            with pytest.raises(GraphResourceNotFoundError):
+                asyncio.run(client._get_with_retry("/endpoint", "test"))
+
+        assert send.await_count == 1
+
+    def test_backoff_is_capped(self):
+        """Exponential backoff should never exceed the maximum delay."""
+        delay = GraphClient._get_retry_delay(GraphServiceError(), attempt=20)
+        assert delay <= 30.0
+
+
+class TestHeaderCaching:
+    """Tests for cached authorization headers."""
+
+    def test_headers_reused_until_expiry(self, client):
+        """The token manager should only be called once while the token is valid."""
+        with patch.object(
+            client._token_manager, "get_access_token_with_expiry", return_value=("token", 3600)
+        ) as get_token:
+            first = client._get_headers()
+            second = client._get_headers()
+
+        assert first is second
+        assert first["Authorization"] == "Bearer token"
+        get_token.assert_called_once()
+
+    def test_headers_refreshed_near_expiry(self, client):
+        """Headers should be refreshed once the token is close to expiring."""
+        with patch.object(
+            client._token_manager, "get_access_token_with_expiry", return_value=("token", 30)
+        ) as get_token:
+            client._get_headers()
+            client._get_headers()
+
+        assert get_token.call_count == 2
+
+
+class TestWorksheetData:
+    """Tests for decoding worksheet responses."""
+
+    def test_returns_values_from_used_range(self, client):
+        """The usedRange values array should be decoded and returned."""
+        response = httpx.Response(200, json={"values": [["Day", "Slot"], ["Monday", 1]]})
+
+        with patch.object(client, "_get_with_retry", AsyncMock(return_value=response)):
+            values = asyncio.run(client.get_worksheet_data("Truck 1"))
+
+        assert values == [["Day", "Slot"], ["Monday", 1]]
+
+
+class TestHttpClient:
+    """Tests for the shared pooled HTTP client."""
+
+    def test_client_is_reused_with_pool_limits(self):
+        """The HTTP client should be created once with the configured pool limits."""
+        limits = httpx.Limits(max_keepalive_connections=5, max_connections=10)
+        graph_client = GraphClient(pool_limits=limits)
+
+        async def get_twice():
+            first = await graph_client._get_client()
+            second = await graph_client._get_client()
+            await graph_client.close()
+            return first, second
+
+        with patch("app.services.graph.graph_client.httpx.AsyncClient") as async_client:
+            async_client.return_value.is_closed = False
+            async_client.return_value.aclose = AsyncMock()
+            first, second = asyncio.run(get_twice())
+
+        assert first is second
+        async_client.assert_called_once()
+        assert async_client.call_args.kwargs["limits"] is limits
+
+
+class TestIterWorksheetData:
+    """Tests for streaming a worksheet in row chunks."""
+
+    def test_small_or_unseen_sheet_is_one_request(self, client):
+        """A sheet not known to exceed one chunk is read with a single plain usedRange."""
+        response = httpx.Response(200, json={"address": "'Truck 1'!A1:G2", "rowCount": 2,
+                                             "values": [["a"], ["b"]]})
+
+        async def collect():
+            return [batch async for batch in client.iter_worksheet_data("Truck 1", chunk_rows=2)]
+
+        with patch.object(client, "_get_with_retry", AsyncMock(return_value=response)) as get:
+            assert asyncio.run(collect()) == [[["a"], ["b"]]]
+            assert asyncio.run(collect()) == [[["a"], ["b"]]]
+
+        assert get.await_count == 2
+        assert all(call.args[0].endswith("/usedRange") for call in get.call_args_list)
+
+    def test_fetches_large_used_range_in_chunks(self, client):
+        """A sheet known to be larger than a chunk is split into row-bounded range requests."""
+        client._used_range_rows["Truck 1"] = 5
+        responses = [
+            httpx.Response(200, json={"address": "'Truck 1'!A1:G5"}),
+            httpx.Response(200, json={"values": [["a"], ["b"]]}),
+            httpx.Response(200, json={"values": [["c"], ["d"]]}),
+            httpx.Response(200, json={"values": [["e"]]}),
+        ]
+
+        async def collect():
+            return [batch async for batch in client.iter_worksheet_data("Truck 1", chunk_rows=2)]
+
+        with patch.object(client, "_get_with_retry", AsyncMock(side_effect=responses)) as get:
+            batches = asyncio.run(collect())
+
+        assert batches == [[["a"], ["b"]], [["c"], ["d"]], [["e"]]]
+        assert get.call_args_list[0].args[0].endswith("/usedRange?$select=address")
+        endpoints = [call.args[0] for call in get.call_args_list[1:]]
+        assert [endpoint.split("range(address=")[1] for endpoint in endpoints] == [
+            "'A1:G2')?$select=values",
+            "'A3:G4')?$select=values",
+            "'A5:G5')?$select=values",
+        ]
+
+    def test_large_first_read_streams_next_time(self, client):
+        """The row count from a full read decides whether the next read streams."""
+        full = httpx.Response(200, json={"rowCount": 3, "values": [["a"], ["b"], ["c"]]})
+        with patch.object(client, "_get_with_retry", AsyncMock(return_value=full)):
+            asyncio.run(client.get_worksheet_data("Truck 2"))
+
+        responses = [
+            httpx.Response(200, json={"address": "Truck 2!A1"}),
+            httpx.Response(200, json={"values": [[""]]}),
+        ]
+
+        async def collect():
+            return [batch async for batch in client.iter_worksheet_data("Truck 2", chunk_rows=2)]
+
+        with patch.object(client, "_get_with_retry", AsyncMock(side_effect=responses)):
+            assert asyncio.run(collect()) == [[[""]]]
+
+        assert client._used_range_rows["Truck 2"] == 1
+
+
+class TestBatchGetWorksheetData:
+    """Tests for fetching several worksheets in one $batch request."""
+
+    def test_maps_sub_responses_to_worksheets(self, client):
+        """Sub-response bodies should be returned keyed by worksheet name."""
+        response = httpx.Response(200, json={"responses": [
+            {"id": "1", "status": 200, "body": {"values": [["b"]]}},
+            {"id": "0", "status": 200, "body": {"values": [["a"]]}},
+        ]})
+
+        with patch.object(client, "_send", AsyncMock(return_value=response)) as send:
+            result = asyncio.run(client.batch_get_worksheet_data(["Truck 1", "Truck 2"]))
+
+        assert result == {"Truck 1": [["a"]], "Truck 2": [["b"]]}
+        method, endpoint = send.call_args.args[:2]
+        assert (method, endpoint) == ("POST", "/$batch")
+        urls = [request["url"] for request in send.call_args.kwargs["json_body"]["requests"]]
+        assert all(url.endswith("/usedRange") for url in urls)
+        assert "Truck%201" in urls[0]
+
+    def test_throttled_sub_request_retries_batch(self, client):
+        """A 429 inside the batch should retry the whole batch."""
+        throttled = httpx.Response(200, json={"responses": [
+            {"id": "0", "status": 429, "headers": {"Retry-After": "2"}, "body": {}},
+        ]})
+        ok = httpx.Response(200, json={"responses": [
+            {"id": "0", "status": 200, "body": {"values": []}},
+        ]})
+
+        with patch.object(client, "_send", AsyncMock(side_effect=[throttled, ok])), \
+                patch("app.services.graph.graph_client.asyncio.sleep", new=AsyncMock()) as sleep:
+            result = asyncio.run(client.batch_get_worksheet_data(["Truck 1"]))
+
+        assert result == {"Truck 1": []}
+        sleep.assert_awaited_once_with(2.0)
@@ -0,0 +1,317 @@
+"""
+Tests for OneDriveService fetching and caching.
+
+Tests cover:
+1. Batched truck fetches
+2. Coalescing of concurrent worksheet fetches
+3. Cache entry expiry
+4. Sweeping of expired cache entries
+5. Truck totals
+6. Per-instance state
+7. LRU bound on the cache
+8. Negative caching of Graph failures
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.excel.excel_parser import ExcelDeliveryRow
+from app.services.graph.exceptions import GraphServiceError
+from app.services.onedrive_service import (
+    CACHE_SWEEP_INTERVAL,
+    CacheEntry,
+    OneDriveService,
+)
+
+
+@pytest.fixture
+def service():
+    """OneDrive service with an empty cache and a mocked Graph client."""
+    svc = OneDriveService()
+    svc.clear_cache()
+    client = MagicMock()
+    client.get_worksheet_data = AsyncMock(return_value=[])
+
+    async def iter_worksheet_data(worksheet_name):
+        yield await client.get_worksheet_data(worksheet_name)
+
+    client.iter_worksheet_data = iter_worksheet_data
+    with patch.object(svc, "_ensure_client", return_value=client):
+        yield svc
+    svc.clear_cache()
+
+
+def make_row(sqm: float = 50.0, pallets: float = 1.0) -> ExcelDeliveryRow:
+    """Build a parsed delivery row."""
+    return ExcelDeliveryRow(
+        day="Monday",
+        slot=1,
+        variety="Sir Walter",
+        suburb="Perth",
+        service_type="SD",
+        sqm_sold=sqm,
+        pallets=pallets,
+    )
+
+
+class TestGetBothTrucks:
+    """Tests for fetching both trucks."""
+
+    def test_cold_cache_uses_one_batch_request(self, service):
+        """Both worksheets should be fetched together in a single batch."""
+        client = service._ensure_client()
+        header = ["Day", "Slot", "Variety", "Suburb", "Service", "SQM", "Pallets"]
+        client.batch_get_worksheet_data = AsyncMock(return_value={
+            "Truck 1": [header, ["Monday", 1, "Sir Walter", "Perth", "SD", 100, 2]],
+            "Truck 2": [header, ["Monday", 1, "Kikuyu", "Perth", "SL", 200, 4]],
+        })
+
+        truck1, truck2 = asyncio.run(service.get_both_trucks())
+
+        client.batch_get_worksheet_data.assert_awaited_once_with(["Truck 1", "Truck 2"])
+        client.get_worksheet_data.assert_not_awaited()
+        assert (truck1.capacity, truck1.sqm_total) == (500, 100)
+        assert (truck2.capacity, truck2.sqm_total) == (600, 200)
+
+    def test_cached_trucks_skip_the_batch(self, service):
+        """Cached truck data should be returned without any Graph request."""
+        client = service._ensure_client()
+        client.batch_get_worksheet_data = AsyncMock()
+        service._set_cache(service._get_cache_key("Truck 1"), [make_row()])
+        service._set_cache(service._get_cache_key("Truck 2"), [make_row()])
+
+        asyncio.run(service.get_both_trucks())
+
+        client.batch_get_worksheet_data.assert_not_awaited()
+        client.get_worksheet_data.assert_not_awaited()
+
+
+    def test_concurrent_single_truck_request_joins_the_batch(self, service):
+        """A single-worksheet request during the batch should not fetch again."""
+        client = service._ensure_client()
+
+        async def slow_batch(worksheet_names):
+            await asyncio.sleep(0.01)
+            return {name: [] for name in worksheet_names}
+
+        client.batch_get_worksheet_data = AsyncMock(side_effect=slow_batch)
+
+        async def run():
+            both = asyncio.create_task(service.get_both_trucks())
+            await asyncio.sleep(0)
+            single = await service.get_worksheet_deliveries("Truck 1")
+            return await both, single
+
+        (truck1, _), single = asyncio.run(run())
+
+        client.batch_get_worksheet_data.assert_awaited_once()
+        client.get_worksheet_data.assert_not_awaited()
+        assert single == [] and truck1.deliveries == []
+        assert service._inflight == {}
+
+    def test_batch_failure_is_cached_for_both_trucks(self, service):
+        """A failed batch should be re-raised from cache rather than retried per request."""
+        client = service._ensure_client()
+        client.batch_get_worksheet_data = AsyncMock(side_effect=GraphServiceError())
+
+        for _ in range(2):
+            with pytest.raises(GraphServiceError):
+                asyncio.run(service.get_both_trucks())
+        with pytest.raises(GraphServiceError):
+            asyncio.run(service.get_worksheet_deliveries("Truck 2"))
+
+        client.batch_get_worksheet_data.assert_awaited_once()
+        client.get_worksheet_data.assert_not_awaited()
+
+
+class TestSingleFlight:
+    """Tests for coalescing concurrent fetches of the same worksheet."""
+
+    def test_concurrent_callers_share_one_fetch(self, service):
+        """Concurrent cold-cache callers should trigger a single Graph request."""
+        client = service._ensure_client()
+
+        async def slow_fetch(worksheet_name):
+            await asyncio.sleep(0.01)
+            return []
+
+        client.get_worksheet_data.side_effect = slow_fetch
+
+        async def fetch_three():
+            return await asyncio.gather(
+                *(service.get_worksheet_deliveries("Truck 1") for _ in range(3))
+            )
+
+        results = asyncio.run(fetch_three())
+
+        assert client.get_worksheet_data.await_count == 1
+        assert results[0] is results[1] is results[2]
+        assert service._inflight == {}
+
+    def test_failure_propagates_to_all_callers(self, service):
+        """A failed shared fetch should raise for every waiting caller."""
+        client = service._ensure_client()
+
+        async def failing_fetch(worksheet_name):
+            await asyncio.sleep(0.01)
+            raise GraphServiceError()
+
+        client.get_worksheet_data.side_effect = failing_fetch
+
+        async def fetch_two():
+            return await asyncio.gather(
+                service.get_worksheet_deliveries("Truck 1"),
+                service.get_worksheet_deliveries("Truck 1"),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(fetch_two())
+
+        assert all(isinstance(result, GraphServiceError) for result in results)
+        assert client.get_worksheet_data.await_count == 1
+        assert service._inflight == {}
+
+
+    def test_cancelled_caller_does_not_cancel_others(self, service):
+        """Cancelling the caller that started a fetch leaves the other waiters' result intact."""
+        client = service._ensure_client()
+
+        async def slow_fetch(worksheet_name):
+            await asyncio.sleep(0.01)
+            return []
+
+        client.get_worksheet_data.side_effect = slow_fetch
+
+        async def run():
+            leader = asyncio.create_task(service.get_worksheet_deliveries("Truck 1"))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(service.get_worksheet_deliveries("Truck 1"))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return leader, await follower
+
+        leader, result = asyncio.run(run())
+
+        assert leader.cancelled()
+        assert result == []
+        assert client.get_worksheet_data.await_count == 1
+        assert service._inflight == {}
+
+
+class TestCacheEntry:
+    """Tests for cache entry expiry."""
+
+    def test_fresh_entry_not_expired(self):
+        """A new entry should not be expired."""
+        assert not CacheEntry(data=1, ttl_seconds=60).is_expired()
+
+    def test_entry_expires_at_deadline(self):
+        """An entry should expire once the monotonic clock reaches its deadline."""
+        entry = CacheEntry(data=1, ttl_seconds=60)
+        with patch("app.services.onedrive_service.time.monotonic", return_value=entry.expires_at):
+            assert entry.is_expired()
+
+    def test_entry_has_no_instance_dict(self):
+        """Entries should use slots rather than a per-instance __dict__."""
+        assert not hasattr(CacheEntry(data=1, ttl_seconds=60), "__dict__")
+
+
+class TestCacheSweep:
+    """Tests for the periodic sweep of expired entries."""
+
+    def test_sweep_drops_expired_entries(self, service):
+        """Expired entries should be removed after enough cache writes."""
+        service._cache["stale"] = CacheEntry(data=[], ttl_seconds=0)
+        service._sets_since_sweep = 0
+
+        for i in range(CACHE_SWEEP_INTERVAL):
+            service._set_cache(f"key:{i}", [])
+
+        assert "stale" not in service._cache
+        assert len(service._cache) == CACHE_SWEEP_INTERVAL
+
+
+class TestGetTruckData:
+    """Tests for building truck data from worksheet rows."""
+
+    def test_totals_and_available_capacity(self, service):
+        """SQM and pallet totals should sum every delivery."""
+        rows = [make_row(sqm=100, pallets=2), make_row(sqm=150, pallets=3)]
+
+        with patch.object(service, "get_worksheet_deliveries", AsyncMock(return_value=rows)):
+            truck = asyncio.run(service.get_truck_data(1))
+
+        assert len(truck.deliveries) == 2
+        assert truck.sqm_total == 250
+        assert truck.pallet_total == 5
+        assert truck.available_sqm == 250
+
+    def test_truck_data_is_cached(self, service):
+        """A second call should return the cached TruckData without refetching."""
+        fetch = AsyncMock(return_value=[make_row()])
+
+        with patch.object(service, "get_worksheet_deliveries", fetch):
+            first = asyncio.run(service.get_truck_data(2))
+            second = asyncio.run(service.get_truck_data(2))
+
+        assert second is first
+        fetch.assert_awaited_once()
+
+    def test_unknown_truck_raises_value_error(self, service):
+        """Truck numbers without a configured capacity should be rejected."""
+        with pytest.raises(ValueError):
+            asyncio.run(service.get_truck_data(3))
+
+
+class TestInstanceState:
+    """Tests for service state ownership."""
+
+    def test_instances_do_not_share_cache(self):
+        """Each instance should own its cache; the app shares the module-level one."""
+        first = OneDriveService()
+        second = OneDriveService()
+        first._set_cache("key", [])
+
+        assert first is not second
+        assert second._get_from_cache("key") is None
+
+
+class TestLruBound:
+    """Tests for the LRU limit on cache size."""
+
+    def test_least_recently_used_entry_is_evicted(self, service):
+        """Exceeding the max entries should evict the coldest key."""
+        with patch("app.services.onedrive_service.settings.graph_cache_max_entries", 2):
+            service._set_cache("a", 1)
+            service._set_cache("b", 2)
+            service._get_from_cache("a")
+            service._set_cache("c", 3)
+
+        assert list(service._cache) == ["a", "c"]
+
+
+class TestNegativeCache:
+    """Tests for briefly caching Graph failures."""
+
+    def test_failure_is_cached_briefly(self, service):
+        """A failed fetch should be re-raised from cache without hitting Graph again."""
+        client = service._ensure_client()
+        client.get_worksheet_data.side_effect = GraphServiceError()
+
+        for _ in range(2):
+            with pytest.raises(GraphServiceError):
+                asyncio.run(service.get_worksheet_deliveries("Truck 1"))
+
+        assert client.get_worksheet_data.await_count == 1
+
+    def test_failure_expires(self, service):
+        """Once the error TTL passes, the next call should retry Graph."""
+        client = service._ensure_client()
+        client.get_worksheet_data.side_effect = GraphServiceError()
+
+        with patch("app.services.onedrive_service.settings.graph_error_ttl_seconds", 0):
+            for _ in range(2):
+                with pytest.raises(GraphServiceError):
+                    asyncio.run(service.get_worksheet_deliveries("Truck 1"))
+
+        assert client.get_worksheet_data.await_count == 2
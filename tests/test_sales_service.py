@@ -0,0 +1,873 @@
+"""
+Tests for SalesService.
+
+Tests cover:
+1. Batched cell updates
+2. Coalescing of concurrent single-cell updates
+3. Weekly aggregation
+4. Monthly stats batch read
+5. Daily schedule, weekly and daily stats
+6. Available week tab caching
+7. Slot row lookup table
+8. Cell value parsing
+9. Date formatting helpers
+10. Appointment row parsing
+11. Spreadsheet ID resolution
+12. Row padding
+13. Annual stats
+14. Thread offload of Sheets requests
+"""
+import asyncio
+import threading
+import time
+from datetime import date, datetime, timezone
+import pytest
+from googleapiclient.errors import HttpError
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.sales_service import (
+    AVAILABLE_WEEKS_TTL_SECONDS,
+    PAST_WEEK_STATS_TTL_SECONDS,
+    STATS_ROW_WIDTH,
+    WEEK_STATS_RANGE,
+    WEEKLY_STATS_TTL_SECONDS,
+    SalesService,
+    _pad_row,
+    _week_display_for,
+)
+
+
+@pytest.fixture
+def service():
+    """Sales service backed by a mocked Sheets API resource."""
+    svc = SalesService()
+    svc._client = MagicMock()
+    svc._service = MagicMock()
+    svc._spreadsheet_id = "sheet-id"
+    return svc
+
+
+def make_week_rows(entries):
+    """Build week tab rows with the given {row_number: row} entries filled in."""
+    rows = [[] for _ in range(180)]
+    for row_number, row in entries.items():
+        rows[row_number - 1] = row
+    return rows
+
+
+# GLEN Monday slot 1 and ILAN Saturday slot 1
+GLEN_MONDAY_ROW = 5
+ILAN_SATURDAY_ROW = 167
+
+SOLD_ROW = ["1", "Client", "Google", "Yes", "Yes", "Yes", "Yes", "", "", "$12,500"]
+ATTENDED_ROW = ["1", "Client", "Flyer", "yes", "", "TRUE", ""]
+
+
+class TestUpdateAppointmentFields:
+    """Tests for writing several cells in one request."""
+
+    def test_single_batch_update_call(self, service):
+        """All edits should be sent in one values.batchUpdate request."""
+        result = asyncio.run(service.update_appointment_fields("Jan-05", [
+            {"row_number": 5, "column": "f", "value": "Yes"},
+            {"row_number": 6, "column": "J", "value": "$1,000"},
+        ]))
+
+        batch_update = service._service.spreadsheets().values().batchUpdate
+        batch_update.assert_called_once()
+        body = batch_update.call_args.kwargs["body"]
+        assert body["valueInputOption"] == "USER_ENTERED"
+        assert body["data"] == [
+            {"range": "'Jan-05'!F5", "values": [["Yes"]]},
+            {"range": "'Jan-05'!J6", "values": [["$1,000"]]},
+        ]
+        assert result["success"]
+        assert [u["column"] for u in result["updated"]] == ["F", "J"]
+
+    def test_write_runs_in_worker_thread(self, service):
+        """The batchUpdate should execute off the event loop with a per-thread transport."""
+        with patch("app.services.sales_service.asyncio.to_thread",
+                   side_effect=asyncio.to_thread) as to_thread:
+            asyncio.run(service.update_appointment_fields("Jan-05", [
+                {"row_number": 5, "column": "F", "value": "Yes"},
+            ]))
+
+        to_thread.assert_called_once()
+        service._service.spreadsheets().values().batchUpdate.return_value.execute.assert_called_once_with(
+            http=service._client._get_http.return_value
+        )
+
+    def test_rejects_non_editable_column(self, service):
+        """A non-editable column should fail the whole batch without writing."""
+        result = asyncio.run(service.update_appointment_fields("Jan-05", [
+            {"row_number": 5, "column": "A", "value": "1"},
+        ]))
+
+        assert not result["success"]
+        service._service.spreadsheets().values().batchUpdate.assert_not_called()
+
+
+class TestUpdateAppointmentField:
+    """Tests for the coalescing single-cell update."""
+
+    def test_concurrent_updates_share_one_request(self, service):
+        """Edits to the same week inside the flush window should be batched."""
+        async def run():
+            return await asyncio.gather(
+                service.update_appointment_field("Jan-05", 5, "F", "Yes"),
+                service.update_appointment_field("Jan-05", 5, "G", "Yes"),
+            )
+
+        first, second = asyncio.run(run())
+
+        service._service.spreadsheets().values().batchUpdate.assert_called_once()
+        assert first == {
+            "success": True,
+            "updated": {"week_tab": "Jan-05", "row_number": 5, "column": "F", "value": "Yes"},
+        }
+        assert second["updated"]["column"] == "G"
+
+    def test_separate_weeks_flush_separately(self, service):
+        """Each week tab gets its own batch."""
+        async def run():
+            return await asyncio.gather(
+                service.update_appointment_field("Jan-05", 5, "F", "Yes"),
+                service.update_appointment_field("Jan-12", 5, "F", "Yes"),
+            )
+
+        asyncio.run(run())
+
+        assert service._service.spreadsheets().values().batchUpdate.call_count == 2
+
+    def test_api_error_is_returned_to_every_caller(self, service):
+        """An error hitting every edit should be reported to each caller."""
+        service._service.spreadsheets().values().batchUpdate.return_value.execute.side_effect = \
+            RuntimeError("quota exceeded")
+
+        async def run():
+            return await asyncio.gather(
+                service.update_appointment_field("Jan-05", 5, "F", "Yes"),
+                service.update_appointment_field("Jan-05", 6, "F", "Yes"),
+            )
+
+        results = asyncio.run(run())
+
+        assert results == [{"success": False, "error": "quota exceeded"}] * 2
+
+    def test_bad_edit_does_not_fail_others_in_batch(self, service):
+        """If one edit breaks the batch, the other edits are still written."""
+        def batch_update(spreadsheetId, body):
+            request = MagicMock()
+            if any(entry["range"].endswith("F999") for entry in body["data"]):
+                request.execute.side_effect = RuntimeError("Range exceeds grid limits")
+            return request
+
+        service._service.spreadsheets().values().batchUpdate.side_effect = batch_update
+
+        async def run():
+            return await asyncio.gather(
+                service.update_appointment_field("Jan-05", 5, "F", "Yes"),
+                service.update_appointment_field("Jan-05", 999, "F", "Yes"),
+            )
+
+        good, bad = asyncio.run(run())
+
+        assert good["success"]
+        assert bad == {"success": False, "error": "Range exceeds grid limits"}
+        assert service._service.spreadsheets().values().batchUpdate.call_count == 3
+
+    def test_rejects_non_editable_column(self, service):
+        """Invalid columns are rejected before anything is buffered."""
+        result = asyncio.run(service.update_appointment_field("Jan-05", 5, "A", "1"))
+
+        assert not result["success"]
+        assert service._pending_writes == {}
+
+
+class TestAggregateWeek:
+    """Tests for aggregating a week tab's rows."""
+
+    def test_counts_totals_reps_days_and_sources(self, service):
+        """Each flag should be counted against its rep, day and lead source."""
+        stats = service._aggregate_week(make_week_rows({
+            GLEN_MONDAY_ROW: SOLD_ROW,
+            ILAN_SATURDAY_ROW: ATTENDED_ROW,
+        }))
+
+        assert stats["totals"] == {
+            "appointments_set": 2,
+            "appointments_confirmed": 1,
+            "in_homes_attended": 2,
+            "jobs_sold": 1,
+            "weekly_sales_total": 12500.0,
+            "conversion_rate": 50.0,
+        }
+        by_rep = {rep["name"]: rep for rep in stats["by_rep"]}
+        assert by_rep["GLEN"]["sales_total"] == 12500.0
+        assert by_rep["ILAN"]["in_homes_attended"] == 1
+        assert by_rep["GREAT REP"]["appointments_set"] == 0
+        by_day = {day["day"]: day for day in stats["by_day"]}
+        assert by_day["Monday"] == {"day": "Monday", "attended": 1, "sold": 1}
+        assert by_day["Saturday"] == {"day": "Saturday", "attended": 1, "sold": 0}
+        sources = {src["source"]: src["count"] for src in stats["by_lead_source"]}
+        assert sources["Google"] == 1
+        assert sources["Other"] == 1
+
+    def test_lead_sources_only_count_set_appointments(self, service):
+        """Known sources keep their name, unknown ones become Other, unset rows are skipped."""
+        stats = service._aggregate_week(make_week_rows({
+            GLEN_MONDAY_ROW: ["1", "Client", "Referral", "Yes"],
+            GLEN_MONDAY_ROW + 1: ["2", "Client", "Letterbox", "Yes"],
+            GLEN_MONDAY_ROW + 2: ["3", "Client", "Google", "No"],
+        }))
+
+        sources = {src["source"]: src["count"] for src in stats["by_lead_source"]}
+        assert sources == {"Referral": 1, "Other": 1, "Google": 0, "Facebook": 0,
+                           "Vehicles": 0, "Word of Mouth": 0}
+
+    def test_sheet_ending_mid_block_counts_rows_present(self, service):
+        """Slots past the end of a truncated sheet are treated as empty."""
+        rows = make_week_rows({GLEN_MONDAY_ROW: SOLD_ROW, GLEN_MONDAY_ROW + 2: SOLD_ROW})
+        stats = service._aggregate_week(rows[:GLEN_MONDAY_ROW + 1])
+
+        assert stats["totals"]["jobs_sold"] == 1
+
+    def test_slot_rows_of_any_length(self, service):
+        """Short rows count only the cells present; padded and checkbox values still parse."""
+        stats = service._aggregate_week(make_week_rows({
+            GLEN_MONDAY_ROW: ["1", "Client"],
+            GLEN_MONDAY_ROW + 1: ["2", "Client", "Google", "Yes"],
+            GLEN_MONDAY_ROW + 2: ["3", "Client", "Facebook", " yes ", True, "TRUE", "True ", "", "", 900],
+        }))
+
+        assert stats["totals"] == {
+            "appointments_set": 2,
+            "appointments_confirmed": 1,
+            "in_homes_attended": 1,
+            "jobs_sold": 1,
+            "weekly_sales_total": 900.0,
+            "conversion_rate": 100.0,
+        }
+        sources = {src["source"]: src["count"] for src in stats["by_lead_source"]}
+        assert sources["Google"] == 1
+        assert sources["Facebook"] == 1
+
+    def test_short_sheet_is_empty_week(self, service):
+        """Missing rows should count as empty slots."""
+        stats = service._aggregate_week([])
+
+        assert stats["totals"]["appointments_set"] == 0
+        assert stats["totals"]["conversion_rate"] == 0.0
+
+
+class TestGetMonthlyStats:
+    """Tests for the monthly aggregation."""
+
+    def test_reads_all_weeks_in_one_batch_get(self, service):
+        """Every week in the month should be fetched by one batchGet call."""
+        batch_get = service._service.spreadsheets().values().batchGet
+        batch_get.return_value.execute.return_value = {"valueRanges": [
+            {"values": make_week_rows({GLEN_MONDAY_ROW: SOLD_ROW})},
+            {"values": make_week_rows({ILAN_SATURDAY_ROW: ATTENDED_ROW})},
+        ]}
+
+        with patch.object(service, "get_available_weeks",
+                          AsyncMock(return_value=["Jan-05", "Jan-12", "Feb-02"])):
+            result = asyncio.run(service.get_monthly_stats("2026-01"))
+
+        batch_get.assert_called_once()
+        assert batch_get.call_args.kwargs["ranges"] == [
+            f"'Jan-05'!{WEEK_STATS_RANGE}",
+            f"'Jan-12'!{WEEK_STATS_RANGE}",
+        ]
+        assert result["weeks_included"] == ["Jan-05", "Jan-12"]
+        assert result["totals"]["appointments_set"] == 2
+        assert result["totals"]["weekly_sales_total"] == 12500.0
+        assert result["totals"]["conversion_rate"] == 50.0
+
+    def test_conversion_rates_come_from_summed_counts(self, service):
+        """Combined conversion rates should use the summed counts, not averaged rates."""
+        week_a = service._aggregate_week(make_week_rows({GLEN_MONDAY_ROW: SOLD_ROW}))
+        week_b = service._aggregate_week(make_week_rows({
+            GLEN_MONDAY_ROW: ATTENDED_ROW,
+            GLEN_MONDAY_ROW + 1: ATTENDED_ROW,
+        }))
+
+        totals, by_rep = service._combine_weeks([week_a, week_b])
+
+        assert totals["in_homes_attended"] == 3
+        assert totals["jobs_sold"] == 1
+        assert totals["conversion_rate"] == 33.3
+        assert by_rep[0]["name"] == "GLEN"
+        assert by_rep[0]["conversion_rate"] == 33.3
+
+    def test_combined_reps_keep_sales_rep_order(self, service):
+        """Per-rep counters should be summed by rep position and unknown reps ignored."""
+        week = service._aggregate_week(make_week_rows({ILAN_SATURDAY_ROW: ATTENDED_ROW}))
+        week["by_rep"].append({"name": "FORMER REP", "appointments_set": 9, "appointments_confirmed": 9,
+                               "in_homes_attended": 9, "jobs_sold": 9})
+
+        _, by_rep = service._combine_weeks([week, week])
+
+        assert [rep["name"] for rep in by_rep] == SalesService.SALES_REPS
+        assert by_rep[2] == {
+            "name": "ILAN",
+            "appointments_set": 2,
+            "appointments_confirmed": 0,
+            "in_homes_attended": 2,
+            "jobs_sold": 0,
+            "conversion_rate": 0.0,
+        }
+
+
+class TestGetWeeklyStats:
+    """Tests for the weekly stats endpoint."""
+
+    def test_reads_week_off_the_event_loop(self, service):
+        """The values read runs in a worker thread with that thread's transport."""
+        get = service._service.spreadsheets().values().get
+        get.return_value.execute.return_value = {"values": make_week_rows({GLEN_MONDAY_ROW: SOLD_ROW})}
+
+        with patch.object(service, "get_available_weeks", AsyncMock(return_value=["Jan-05"])), \
+             patch("app.services.sales_service.asyncio.to_thread",
+                   side_effect=asyncio.to_thread) as to_thread:
+            result = asyncio.run(service.get_weekly_stats("Jan-05"))
+
+        to_thread.assert_called_once()
+        get.return_value.execute.assert_called_once_with(http=service._client._get_http.return_value)
+        assert result["success"]
+        assert result["totals"]["jobs_sold"] == 1
+        assert result["available_weeks"] == ["Jan-05"]
+
+    def test_can_skip_available_weeks(self, service):
+        """Stats-only callers such as the CEO summary skip the week tab lookup."""
+        get = service._service.spreadsheets().values().get
+        get.return_value.execute.return_value = {"values": make_week_rows({GLEN_MONDAY_ROW: SOLD_ROW})}
+
+        with patch.object(service, "get_available_weeks", AsyncMock()) as get_weeks:
+            result = asyncio.run(service.get_weekly_stats("Jan-05", include_available_weeks=False))
+            summary = asyncio.run(service.get_ceo_summary("Jan-05"))
+
+        get_weeks.assert_not_called()
+        assert result["available_weeks"] == []
+        assert summary["jobs_sold"] == 1
+
+    def test_repeat_calls_use_cached_stats(self, service):
+        """A second request within the TTL should not re-read the week."""
+        get = service._service.spreadsheets().values().get
+        get.return_value.execute.return_value = {"values": make_week_rows({GLEN_MONDAY_ROW: SOLD_ROW})}
+
+        with patch.object(service, "get_available_weeks", AsyncMock(return_value=["Jan-05"])):
+            first = asyncio.run(service.get_weekly_stats("Jan-05"))
+            second = asyncio.run(service.get_weekly_stats("Jan-05"))
+
+        get.return_value.execute.assert_called_once()
+        assert second == first
+
+    def test_cached_stats_expire(self, service):
+        """Stats older than the TTL are recomputed."""
+        get = service._service.spreadsheets().values().get
+        get.return_value.execute.return_value = {"values": []}
+
+        with patch.object(service, "get_available_weeks", AsyncMock(return_value=["Jan-05"])), \
+             patch.object(service, "_is_past_week", return_value=False):
+            with patch("app.services.sales_service.time.monotonic", return_value=1000.0):
+                asyncio.run(service.get_weekly_stats("Jan-05"))
+            with patch("app.services.sales_service.time.monotonic",
+                       return_value=1000.0 + WEEKLY_STATS_TTL_SECONDS):
+                asyncio.run(service.get_weekly_stats("Jan-05"))
+
+        assert get.return_value.execute.call_count == 2
+
+    def test_past_weeks_are_kept_longer(self, service):
+        """Stats for weeks that have ended outlive the current-week TTL."""
+        service._week_stats_cache["Jan-05"] = (1000.0, {"totals": {}})
+
+        with patch.object(service, "_is_past_week", return_value=True):
+            with patch("app.services.sales_service.time.monotonic",
+                       return_value=1000.0 + WEEKLY_STATS_TTL_SECONDS):
+                assert service._get_cached_week_stats("Jan-05") == {"totals": {}}
+            with patch("app.services.sales_service.time.monotonic",
+                       return_value=1000.0 + PAST_WEEK_STATS_TTL_SECONDS):
+                assert service._get_cached_week_stats("Jan-05") is None
+
+    def test_is_past_week(self, service):
+        """Only weeks starting before the current Monday count as past."""
+        with patch("app.services.sales_service.get_australia_today", return_value=date(2026, 1, 14)):
+            assert service._is_past_week("Jan-05")
+            assert not service._is_past_week("Jan-12")
+            assert not service._is_past_week("Jan-19")
+            assert not service._is_past_week("MASTER")
+
+    def test_is_past_week_uses_australian_date(self, service):
+        """Early Monday in Brisbane is still Sunday in UTC; last week is already past."""
+        utc_sunday_night = datetime(2026, 1, 11, 22, 0, tzinfo=timezone.utc)  # 08:00 Mon 12 Jan in Brisbane
+        with patch("app.core.constants.datetime") as fake_datetime:
+            fake_datetime.now.side_effect = lambda tz=None: utc_sunday_night.astimezone(tz)
+            assert service._is_past_week("Jan-05")
+            assert not service._is_past_week("Jan-12")
+
+    def test_write_invalidates_cached_week(self, service):
+        """Updating a cell should drop that week's cached stats only."""
+        service._week_stats_cache["Jan-05"] = (0.0, {})
+        service._week_stats_cache["Jan-12"] = (0.0, {})
+
+        asyncio.run(service.update_appointment_fields("Jan-05", [
+            {"row_number": 5, "column": "G", "value": "Yes"},
+        ]))
+
+        assert list(service._week_stats_cache) == ["Jan-12"]
+
+
+class TestGetDailySchedule:
+    """Tests for the staff dashboard schedule."""
+
+    def test_parses_each_reps_slots(self, service):
+        """Fetched rows should be padded and parsed into appointments per rep."""
+        week_rows = make_week_rows({GLEN_MONDAY_ROW: SOLD_ROW})
+        get = service._service.spreadsheets().values().get
+        get.return_value.execute.return_value = {"values": week_rows[0:8]}
+
+        with patch.object(service, "get_available_weeks", AsyncMock()) as get_weeks:
+            result = asyncio.run(service.get_daily_schedule(date(2026, 1, 5)))
+
+        get_weeks.assert_not_called()
+        assert get.call_args.kwargs["range"] == "'Jan-05'!A1:R29"
+        glen = result["reps"][0]
+        assert glen["name"] == "GLEN"
+        assert glen["appointments"][0]["lead_name"] == "Client"
+        assert glen["appointments"][0]["sell_price"] == 12500.0
+        assert glen["appointments"][4]["lead_name"] == ""
+        assert result["day_totals"]["total_sold"] == 1
+
+    def test_missing_week_tab_lists_available_weeks(self, service):
+        """A 400 from an unknown tab should be reported with the available weeks."""
+        service._service.spreadsheets().values().get.return_value.execute.side_effect = HttpError(
+            MagicMock(status=400), b"Unable to parse range"
+        )
+
+        with patch.object(service, "get_available_weeks", AsyncMock(return_value=["Jan-05", "Jan-12"])):
+            result = asyncio.run(service.get_daily_schedule(date(2026, 3, 2)))
+
+        assert result == {
+            "success": False,
+            "error": "Week 'Mar-02' not found. Available weeks: Jan-05, Jan-12...",
+        }
+
+    def test_other_api_errors_are_not_reported_as_missing_week(self, service):
+        """Non-400 API errors should surface as errors without a week lookup."""
+        service._service.spreadsheets().values().get.return_value.execute.side_effect = HttpError(
+            MagicMock(status=403), b"Forbidden"
+        )
+
+        with patch.object(service, "get_available_weeks", AsyncMock()) as get_weeks:
+            result = asyncio.run(service.get_daily_schedule(date(2026, 1, 5)))
+
+        get_weeks.assert_not_called()
+        assert not result["success"]
+        assert "not found" not in result["error"]
+
+    def test_weeks_before_first_tracked_week_are_not_read(self, service):
+        """Dates before the first tracked week should be rejected without a read."""
+        with patch.object(service, "get_available_weeks", AsyncMock(return_value=["Jan-05"])):
+            result = asyncio.run(service.get_daily_schedule(date(2025, 12, 31)))
+
+        service._service.spreadsheets().values().get.assert_not_called()
+        assert result["error"].startswith("Week 'Dec-29' not found")
+
+
+class TestGetDailyStats:
+    """Tests for the single-day stats view."""
+
+    def test_reads_only_the_days_rows(self, service):
+        """Daily stats should fetch and count just that day's block of rows."""
+        week_rows = make_week_rows({
+            GLEN_MONDAY_ROW: SOLD_ROW,
+            ILAN_SATURDAY_ROW: ATTENDED_ROW,
+        })
+        get = service._service.spreadsheets().values().get
+        get.return_value.execute.return_value = {"values": week_rows[150:171]}
+
+        result = asyncio.run(service.get_daily_stats(date(2026, 1, 10)))
+
+        assert get.call_args.kwargs["range"] == "'Jan-05'!A151:R171"
+        assert result["totals"] == {
+            "appointments_set": 1,
+            "appointments_confirmed": 0,
+            "in_homes_attended": 1,
+            "jobs_sold": 0,
+            "conversion_rate": 0.0,
+        }
+        assert result["by_day"] == [{"day": "Saturday", "attended": 1, "sold": 0}]
+        by_rep = {rep["name"]: rep for rep in result["by_rep"]}
+        assert by_rep["GLEN"]["appointments_set"] == 0
+        assert by_rep["ILAN"]["in_homes_attended"] == 1
+
+    def test_sunday_is_rejected(self, service):
+        """There are no appointments on Sundays."""
+        result = asyncio.run(service.get_daily_stats(date(2026, 1, 11)))
+
+        assert not result["success"]
+        service._service.spreadsheets().values().get.assert_not_called()
+
+
+def sheet_metadata(*titles):
+    """Spreadsheet metadata listing the given tab titles."""
+    return {"sheets": [{"properties": {"title": title}} for title in titles]}
+
+
+class TestGetAvailableWeeks:
+    """Tests for listing and caching the week tabs."""
+
+    def test_filters_and_sorts_week_tabs(self, service):
+        """Only week tabs from Jan-05 onwards are returned, oldest first."""
+        service._service.spreadsheets().get.return_value.execute.return_value = \
+            sheet_metadata("Feb-02", "MASTER", "Dec-29", "Jan-05")
+
+        assert asyncio.run(service.get_available_weeks()) == ["Jan-05", "Feb-02"]
+
+    def test_requests_only_tab_titles(self, service):
+        """The metadata read should mask the response down to tab titles."""
+        get = service._service.spreadsheets().get
+        get.return_value.execute.return_value = sheet_metadata("Jan-05")
+
+        asyncio.run(service.get_available_weeks())
+
+        assert get.call_args.kwargs["fields"] == "sheets.properties.title"
+
+    def test_repeat_calls_hit_cache(self, service):
+        """Calls within the TTL should not re-read the metadata."""
+        get = service._service.spreadsheets().get
+        get.return_value.execute.return_value = sheet_metadata("Jan-05")
+
+        asyncio.run(service.get_available_weeks())
+        asyncio.run(service.get_available_weeks())
+
+        get.return_value.execute.assert_called_once()
+
+    def test_cache_expires_after_ttl(self, service):
+        """The metadata is re-read once the TTL has elapsed."""
+        get = service._service.spreadsheets().get
+        get.return_value.execute.return_value = sheet_metadata("Jan-05")
+
+        with patch("app.services.sales_service.time.monotonic", return_value=1000.0):
+            asyncio.run(service.get_available_weeks())
+        with patch("app.services.sales_service.time.monotonic",
+                   return_value=1000.0 + AVAILABLE_WEEKS_TTL_SECONDS):
+            asyncio.run(service.get_available_weeks())
+
+        assert get.return_value.execute.call_count == 2
+
+    def test_concurrent_cold_calls_share_one_read(self, service):
+        """Callers arriving while the metadata read is in flight should join it."""
+        get = service._service.spreadsheets().get
+        get.return_value.execute.return_value = sheet_metadata("Jan-05")
+
+        async def run():
+            return await asyncio.gather(*(service.get_available_weeks() for _ in range(5)))
+
+        results = asyncio.run(run())
+
+        get.return_value.execute.assert_called_once()
+        assert results == [["Jan-05"]] * 5
+        assert service._weeks_inflight is None
+
+    def test_errors_are_not_cached(self, service):
+        """A failed read returns an empty list and is retried next call."""
+        execute = service._service.spreadsheets().get.return_value.execute
+        execute.side_effect = [RuntimeError("offline"), sheet_metadata("Jan-05")]
+
+        assert asyncio.run(service.get_available_weeks()) == []
+        assert asyncio.run(service.get_available_weeks()) == ["Jan-05"]
+
+    def test_new_tab_missing_from_cache_is_found(self, service):
+        """A tab created since the list was cached is found by re-reading the list."""
+        service._weeks_cache = (time.monotonic(), ["Jan-05"])
+        service._service.spreadsheets().get.return_value.execute.return_value = \
+            sheet_metadata("Jan-05", "Jan-12")
+
+        result = asyncio.run(service.delete_appointment("Jan-12", row_number=GLEN_MONDAY_ROW))
+
+        assert result["success"]
+        assert service._weeks_cache[1] == ["Jan-05", "Jan-12"]
+
+    def test_missing_tab_is_rejected_after_one_reread(self, service):
+        """A tab absent from a fresh list is reported as not found."""
+        service._weeks_cache = (time.monotonic(), ["Jan-05"])
+        execute = service._service.spreadsheets().get.return_value.execute
+        execute.return_value = sheet_metadata("Jan-05")
+
+        result = asyncio.run(service.delete_appointment("Jan-12", row_number=GLEN_MONDAY_ROW))
+
+        assert result["error_code"] == 404
+        execute.assert_called_once()
+
+
+class TestRowIndex:
+    """Tests for the precomputed slot row table."""
+
+    def test_matches_calculate_row_number(self):
+        """Every slot's index should be its 1-indexed row number minus one."""
+        for (day, rep, slot), row_idx in SalesService.ROW_INDEX.items():
+            assert row_idx == SalesService.calculate_row_number(day, rep, slot) - 1
+
+    def test_covers_every_slot(self):
+        """Five slots per rep on weekdays and three on Saturday."""
+        assert len(SalesService.ROW_INDEX) == 3 * (5 * 5 + 3)
+        assert SalesService.ROW_INDEX[("Saturday", "ILAN", 3)] == 168
+
+    def test_day_rep_rows_group_the_slot_rows(self):
+        """Each (day, rep) block should list that rep's slot rows in order."""
+        grouped = [row for rows in SalesService.DAY_REP_ROWS.values() for row in rows]
+
+        assert grouped == list(SalesService.ROW_INDEX.values())
+        assert SalesService.DAY_REP_ROWS[("Monday", "GLEN")] == (4, 5, 6, 7, 8)
+
+    def test_stats_range_covers_every_slot(self):
+        """The stats read should end at the last slot row and the sell price column."""
+        last_cell = WEEK_STATS_RANGE.split(":")[1]
+
+        assert last_cell[0] == chr(ord("A") + STATS_ROW_WIDTH - 1) == "J"
+        assert int(last_cell[1:]) == max(SalesService.ROW_INDEX.values()) + 1
+
+
+class TestParseHelpers:
+    """Tests for the cell value parsers."""
+
+    @pytest.mark.parametrize("value", ["Yes", "yes", "YES", "yEs", " Yes ", "TRUE", "true", " True", True])
+    def test_truthy_values(self, service, value):
+        """Yes/True spellings, including padded ones, parse as True."""
+        assert service.parse_boolean(value) is True
+
+    @pytest.mark.parametrize("value", ["", "   ", "No", "y", "yes please", "False", None, False, 0, 1])
+    def test_falsy_values(self, service, value):
+        """Anything else parses as False."""
+        assert service.parse_boolean(value) is False
+
+    @pytest.mark.parametrize("value,expected", [
+        ("$12,500", 12500.0),
+        (" $ 1,234.50 ", 1234.5),
+        ("\t$800\n", 800.0),
+        ("\n", 0.0),
+        ("", 0.0),
+        ("n/a", 0.0),
+        (None, 0.0),
+        (99, 99.0),
+    ])
+    def test_parse_currency(self, service, value, expected):
+        """Currency strings are stripped of symbols and separators."""
+        assert service.parse_currency(value) == expected
+
+
+class TestDateHelpers:
+    """Tests for the memoized date formatting helpers."""
+
+    @pytest.mark.parametrize("target,expected", [
+        (date(2026, 1, 2), "Dec-29"),
+        (date(2026, 1, 5), "Jan-05"),
+        (date(2026, 1, 11), "Jan-05"),
+    ])
+    def test_week_tab_name(self, service, target, expected):
+        """Any date maps to the tab named after its week's Monday."""
+        assert service.get_week_tab_name(target) == expected
+
+    @pytest.mark.parametrize("target,expected", [
+        (date(2026, 1, 1), "Thu 1st Jan"),
+        (date(2026, 1, 2), "Fri 2nd Jan"),
+        (date(2026, 1, 13), "Tue 13th Jan"),
+        (date(2026, 1, 23), "Fri 23rd Jan"),
+    ])
+    def test_format_display_date(self, service, target, expected):
+        """Display dates carry the right ordinal suffix."""
+        assert service.format_display_date(target) == expected
+
+    def test_format_week_display_reads_clock_once(self, service):
+        """The week display uses a single timestamp for the year guess."""
+        with patch("app.services.sales_service.datetime") as fake_datetime:
+            fake_datetime.now.return_value = datetime(2026, 1, 7)
+            assert service._format_week_display("Jan-26") == "Jan 26 - 30, 2026"
+            assert service._format_week_display("Mar-30") == "Mar 30 - Apr 3, 2026"
+
+        assert fake_datetime.now.call_count == 2
+
+    def test_format_week_display_is_memoized_per_month(self, service):
+        """Repeat lookups in the same month reuse the cached string; a new month recomputes."""
+        _week_display_for.cache_clear()
+        with patch("app.services.sales_service.datetime") as fake_datetime:
+            fake_datetime.now.return_value = datetime(2026, 1, 7)
+            service._format_week_display("Jan-26")
+            service._format_week_display("Jan-26")
+            assert _week_display_for.cache_info().hits == 1
+
+            fake_datetime.now.return_value = datetime(2026, 12, 7)
+            assert service._format_week_display("Jan-26") == "Jan 26 - 30, 2027"
+
+    def test_format_week_display_invalid_tab(self, service):
+        """Unparseable tabs are returned unchanged."""
+        assert service._format_week_display("MASTER") == "MASTER"
+
+
+class TestParseRowToAppointment:
+    """Tests for turning a schedule row into an appointment dict."""
+
+    def test_full_row(self, service):
+        """Every column should land in its field."""
+        row = ["1", "Client", "Google", "Yes", "", "Yes", "Yes", "Price", "", "$5,000",
+               "10:00 AM", "Turf Project", "Perth", "North", "Amy", "Ben", "30", "Paid"]
+
+        appointment = service._parse_row_to_appointment(_pad_row(row), slot=1, row_number=5)
+
+        assert appointment["lead_name"] == "Client"
+        assert appointment["appointment_set"] is True
+        assert appointment["appointment_confirmed"] is False
+        assert appointment["sell_price"] == 5000.0
+        assert appointment["appointment_time"] == "10:00 AM"
+        assert appointment["paid_unpaid"] == "Paid"
+
+    def test_padded_short_row(self, service):
+        """Missing trailing cells and None values read as empty once padded."""
+        appointment = service._parse_row_to_appointment(_pad_row(["2", None, "Facebook"]), slot=2, row_number=6)
+
+        assert appointment["slot"] == 2
+        assert appointment["row_number"] == 6
+        assert appointment["lead_name"] == ""
+        assert appointment["lead_source"] == "Facebook"
+        assert appointment["job_sold"] is False
+        assert appointment["sell_price"] == 0.0
+        assert appointment["paid_unpaid"] == ""
+
+
+class TestExecute:
+    """Tests for running Sheets requests off the event loop."""
+
+    def test_request_runs_outside_event_loop_thread(self, service):
+        """The blocking execute() should run on a worker thread, not the loop's."""
+        threads = {}
+        request = MagicMock()
+        request.execute.side_effect = lambda http: threads.setdefault("execute", threading.get_ident())
+
+        async def run():
+            threads["loop"] = threading.get_ident()
+            return await service._execute(request)
+
+        asyncio.run(run())
+
+        assert threads["execute"] != threads["loop"]
+        request.execute.assert_called_once_with(http=service._client._get_http.return_value)
+
+    def test_concurrent_requests_overlap(self, service):
+        """Gathered requests should block in parallel rather than one after another."""
+        barrier = threading.Barrier(2, timeout=5)
+        request = MagicMock()
+        request.execute.side_effect = lambda http: barrier.wait()
+
+        async def run():
+            await asyncio.gather(service._execute(request), service._execute(request))
+
+        asyncio.run(run())
+
+        assert request.execute.call_count == 2
+
+
+class TestSpreadsheetId:
+    """Tests for resolving the sales spreadsheet ID."""
+
+    def test_configured_id_is_used(self):
+        """The sales spreadsheet setting wins when set."""
+        with patch("app.services.sales_service.settings") as settings:
+            settings.sales_spreadsheet_id = "sales-id"
+            assert SalesService()._get_spreadsheet_id() == "sales-id"
+
+    def test_falls_back_to_env_then_default(self, monkeypatch):
+        """Without a setting, the env var and then the main spreadsheet are used."""
+        with patch("app.services.sales_service.settings") as settings:
+            settings.sales_spreadsheet_id = ""
+            settings.google_spreadsheet_id = "main-id"
+            monkeypatch.delenv("SALES_SPREADSHEET_ID", raising=False)
+            assert SalesService()._get_spreadsheet_id() == "main-id"
+
+            monkeypatch.setenv("SALES_SPREADSHEET_ID", "env-id")
+            assert SalesService()._get_spreadsheet_id() == "env-id"
+
+
+class TestPadRow:
+    """Tests for normalising fetched rows."""
+
+    def test_pads_short_rows(self):
+        """Short rows are extended with empty strings."""
+        assert _pad_row(["1", None], 4) == ["1", "", "", ""]
+
+    def test_trims_long_rows(self):
+        """Cells past the width are dropped."""
+        assert _pad_row(["a", "b", "c"], 2) == ["a", "b"]
+
+    def test_default_width_covers_a_to_r(self):
+        """The default width spans every schedule column."""
+        assert len(_pad_row([])) == 18
+
+
+class TestGetAnnualStats:
+    """Tests for the annual aggregation."""
+
+    def test_reads_uncached_weeks_in_one_batch_get(self, service):
+        """Cached weeks are reused and the rest come from a single batchGet."""
+        service._week_stats_cache["Jan-05"] = (
+            time.monotonic(), service._aggregate_week(make_week_rows({GLEN_MONDAY_ROW: SOLD_ROW}))
+        )
+        batch_get = service._service.spreadsheets().values().batchGet
+        batch_get.return_value.execute.return_value = {"valueRanges": [
+            {"values": make_week_rows({GLEN_MONDAY_ROW: SOLD_ROW})},
+            {},
+        ]}
+
+        with patch.object(service, "get_available_weeks",
+                          AsyncMock(return_value=["Jan-05", "Jan-12", "Jan-19"])):
+            result = asyncio.run(service.get_annual_stats("2026"))
+
+        batch_get.assert_called_once()
+        assert batch_get.call_args.kwargs["ranges"] == [
+            f"'Jan-12'!{WEEK_STATS_RANGE}",
+            f"'Jan-19'!{WEEK_STATS_RANGE}",
+        ]
+        assert result["week_display"] == "Year 2026 (3 weeks)"
+        assert result["totals"]["jobs_sold"] == 2
+        assert result["totals"]["weekly_sales_total"] == 25000.0
+        assert set(service._week_stats_cache) == {"Jan-05", "Jan-12", "Jan-19"}
+
+    def test_cold_weeks_are_aggregated_in_one_worker_call(self, service):
+        """Decoding the fetched weeks should run once, off the event loop."""
+        batch_get = service._service.spreadsheets().values().batchGet
+        batch_get.return_value.execute.return_value = {"valueRanges": [
+            {"values": make_week_rows({GLEN_MONDAY_ROW: SOLD_ROW})},
+            {"values": make_week_rows({GLEN_MONDAY_ROW: SOLD_ROW})},
+        ]}
+        aggregated_on = set()
+        aggregate = service._aggregate_week
+
+        def record_thread(rows):
+            aggregated_on.add(threading.get_ident())
+            return aggregate(rows)
+
+        async def run():
+            with patch.object(service, "_aggregate_week", side_effect=record_thread):
+                stats = await service._get_weeks_stats(["Jan-05", "Jan-12"])
+            return threading.get_ident(), stats
+
+        with patch("app.services.sales_service.asyncio.to_thread",
+                   side_effect=asyncio.to_thread) as to_thread:
+            loop_thread, stats = asyncio.run(run())
+
+        assert to_thread.call_count == 2
+        assert len(aggregated_on) == 1
+        assert loop_thread not in aggregated_on
+        assert [week["totals"]["jobs_sold"] for week in stats] == [1, 1]
+
+    def test_read_failure_reports_error(self, service):
+        """A failed batch read should fail the request rather than report zeros."""
+        service._service.spreadsheets().values().batchGet.return_value.execute.side_effect = \
+            RuntimeError("quota exceeded")
+
+        with patch.object(service, "get_available_weeks", AsyncMock(return_value=["Jan-05"])):
+            result = asyncio.run(service.get_annual_stats("2026"))
+
+        assert result == {"success": False, "error": "quota exceeded"}
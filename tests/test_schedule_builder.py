@@ -0,0 +1,267 @@
+"""
+Tests for ScheduleBuilder and its date helpers.
+
+Tests cover:
+1. Display date and week tab formatting
+2. Schedule assembly over 10 business days
+3. Day name normalization
+4. Grouping deliveries by business day and weekday name
+5. Business day generation
+6. Empty schedule caching
+"""
+from datetime import date, datetime, timedelta, timezone
+import pytest
+from unittest.mock import patch
+
+from app.services.excel.excel_parser import ExcelDeliveryRow
+from app.services.schedule_builder import (
+    EMPTY_SCHEDULE_CACHE_SIZE,
+    ScheduleBuilder,
+    format_display_date,
+    get_next_business_days,
+    get_week_tab_from_date,
+    normalize_day_name,
+)
+
+
+@pytest.fixture
+def builder():
+    """Schedule builder with the default truck capacities."""
+    return ScheduleBuilder()
+
+
+def make_row(day="Monday", slot=1, sqm=100.0, service_type="SL", week_start_date=None, **kwargs):
+    """Build a delivery row with sensible defaults."""
+    return ExcelDeliveryRow(
+        day=day,
+        slot=slot,
+        variety="Sir Walter",
+        suburb="Pimpama",
+        service_type=service_type,
+        sqm_sold=sqm,
+        pallets=kwargs.pop("pallets", 2.0),
+        week_start_date=week_start_date,
+        **kwargs,
+    )
+
+
+class TestDateHelpers:
+    """Tests for the display date and week tab helpers."""
+
+    @pytest.mark.parametrize("d", [date(2026, 1, 5) + timedelta(days=n) for n in range(0, 400, 13)])
+    def test_display_date_matches_strftime(self, d):
+        """The f-string formatting should match the original strftime output."""
+        day = d.day
+        suffix = "th" if 11 <= day <= 13 else {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
+        assert format_display_date(d) == d.strftime(f"%a {day}{suffix} %b")
+
+    def test_display_date_with_known_weekday(self):
+        """A precomputed weekday name is abbreviated rather than recomputed."""
+        assert format_display_date(date(2025, 12, 22), "Monday") == "Mon 22nd Dec"
+
+    @pytest.mark.parametrize("d", [date(2026, 1, 1), date(2026, 3, 4), date(2026, 12, 31)])
+    def test_week_tab_matches_strftime(self, d):
+        """Week tabs are the Monday of the week as 'Mon-DD'."""
+        monday = d - timedelta(days=d.weekday())
+        assert get_week_tab_from_date(d) == monday.strftime("%b-%d")
+
+
+class TestBuildSchedule:
+    """Tests for assembling the 10-day schedule."""
+
+    def test_days_are_labelled(self, builder):
+        """Each business day gets its weekday, display name and week tab."""
+        schedule = builder.build_schedule([], [], start_date=date(2026, 1, 7))
+
+        assert len(schedule.days) == 10
+        first, sixth = schedule.days[0], schedule.days[5]
+        assert (first.day_of_week, first.day_name, first.week_tab) == ("Wednesday", "Wed 7th Jan", "Jan-05")
+        assert sixth.is_week_two
+        assert [d.day_of_week for d in schedule.days[:5]] == [
+            "Wednesday", "Thursday", "Friday", "Monday", "Tuesday",
+        ]
+
+    def test_default_start_is_today_in_australia(self, builder):
+        """Without a start date, the window starts from Brisbane's date at generation time."""
+        now = datetime(2026, 1, 6, 20, 30, tzinfo=timezone.utc)  # 06:30 Wed 7 Jan in Brisbane
+        with patch("app.services.schedule_builder.datetime") as fake_datetime:
+            fake_datetime.now.return_value = now
+            schedule = builder.build_schedule([], [])
+
+        fake_datetime.now.assert_called_once_with(timezone.utc)
+        assert schedule.days[0].date == date(2026, 1, 7)
+        assert schedule.generated_at == now.isoformat()
+
+    def test_deliveries_are_placed_and_totalled(self, builder):
+        """Deliveries land on their date and truck totals are summed."""
+        week = date(2026, 1, 5)
+        truck1 = [
+            make_row(sqm=100.0, delivery_fee=50.0, laying_fee=20.0, week_start_date=week),
+            make_row(slot=2, sqm=50.5, service_type="SD", pallets=1.5, week_start_date=week),
+        ]
+
+        schedule = builder.build_schedule(truck1, [], start_date=week)
+
+        monday = schedule.days[0].truck1
+        assert [d.slot for d in monday.deliveries] == [1, 2]
+        assert monday.sqm_total == 150.5
+        assert monday.pallet_total == 3.5
+        assert monday.laying_cost_total == 220.0
+        assert monday.delivery_fee_total == 50.0
+        assert monday.laying_fee_total == 20.0
+        assert monday.available_sqm == monday.capacity - 150.5
+        assert schedule.days[1].truck1.deliveries == []
+
+    def test_empty_truck_totals_are_zero(self, builder):
+        """A truck with no deliveries reports zero totals and full capacity."""
+        truck = builder._build_truck_data([], 500, "TRUCK 1")
+
+        assert (truck.sqm_total, truck.pallet_total, truck.laying_cost_total,
+                truck.delivery_fee_total, truck.laying_fee_total) == (0, 0, 0, 0, 0)
+        assert truck.available_sqm == 500
+
+    def test_day_name_fallback_uses_week_two(self, builder):
+        """Rows without a week start fall back to day names, honouring W2."""
+        rows = [make_row(day="Monday"), make_row(day="Mon W2", slot=2)]
+
+        schedule = builder.build_schedule(rows, [], start_date=date(2026, 1, 5))
+
+        assert [d.slot for d in schedule.days[0].truck1.deliveries] == [1]
+        assert [d.slot for d in schedule.days[5].truck1.deliveries] == [2]
+
+
+class TestNormalizeDayName:
+    """Tests for mapping Excel day cells to a weekday and week number."""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("Monday", ("Monday", 1)),
+        ("monday", ("Monday", 1)),
+        ("THU", ("Thursday", 1)),
+        ("Tuesday PM", ("Tuesday", 1)),
+        ("Mon W2", ("Monday", 2)),
+        ("Friday  w2", ("Friday", 2)),
+        (" Tue week 2", ("Tuesday", 2)),
+        ("wed week2", ("Wednesday", 2)),
+        ("W2 Mon", ("Monday", 2)),
+        ("Xyz W2", ("Xyz", 2)),
+        ("", ("", 1)),
+    ])
+    def test_normalizes(self, value, expected):
+        """Short forms, casing and week 2 markers are all recognised."""
+        assert normalize_day_name(value) == expected
+
+
+class TestGroupDeliveriesByDate:
+    """Tests for bucketing deliveries into business days."""
+
+    def test_every_day_has_a_bucket_and_out_of_window_rows_are_dropped(self, builder):
+        """Dated rows land on their day; rows outside the window are skipped."""
+        days = [date(2026, 1, 7), date(2026, 1, 8)]
+        in_window = make_row(day="Thursday", week_start_date=date(2026, 1, 5))
+        too_late = make_row(day="Monday", week_start_date=date(2026, 1, 12))
+
+        grouped = builder._group_deliveries_by_date([in_window, too_late], days)
+
+        assert grouped == {date(2026, 1, 7): [], date(2026, 1, 8): [in_window]}
+
+    def test_week_two_without_second_occurrence_uses_first(self, builder):
+        """A W2 row falls back to the only matching weekday in the window."""
+        days = [date(2026, 1, 7), date(2026, 1, 8)]
+        row = make_row(day="Wed W2")
+
+        grouped = builder._group_deliveries_by_date([row], days)
+
+        assert grouped[date(2026, 1, 7)] == [row]
+
+    def test_unknown_day_is_dropped(self, builder):
+        """Rows whose day can't be matched are not placed anywhere."""
+        grouped = builder._group_deliveries_by_date([make_row(day="Someday")], [date(2026, 1, 7)])
+
+        assert grouped == {date(2026, 1, 7): []}
+
+
+class TestScheduleBuilderLayout:
+    """Tests for the builder's instance layout."""
+
+    def test_no_instance_dict(self, builder):
+        """Only the declared slots can be set on the builder."""
+        with pytest.raises(AttributeError):
+            builder.truck3_capacity = 100
+
+    def test_helpers_do_not_need_an_instance(self):
+        """Grouping and truck totals can be called on the class directly."""
+        grouped = ScheduleBuilder._group_deliveries_by_date([], [date(2026, 1, 5)])
+        truck = ScheduleBuilder._build_truck_data([], 500, "TRUCK 1")
+
+        assert grouped == {date(2026, 1, 5): []}
+        assert truck.available_sqm == 500
+
+
+class TestCreateDateToDayMap:
+    """Tests for mapping weekday names to dates."""
+
+    def test_first_occurrence_wins(self, builder):
+        """Week 1 dates take priority over the same weekday in week 2."""
+        days = get_next_business_days(date(2026, 1, 7), 10)
+
+        day_map = builder._create_date_to_day_map(days)
+
+        assert day_map == {
+            "Wednesday": date(2026, 1, 7),
+            "Thursday": date(2026, 1, 8),
+            "Friday": date(2026, 1, 9),
+            "Monday": date(2026, 1, 12),
+            "Tuesday": date(2026, 1, 13),
+        }
+
+
+class TestGetNextBusinessDays:
+    """Tests for generating the Mon-Fri window."""
+
+    @pytest.mark.parametrize("start", [date(2026, 1, 1) + timedelta(days=n) for n in range(14)])
+    @pytest.mark.parametrize("count", [0, 1, 4, 10, 13])
+    def test_matches_day_by_day_walk(self, start, count):
+        """The closed-form dates match stepping through the calendar one day at a time."""
+        expected, current = [], start
+        while len(expected) < count:
+            if current.weekday() < 5:
+                expected.append(current)
+            current += timedelta(days=1)
+
+        assert get_next_business_days(start, count) == expected
+
+
+class TestBuildEmptySchedule:
+    """Tests for the cached all-zero fallback schedule."""
+
+    def test_repeat_calls_reuse_days_with_fresh_timestamp(self, builder):
+        """The days are built once per start date; generated_at is restamped."""
+        start = date(2026, 1, 5)
+        first = builder.build_empty_schedule(start)
+
+        with patch.object(ScheduleBuilder, "build_schedule") as build_schedule:
+            second = builder.build_empty_schedule(start)
+
+        build_schedule.assert_not_called()
+        assert second.days is first.days
+        assert second.generated_at >= first.generated_at
+        assert second.model_dump(exclude={"generated_at"}) == \
+            builder.build_schedule([], [], start).model_dump(exclude={"generated_at"})
+
+    def test_cache_is_bounded(self, builder):
+        """Only the most recent start dates are kept."""
+        starts = [date(2026, 1, 5) + timedelta(weeks=n) for n in range(EMPTY_SCHEDULE_CACHE_SIZE + 1)]
+        for start in starts:
+            builder.build_empty_schedule(start)
+
+        assert [key[0] for key in builder._empty_schedules] == starts[1:]
+
+    def test_capacity_change_rebuilds(self, builder):
+        """A different truck capacity does not reuse a stale schedule."""
+        start = date(2026, 1, 5)
+        builder.build_empty_schedule(start)
+        builder.truck1_capacity += 100
+
+        schedule = builder.build_empty_schedule(start)
+
+        assert schedule.days[0].truck1.capacity == builder.truck1_capacity
@@ -0,0 +1,53 @@
+"""
+Tests for GoogleSheetsClient transport handling.
+
+Tests cover:
+1. Per-thread reuse of the authorized HTTP transport
+2. Transport reset on re-authentication
+"""
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.services.google.sheets_client import GoogleSheetsClient
+
+
+@pytest.fixture
+def client():
+    """Sheets client with service construction stubbed out."""
+    sheets_client = GoogleSheetsClient()
+    sheets_client._credentials = MagicMock()
+    sheets_client._service = MagicMock()
+    return sheets_client
+
+
+class TestGetHttp:
+    """Tests for the thread-local authorized transport."""
+
+    def test_same_thread_reuses_transport(self, client):
+        """Repeat requests from one thread share a transport and its open connection."""
+        with patch("app.services.google.sheets_client.httplib2.Http") as http_cls:
+            first = client._get_http()
+            second = client._get_http()
+
+        assert first is second
+        http_cls.assert_called_once()
+
+    def test_each_thread_gets_its_own_transport(self, client):
+        """httplib2 is not thread-safe, so worker threads must not share a transport."""
+        transports = []
+        worker = threading.Thread(target=lambda: transports.append(client._get_http()))
+        worker.start()
+        worker.join()
+
+        assert client._get_http() is not transports[0]
+
+    def test_reset_drops_transports(self, client):
+        """Re-authenticating should not reuse transports bound to old credentials."""
+        with patch.object(client, "_ensure_service"):
+            before = client._get_http()
+            client.reset_service()
+            client._credentials = MagicMock()
+            after = client._get_http()
+
+        assert before is not after
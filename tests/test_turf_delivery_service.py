@@ -0,0 +1,260 @@
+"""
+Tests for TurfDeliveryService.
+
+Tests cover:
+1. Available week tab caching
+2. Delivery creation writes
+3. Slot occupancy checks
+4. Thread offload of Sheets requests
+5. Currency and number parsing
+6. Slot row number lookup
+"""
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.turf_delivery_service import (
+    AVAILABLE_WEEKS_TTL_SECONDS,
+    TurfDeliveryService,
+)
+
+
+@pytest.fixture
+def service():
+    """Turf delivery service backed by a mocked Sheets API resource."""
+    svc = TurfDeliveryService()
+    svc._client = MagicMock()
+    svc._service = MagicMock()
+    svc._spreadsheet_id = "sheet-id"
+    return svc
+
+
+def sheet_metadata(*titles):
+    """Spreadsheet metadata listing the given tab titles."""
+    return {"sheets": [{"properties": {"title": title}} for title in titles]}
+
+
+class TestGetAvailableWeeks:
+    """Tests for the week tab list."""
+
+    def test_filters_and_sorts_week_tabs(self, service):
+        """Only 'Mon-DD' tabs are returned."""
+        service._service.spreadsheets().get.return_value.execute.return_value = \
+            sheet_metadata("Jan-12", "MASTER", "Jan-05", "jan-19", "Jan-5", "Jan-123", "Foo-05", "Feb-0x")
+
+        assert asyncio.run(service.get_available_weeks()) == ["Jan-05", "Jan-12"]
+
+    def test_repeat_calls_use_cache(self, service):
+        """Edits within the TTL should not re-read the spreadsheet metadata."""
+        get = service._service.spreadsheets().get
+        get.return_value.execute.return_value = sheet_metadata("Jan-05")
+
+        async def run():
+            await service.get_available_weeks()
+            return await service.get_available_weeks()
+
+        assert asyncio.run(run()) == ["Jan-05"]
+        get.return_value.execute.assert_called_once()
+
+    def test_cache_expires(self, service):
+        """The tab list should be re-read once the TTL has passed."""
+        execute = service._service.spreadsheets().get.return_value.execute
+        execute.return_value = sheet_metadata("Jan-05")
+        asyncio.run(service.get_available_weeks())
+
+        fetched_at = service._weeks_cache[0]
+        with patch("app.services.turf_delivery_service.time.monotonic",
+                   return_value=fetched_at + AVAILABLE_WEEKS_TTL_SECONDS + 1):
+            asyncio.run(service.get_available_weeks())
+
+        assert execute.call_count == 2
+
+    def test_failed_write_invalidates_cache(self, service):
+        """A failed write drops the cached tabs in case the tab was renamed or removed."""
+        service._service.spreadsheets().get.return_value.execute.return_value = sheet_metadata("Jan-05")
+        service._service.spreadsheets().values().update.return_value.execute.side_effect = \
+            RuntimeError("Unable to parse range")
+
+        result = asyncio.run(service.update_delivery_field("Jan-05", 5, "B", "Sir Walter"))
+
+        assert not result["success"]
+        assert service._weeks_cache is None
+
+    def test_new_tab_missing_from_cache_is_found(self, service):
+        """A tab created since the list was cached is found by re-reading the list."""
+        service._weeks_cache = (time.monotonic(), ["Jan-05"])
+        service._service.spreadsheets().get.return_value.execute.return_value = \
+            sheet_metadata("Jan-05", "Jan-12")
+
+        result = asyncio.run(service.update_delivery_field("Jan-12", 5, "B", "Sir Walter"))
+
+        assert result["success"]
+        assert service._weeks_cache[1] == ["Jan-05", "Jan-12"]
+
+    def test_missing_tab_is_rejected_after_one_reread(self, service):
+        """A tab absent from a fresh list is reported as not found."""
+        service._weeks_cache = (time.monotonic(), ["Jan-05"])
+        execute = service._service.spreadsheets().get.return_value.execute
+        execute.return_value = sheet_metadata("Jan-05")
+
+        result = asyncio.run(service.update_delivery_field("Jan-12", 5, "B", "Sir Walter"))
+
+        assert result["error_code"] == 404
+        execute.assert_called_once()
+
+
+class TestCreateDelivery:
+    """Tests for writing a new delivery into a slot."""
+
+    @pytest.fixture(autouse=True)
+    def week_exists(self, service):
+        """The target week tab exists and the slot is empty."""
+        service._weeks_cache = None
+        service._service.spreadsheets().get.return_value.execute.return_value = sheet_metadata("Jan-05")
+        service._service.spreadsheets().values().get.return_value.execute.return_value = {}
+
+    def test_row_and_fees_written_in_one_request(self, service):
+        """The A-E cells and the I-J fees should go out in a single batchUpdate."""
+        result = asyncio.run(service.create_delivery(
+            "Jan-05", "Monday", "TRUCK 1", 1,
+            variety="Sir Walter", suburb="Pimpama", service_type="SL", sqm_sold="100",
+            delivery_fee="50",
+        ))
+
+        values = service._service.spreadsheets().values()
+        values.update.assert_not_called()
+        values.batchUpdate.assert_called_once()
+        body = values.batchUpdate.call_args.kwargs["body"]
+        assert body["valueInputOption"] == "USER_ENTERED"
+        assert body["data"] == [
+            {"range": "'Jan-05'!A5:E5", "values": [["1", "Sir Walter", "Pimpama", "SL", "100"]]},
+            {"range": "'Jan-05'!I5:J5", "values": [["50", ""]]},
+        ]
+        assert result["success"]
+        assert result["row_number"] == 5
+
+    def test_fee_formulas_untouched_without_fees(self, service):
+        """Without fees, columns I-J keep their formulas."""
+        asyncio.run(service.create_delivery("Jan-05", "Monday", "TRUCK 2", 2, variety="Sir Walter"))
+
+        body = service._service.spreadsheets().values().batchUpdate.call_args.kwargs["body"]
+        assert [entry["range"] for entry in body["data"]] == ["'Jan-05'!A16:E16"]
+
+    def test_occupied_slot_is_rejected(self, service):
+        """A slot with a variety already set should not be overwritten."""
+        service._service.spreadsheets().values().get.return_value.execute.return_value = \
+            {"values": [["Monday"], [], [], ["Variety"], ["Empire Zoysia"]]}
+
+        result = asyncio.run(service.create_delivery("Jan-05", "Monday", "TRUCK 1", 1, variety="Sir Walter"))
+
+        assert result["error_code"] == 409
+        service._service.spreadsheets().values().batchUpdate.assert_not_called()
+
+
+class TestSlotOccupancy:
+    """Tests for the column B read used for occupancy checks."""
+
+    def test_one_read_covers_every_slot(self, service):
+        """Each check reads column B down to Friday's last TRUCK 2 slot."""
+        get = service._service.spreadsheets().values().get
+        get.return_value.execute.return_value = {"values": [[]] * 4 + [["Sir Walter"]]}
+
+        assert asyncio.run(service._is_slot_occupied("Jan-05", 5))
+        assert not asyncio.run(service._is_slot_occupied("Jan-05", 112))
+        get.assert_called_with(spreadsheetId="sheet-id", range="'Jan-05'!B1:B112")
+
+    def test_every_check_reads_fresh(self, service):
+        """A slot filled elsewhere since the last check should be seen immediately."""
+        execute = service._service.spreadsheets().values().get.return_value.execute
+        execute.return_value = {}
+        assert not asyncio.run(service._is_slot_occupied("Jan-05", 5))
+
+        execute.return_value = {"values": [[]] * 4 + [["Sir Walter"]]}
+        assert asyncio.run(service._is_slot_occupied("Jan-05", 5))
+        assert execute.call_count == 2
+
+    def test_write_clears_schedule_cache(self, service):
+        """A successful write clears the dashboard's cached schedule."""
+        service._weeks_cache = (time.monotonic(), ["Jan-05"])
+
+        with patch("app.services.google_sheets_service.google_sheets_service") as gss:
+            gss.clear_cache = AsyncMock()
+            result = asyncio.run(service.update_delivery_field("Jan-05", 5, "B", "Sir Walter"))
+
+        assert result["success"]
+        gss.clear_cache.assert_awaited_once_with()
+
+
+class TestExecute:
+    """Tests for running Sheets requests off the event loop."""
+
+    def test_requests_run_in_worker_thread(self, service):
+        """Mutations execute their Sheets calls off the loop with the thread's transport."""
+        threads = {}
+        service._weeks_cache = (time.monotonic(), ["Jan-05"])
+        execute = service._service.spreadsheets().values().update.return_value.execute
+        execute.side_effect = lambda http: threads.setdefault("execute", threading.get_ident()) and {}
+
+        async def run():
+            threads["loop"] = threading.get_ident()
+            return await service.update_delivery_field("Jan-05", 5, "B", "Sir Walter")
+
+        result = asyncio.run(run())
+
+        assert result["success"]
+        assert threads["execute"] != threads["loop"]
+        execute.assert_called_once_with(http=service._client._get_http.return_value)
+
+
+class TestParseCurrency:
+    """Tests for parsing currency and number cells."""
+
+    @pytest.mark.parametrize("value, expected", [
+        (None, 0.0),
+        ("", 0.0),
+        (42, 42.0),
+        (12.5, 12.5),
+        ("$1,234.50", 1234.5),
+        (" 100 ", 100.0),
+        ("$", 0.0),
+        ("n/a", 0.0),
+        (["100"], 0.0),
+    ])
+    def test_parses(self, service, value, expected):
+        """Numbers pass straight through and strings lose '$' and ','."""
+        assert service.parse_currency(value) == expected
+
+    def test_row_numbers_are_not_stringified(self, service):
+        """Numeric sqm and pallet cells are parsed without a round trip through str()."""
+        row = ["1", "Sir Walter", "Pimpama", "SL", 100, "$2.5"]
+
+        delivery = service._parse_row_to_delivery(row, 1, 5)
+
+        assert (delivery["sqm_sold"], delivery["pallets"]) == (100.0, 2.5)
+
+
+class TestCalculateRowNumber:
+    """Tests for the precomputed slot row numbers."""
+
+    @pytest.mark.parametrize("day, truck, slot, expected", [
+        ("Monday", "TRUCK 1", 1, 5),
+        ("Monday", "TRUCK 2", 2, 16),
+        ("Wednesday", "TRUCK 1", 6, 56),
+        ("Friday", "TRUCK 2", 6, 112),
+    ])
+    def test_known_rows(self, service, day, truck, slot, expected):
+        """Rows follow the 23-row day sections of the weekly sheet."""
+        assert service.calculate_row_number(day, truck, slot) == expected
+
+    def test_table_covers_every_slot(self, service):
+        """Every day, truck and slot has its own row."""
+        rows = service.ROW_NUMBERS
+        assert len(rows) == len(service.DAYS) * len(service.TRUCKS) * service.SLOTS_PER_TRUCK
+        assert len(set(rows.values())) == len(rows)
+
+    def test_invalid_slot_raises(self, service):
+        """Slots outside 1-6 are not in the table."""
+        with pytest.raises(KeyError):
+            service.calculate_row_number("Monday", "TRUCK 1", 7)